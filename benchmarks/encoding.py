@@ -0,0 +1,77 @@
+"""
+Compare the output message encoders on representative result sizes.
+
+    ./dev.py bench-encoding
+
+NumPy results are included when NumPy is installed, and the `orjson`
+encoder when `orjson` is installed.
+"""
+
+import datetime
+import random
+import timeit
+import typing as t
+from werkit.compute import Encoder, MissouriEncoder, StandardEncoder
+from werkit.compute._serialization import serialize_result
+
+
+def encoders() -> list[Encoder]:
+    result: list[Encoder] = [MissouriEncoder(), StandardEncoder()]
+    try:
+        from werkit.compute import OrjsonEncoder
+
+        result.append(OrjsonEncoder())
+    except ImportError:
+        pass
+    return result
+
+
+def output_message(result: t.Any) -> t.Any:
+    return serialize_result(
+        message_key={"id": 1},
+        serializable_result=result,
+        start_time=datetime.datetime.now(),
+        duration_seconds=0.25,
+        runtime_info={"version": "1.0.0"},
+    )
+
+
+def results() -> list[tuple[str, t.Any]]:
+    generator = random.Random(0)
+    examples: list[tuple[str, t.Any]] = [
+        ("small object", {"someString": "hello", "someNumber": 3.14}),
+        ("10k floats", [generator.random() for _ in range(10_000)]),
+        (
+            "10k x 3 vertices",
+            [[generator.random() for _ in range(3)] for _ in range(10_000)],
+        ),
+    ]
+    try:
+        import numpy as np
+
+        examples.append(
+            ("numpy 100k x 3 float64", np.random.default_rng(0).random((100_000, 3)))
+        )
+    except ImportError:
+        pass
+    return examples
+
+
+def main() -> None:
+    print(f"{'result':<26}{'encoder':<12}{'size (bytes)':>14}{'ms per call':>14}")
+    for description, result in results():
+        message = output_message(result)
+        for encoder in encoders():
+            try:
+                size = len(encoder.encode(message))
+            except (TypeError, ValueError):
+                continue
+            number, total = timeit.Timer(lambda: encoder.encode(message)).autorange()
+            print(
+                f"{description:<26}{encoder.name:<12}{size:>14}"
+                + f"{total / number * 1000:>14.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
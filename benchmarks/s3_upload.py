@@ -0,0 +1,70 @@
+"""
+Compare `temp_file_on_s3()` upload throughput across part sizes and
+concurrency.
+
+    WERKIT_BENCH_S3_BUCKET=my-bucket ./dev.py bench-s3-upload
+
+To run against a local S3 stand-in, such as MinIO or `moto_server`, rather
+than AWS, set `WERKIT_BENCH_S3_ENDPOINT_URL`, e.g. `http://localhost:9000`.
+Set `WERKIT_BENCH_S3_SIZE_MB` to change the size of the uploaded file, which
+defaults to 256 MB.
+"""
+
+import os
+import tempfile
+import time
+import typing as t
+from werkit.s3 import large_file_transfer_config, temp_file_on_s3
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from mypy_boto3_s3.client import S3Client
+
+CHUNK_SIZES_MB = [8, 16, 32, 64]
+CONCURRENCIES = [4, 10, 16, 32]
+
+
+def s3_client() -> "S3Client":
+    import boto3
+    from botocore.config import Config
+
+    return boto3.client(
+        "s3",
+        endpoint_url=os.environ.get("WERKIT_BENCH_S3_ENDPOINT_URL"),
+        # Leave room for the largest concurrency.
+        config=Config(max_pool_connections=max(CONCURRENCIES)),
+    )
+
+
+def main() -> None:
+    bucket = os.environ["WERKIT_BENCH_S3_BUCKET"]
+    size_mb = int(os.environ.get("WERKIT_BENCH_S3_SIZE_MB", "256"))
+    client = s3_client()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "bench.bin")
+        with open(path, "wb") as f:
+            for _ in range(size_mb):
+                f.write(os.urandom(2**20))
+
+        print(f"{'chunk (MB)':>12}{'concurrency':>13}{'seconds':>10}{'MB/s':>10}")
+        for chunk_size_mb in CHUNK_SIZES_MB:
+            for max_concurrency in CONCURRENCIES:
+                transfer_config = large_file_transfer_config(
+                    chunk_size_mb=chunk_size_mb, max_concurrency=max_concurrency
+                )
+                start = time.monotonic()
+                with temp_file_on_s3(
+                    local_path=path,
+                    bucket=bucket,
+                    s3_client=client,
+                    transfer_config=transfer_config,
+                ):
+                    duration = time.monotonic() - start
+                print(
+                    f"{chunk_size_mb:>12}{max_concurrency:>13}{duration:>10.2f}"
+                    + f"{size_mb / duration:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
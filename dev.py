@@ -13,6 +13,7 @@ def python_source_files():
 
     return (
         glob.glob("*.py")
+        + glob.glob("benchmarks/*.py")
         + glob.glob("werkit/*.py")
         + glob.glob("werkit/**/*.py")
         + glob.glob("werkit/**/**/*.py")
@@ -91,6 +92,16 @@ def black_check():
     sh.black("--check", *python_source_files(), _fg=True)
 
 
+@cli.command()
+def bench_encoding():
+    sh.python3("benchmarks/encoding.py", _fg=True)
+
+
+@cli.command()
+def bench_s3_upload():
+    sh.python3("benchmarks/s3_upload.py", _fg=True)
+
+
 @cli.command()
 def publish():
     sh.rm("-rf", "dist/", _fg=True)
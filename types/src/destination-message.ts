@@ -2,3 +2,20 @@ export interface DestinationMessage<PayloadType> {
   taskIdentifier: string
   payload: PayloadType
 }
+
+export interface BatchDestinationMessage<PayloadType> {
+  taskIdentifier: string
+  payloads: PayloadType[]
+}
+
+export interface ClaimCheck {
+  bucket: string
+  key: string
+  compression: 'none' | 'gzip' | 'zstd'
+  size_bytes: number
+}
+
+export interface ClaimCheckMessage<MessageKeyType> {
+  message_key: MessageKeyType
+  claim_check: ClaimCheck
+}
@@ -2,10 +2,15 @@ export type WerkitInputMessage<InputType, MessageKeyType> = {
   message_key: MessageKeyType
 } & InputType
 
+export interface WerkitTimings {
+  [phase: string]: number
+}
+
 export interface WerkitComputeMeta {
   start_time: string
   duration_seconds: number
   runtime_info?: any
+  timings?: WerkitTimings
 }
 
 export interface WerkitSuccessOutputMessage<
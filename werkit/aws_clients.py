@@ -0,0 +1,113 @@
+"""
+A process-wide cache of boto3 clients.
+
+Creating a client resolves endpoints and credentials, which can take hundreds
+of milliseconds, so werkit's S3, Lambda deploy, and destination helpers share
+clients created here. Clients are cached by service, region, and botocore
+config, and are safe to share across threads once created.
+
+To substitute a client, e.g. a stub in tests, use `override_client()`:
+
+    with override_client("s3", stub_client):
+        ...
+"""
+
+import json
+import threading
+import typing as t
+from contextlib import contextmanager
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from botocore.config import Config
+    from mypy_boto3_lambda.client import LambdaClient
+    from mypy_boto3_s3.client import S3Client
+
+_lock = threading.Lock()
+# Keyed by `(service, region name, config key)`.
+_clients: dict[tuple[str, t.Optional[str], t.Optional[str]], t.Any] = {}
+# Keyed by service. These take precedence over cached clients.
+_overrides: dict[str, t.Any] = {}
+
+
+def _config_key(config: t.Optional["Config"]) -> t.Optional[str]:
+    """
+    Configs with the same options share a key, even when they are different
+    objects.
+    """
+    if config is None:
+        return None
+    return json.dumps(
+        getattr(config, "_user_provided_options", {}), sort_keys=True, default=repr
+    )
+
+
+@t.overload
+def get_client(  # noqa: E704
+    service: t.Literal["s3"],
+    region_name: t.Optional[str] = None,
+    config: t.Optional["Config"] = None,
+) -> "S3Client": ...
+
+
+@t.overload
+def get_client(  # noqa: E704
+    service: t.Literal["lambda"],
+    region_name: t.Optional[str] = None,
+    config: t.Optional["Config"] = None,
+) -> "LambdaClient": ...
+
+
+def get_client(
+    service: t.Literal["s3", "lambda"],
+    region_name: t.Optional[str] = None,
+    config: t.Optional["Config"] = None,
+) -> t.Any:
+    """
+    Return a shared client for the given service, region, and botocore
+    config, creating it on first use. When `region_name` is `None`, the
+    region is resolved by boto3 as usual.
+    """
+    import boto3
+
+    cache_key = (service, region_name, _config_key(config))
+    with _lock:
+        try:
+            return _overrides[service]
+        except KeyError:
+            pass
+        try:
+            return _clients[cache_key]
+        except KeyError:
+            # Creating clients from the default session isn't thread-safe, so
+            # this happens under the lock.
+            client = _clients[cache_key] = boto3.client(
+                service, region_name=region_name, config=config
+            )
+            return client
+
+
+@contextmanager
+def override_client(service: str, client: t.Any) -> t.Iterator[None]:
+    """
+    Within the block, return the given client for the service, regardless
+    of region and config.
+    """
+    with _lock:
+        previous = _overrides.get(service, None)
+        _overrides[service] = client
+    try:
+        yield
+    finally:
+        with _lock:
+            if previous is None:
+                del _overrides[service]
+            else:
+                _overrides[service] = previous
+
+
+def clear_client_cache() -> None:
+    """
+    Discard the cached clients, e.g. after credentials change.
+    """
+    with _lock:
+        _clients.clear()
@@ -1,10 +1,11 @@
 import os
 import sys
 import typing as t
-import boto3
-from ..s3 import temp_file_on_s3
+from ..aws_clients import get_client
+from ..s3 import large_file_transfer_config, temp_file_on_s3
 
 if t.TYPE_CHECKING:
+    from mypy_boto3_lambda.client import LambdaClient
     from mypy_boto3_lambda.literals import RuntimeType
     from mypy_boto3_lambda.type_defs import FunctionCodeTypeDef
     from mypy_boto3_s3.literals import RegionName
@@ -59,7 +60,10 @@ def _create_or_update(
                 then s3_code_bucket is required
                 """)
         with temp_file_on_s3(
-            local_path=local_path_to_zipfile, bucket=s3_code_bucket, verbose=verbose
+            local_path=local_path_to_zipfile,
+            bucket=s3_code_bucket,
+            verbose=verbose,
+            transfer_config=large_file_transfer_config(),
         ) as temp_key:
             create_or_update_fn({"S3Bucket": s3_code_bucket, "S3Key": temp_key})
             pif(message)
@@ -87,13 +91,22 @@ def perform_create(
     force_upload_to_s3_code_bucket: bool = False,
     wait_until_active: bool = True,
     wait_until_active_timeout_seconds: int = 30,
+    lambda_client: t.Optional["LambdaClient"] = None,
 ) -> None:
+    """
+    Create a Lambda function. By default the shared client for the region
+    from `werkit.aws_clients` is used.
+    """
     if bool(local_path_to_zipfile) == bool(s3_path_to_zipfile):
         raise ValueError(
             "Either `local_path_to_zipfile` or `s3_path_to_zipfile` must be provided (and not both)"
         )
 
-    client = boto3.client("lambda", region_name=aws_region)
+    client = (
+        get_client("lambda", region_name=aws_region)
+        if lambda_client is None
+        else lambda_client
+    )
 
     def create(code_arguments: "FunctionCodeTypeDef") -> None:
         extra_options = {}
@@ -142,13 +155,22 @@ def perform_update_code(
     force_upload_to_s3_code_bucket: bool = False,
     wait_until_updated: bool = True,
     wait_until_updated_timeout_seconds: int = 30,
+    lambda_client: t.Optional["LambdaClient"] = None,
 ) -> None:
+    """
+    Update a Lambda function's code. By default the shared client for the
+    region from `werkit.aws_clients` is used.
+    """
     if bool(local_path_to_zipfile) == bool(s3_path_to_zipfile):
         raise ValueError(
             "Either `local_path_to_zipfile` or `s3_path_to_zipfile` must be provided (and not both)"
         )
 
-    client = boto3.client("lambda", region_name=aws_region)
+    client = (
+        get_client("lambda", region_name=aws_region)
+        if lambda_client is None
+        else lambda_client
+    )
 
     def update(code_arguments: "FunctionCodeTypeDef") -> None:
         client.update_function_code(FunctionName=function_name, **code_arguments)
@@ -10,7 +10,21 @@ the result to a queue (or any other destination, such at S3).
 [1schema]: https://github.com/metabolize/1schema/
 """
 
-from ._destination import Destination  # noqa: F401
+from ._destination import AsyncDestination, Destination  # noqa: F401
+from ._encoding import (  # noqa: F401
+    Encoder,
+    EncoderName,
+    MissouriEncoder,
+    OrjsonEncoder,
+    StandardEncoder,
+    default_encoder,
+    get_encoder,
+)
+from ._hooks import (  # noqa: F401
+    InMemoryMetricsCollector,
+    ManagerHooks,
+    default_key_prefix,
+)
 from ._manager import Manager  # noqa: F401
 from ._schema import Schema  # noqa: F401
 from ._synthetic_error import SyntheticError  # noqa: F401
@@ -20,4 +34,6 @@ from ._types import (  # noqa: F401
     WerkitErrorOutputMessage,
     WerkitOutputMessage,
     WerkitSuccessOutputMessage,
+    WerkitTimingPhase,
 )
+from ._validation_policy import ValidationPolicy  # noqa: F401
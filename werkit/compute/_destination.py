@@ -1,10 +1,62 @@
 import typing as t
 from abc import ABC, abstractmethod
+from ._encoding import Encoder, EncoderName, get_encoder
 
 
-class Destination(ABC):
+class _Encoding:
+    # An `Encoder` instance or name. `None` means `default_encoder()`.
+    encoder: t.Union[Encoder, EncoderName, None] = None
+
+    def encode(self, value: t.Any) -> bytes:
+        """
+        Encode a payload as JSON using the destination's `encoder`. Subclasses
+        which serialize their payloads should use this, so the encoder can be
+        configured consistently.
+        """
+        if not isinstance(self.encoder, Encoder):
+            self.encoder = get_encoder(self.encoder)
+        return self.encoder.encode(value)
+
+
+class Destination(_Encoding, ABC):
     @abstractmethod
     def send(
         self, message_key: t.Any, output_message: t.Any
     ) -> None:  # pragma: no cover
         pass
+
+    def send_batch(self, messages: t.Sequence[tuple[t.Any, t.Any]]) -> None:
+        """
+        Send several output messages, given as `(message_key, output_message)`
+        pairs. Subclasses which can dispatch a batch more efficiently than one
+        message at a time should override this.
+        """
+        for message_key, output_message in messages:
+            self.send(message_key=message_key, output_message=output_message)
+
+
+class AsyncDestination(_Encoding, ABC):
+    """
+    A destination which sends output messages using asyncio. Use it with
+    `Manager.awork()` or `async with manager:`.
+    """
+
+    @abstractmethod
+    async def asend(
+        self, message_key: t.Any, output_message: t.Any
+    ) -> None:  # pragma: no cover
+        pass
+
+    async def asend_batch(self, messages: t.Sequence[tuple[t.Any, t.Any]]) -> None:
+        """
+        Send several output messages, given as `(message_key, output_message)`
+        pairs, concurrently.
+        """
+        import asyncio
+
+        await asyncio.gather(
+            *[
+                self.asend(message_key=message_key, output_message=output_message)
+                for message_key, output_message in messages
+            ]
+        )
@@ -0,0 +1,130 @@
+import os
+import typing as t
+from abc import ABC, abstractmethod
+
+EncoderName = t.Literal["missouri", "standard", "orjson"]
+
+ENCODER_ENV_VAR = "WERKIT_JSON_ENCODER"
+
+
+def _encode_fallback(obj: t.Any) -> t.Any:
+    """
+    Convert objects which the JSON libraries don't support natively: objects
+    implementing `for_json()`, and NumPy arrays and scalars, which are
+    detected without importing NumPy.
+    """
+    if hasattr(obj, "for_json"):
+        return obj.for_json()
+    elif hasattr(obj, "dtype") and hasattr(obj, "tolist"):
+        # Arrays become (nested) lists and scalars become Python numbers.
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class Encoder(ABC):
+    """
+    Encode output messages and destination payloads as JSON.
+    """
+
+    name: t.ClassVar[EncoderName]
+
+    @abstractmethod
+    def encode(self, value: t.Any) -> bytes:  # pragma: no cover
+        pass
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class MissouriEncoder(Encoder):
+    """
+    Encode using `missouri.json`, which is the default. NumPy arrays are
+    encoded as `{"__ndarray__": [...], "dtype": ..., "shape": [...]}` objects
+    which `missouri.json` decodes back into arrays. With
+    `encode_as_primitives=True`, they're encoded as plain lists instead.
+    """
+
+    name = "missouri"
+
+    def __init__(self, encode_as_primitives: bool = False):
+        self.encode_as_primitives = encode_as_primitives
+
+    def encode(self, value: t.Any) -> bytes:
+        from missouri import json
+
+        return json.dumps(value, encode_as_primitives=self.encode_as_primitives).encode(
+            "utf-8"
+        )
+
+
+class StandardEncoder(Encoder):
+    """
+    Encode using the standard library `json` module, without whitespace. NumPy
+    arrays are encoded as plain lists.
+    """
+
+    name = "standard"
+
+    def encode(self, value: t.Any) -> bytes:
+        import json
+
+        return json.dumps(
+            value, separators=(",", ":"), default=_encode_fallback
+        ).encode("utf-8")
+
+
+class OrjsonEncoder(Encoder):
+    """
+    Encode using `orjson`, which must be installed separately. This is much
+    faster than the other encoders, particularly for large results. NumPy
+    arrays are encoded as plain lists, directly from the array's buffer
+    without an intermediate `tolist()` copy. (Arrays which `orjson` can't
+    serialize natively, such as non-contiguous ones, fall back to `tolist()`.)
+
+    Like the other encoders, it converts keys which aren't strings, such as
+    integers, to strings. Unlike them, `orjson` encodes `NaN` and infinity as
+    `null`.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def encode(self, value: t.Any) -> bytes:
+        import orjson
+
+        return orjson.dumps(value, default=_encode_fallback, option=self._option)
+
+
+ENCODERS: dict[EncoderName, t.Type[Encoder]] = {
+    "missouri": MissouriEncoder,
+    "standard": StandardEncoder,
+    "orjson": OrjsonEncoder,
+}
+
+
+def default_encoder() -> Encoder:
+    """
+    The encoder named by `WERKIT_JSON_ENCODER` (`"missouri"`, `"standard"`,
+    or `"orjson"`), or when unset, `MissouriEncoder`.
+    """
+    return get_encoder(t.cast(EncoderName, os.environ.get(ENCODER_ENV_VAR, "missouri")))
+
+
+def get_encoder(encoder: t.Union[Encoder, EncoderName, None] = None) -> Encoder:
+    """
+    Resolve an encoder given by instance or by name. `None` gives the
+    `default_encoder()`.
+    """
+    if encoder is None:
+        return default_encoder()
+    elif isinstance(encoder, Encoder):
+        return encoder
+    try:
+        encoder_class = ENCODERS[encoder]
+    except KeyError:
+        raise ValueError(f"Unknown encoder: {encoder}")
+    return encoder_class()
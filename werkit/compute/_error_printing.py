@@ -0,0 +1,77 @@
+import threading
+import time
+import typing as t
+
+# Shared by every `Manager` in the process, so a storm of identical errors is
+# printed once per window rather than once per message.
+_lock = threading.Lock()
+# Keyed by the formatted error. Values are `[last printed, suppressed count]`.
+_last_printed: dict[str, list[t.Any]] = {}
+# When there are more entries than this, the expired ones are discarded.
+MAX_ENTRIES = 1024
+
+HANDLED_ERROR_NOTICE = (
+    "Error handled by werkit. "
+    + "(To disable, invoke `Manager()` with `handle_exceptions=False`.)"
+)
+
+
+def _suppressed_count_if_due(
+    error: str, dedupe_window_seconds: float
+) -> t.Optional[int]:
+    """
+    Return `None` when the error was printed within the window. Otherwise,
+    return the number of times it was suppressed since it was last printed.
+    """
+    now = time.monotonic()
+    with _lock:
+        entry = _last_printed.get(error)
+        if entry is not None and now - entry[0] < dedupe_window_seconds:
+            entry[1] += 1
+            return None
+
+        if entry is None and len(_last_printed) >= MAX_ENTRIES:
+            for key in [
+                key
+                for key, (last_printed, _) in _last_printed.items()
+                if now - last_printed >= dedupe_window_seconds
+            ]:
+                del _last_printed[key]
+
+        suppressed_count = 0 if entry is None else entry[1]
+        _last_printed[error] = [now, 0]
+        return suppressed_count
+
+
+def print_handled_error(
+    error: t.Sequence[str], dedupe_window_seconds: t.Optional[float] = None
+) -> None:
+    """
+    Print an error which has been handled. With `dedupe_window_seconds`, an
+    error identical to one printed within that many seconds is suppressed,
+    and the number of suppressed copies is reported the next time it's
+    printed.
+    """
+    formatted = "".join(error)
+    if dedupe_window_seconds is None:
+        suppressed_count = 0
+    else:
+        maybe_suppressed_count = _suppressed_count_if_due(
+            formatted, dedupe_window_seconds
+        )
+        if maybe_suppressed_count is None:
+            return
+        suppressed_count = maybe_suppressed_count
+
+    print(HANDLED_ERROR_NOTICE)
+    print(formatted)
+    if suppressed_count:
+        print(
+            f"({suppressed_count} identical errors were suppressed since this "
+            + "error was last printed.)"
+        )
+
+
+def clear_printed_errors() -> None:
+    with _lock:
+        _last_printed.clear()
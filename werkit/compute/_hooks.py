@@ -0,0 +1,144 @@
+import threading
+import typing as t
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from ._manager import Manager
+
+
+class ManagerHooks:
+    """
+    Observe the lifecycle of a `werkit.compute.Manager`, e.g. to emit metrics
+    or tracing spans. Override any of the methods. The defaults do nothing.
+
+    Hooks are invoked synchronously and exceptions they raise propagate. When
+    no hooks are registered, the manager skips invoking them entirely.
+    """
+
+    def on_start(self, manager: "Manager") -> None:
+        """
+        Invoked when the clock starts, before the input message is validated.
+        """
+
+    def on_validated(self, manager: "Manager", target: str) -> None:
+        """
+        Invoked after each successful validation. `target` is one of the
+        entries of `manager.validation_trace`.
+        """
+
+    def on_success(self, manager: "Manager") -> None:
+        """
+        Invoked once the success output message is ready, before it's sent.
+        """
+
+    def on_error(self, manager: "Manager", exception: BaseException) -> None:
+        """
+        Invoked once the error output message is ready, before it's sent. This
+        is invoked whether or not the exception is handled.
+        """
+
+    def on_sent(self, manager: "Manager") -> None:
+        """
+        Invoked after the output message has been sent to the destination.
+        """
+
+
+def default_key_prefix(message_key: t.Any) -> str:
+    """
+    For string message keys, the portion before the first `/`. Other message
+    keys are grouped together under `*`.
+    """
+    if isinstance(message_key, str):
+        return message_key.split("/", 1)[0]
+    else:
+        return "*"
+
+
+def _percentile(sorted_values: list[float], percentile: float) -> float:
+    # Nearest-rank method.
+    import math
+
+    rank = max(math.ceil(percentile / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class InMemoryMetricsCollector(ManagerHooks):
+    """
+    Collect latencies and error origins in memory, grouped by message key
+    prefix. This is intended for local benchmarking.
+
+        collector = InMemoryMetricsCollector()
+        Manager(..., hooks=[collector]).work(...)
+        print(collector.summary())
+
+    Args:
+        key_prefix (callable): Compute the group for a message key. The
+            default is `werkit.compute.default_key_prefix`.
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, key_prefix: t.Callable[[t.Any], str] = default_key_prefix):
+        self.key_prefix = key_prefix
+        self._lock = threading.Lock()
+        self._durations: dict[str, list[float]] = {}
+        self._phases: dict[str, dict[str, list[float]]] = {}
+        self._error_origins: dict[str, dict[str, int]] = {}
+
+    def _record_completion(self, manager: "Manager") -> None:
+        prefix = self.key_prefix(manager.message_key)
+        with self._lock:
+            self._durations.setdefault(prefix, []).append(manager.elapsed_seconds)
+            phases = self._phases.setdefault(prefix, {})
+            for phase, seconds in manager.timings.items():
+                phases.setdefault(phase, []).append(seconds)
+
+    def on_success(self, manager: "Manager") -> None:
+        self._record_completion(manager)
+
+    def on_error(self, manager: "Manager", exception: BaseException) -> None:
+        self._record_completion(manager)
+        assert manager.output_message is not None
+        error_origin = str(manager.output_message["error_origin"])
+        prefix = self.key_prefix(manager.message_key)
+        with self._lock:
+            origins = self._error_origins.setdefault(prefix, {})
+            origins[error_origin] = origins.get(error_origin, 0) + 1
+
+    def on_sent(self, manager: "Manager") -> None:
+        prefix = self.key_prefix(manager.message_key)
+        with self._lock:
+            phases = self._phases.setdefault(prefix, {})
+            phases.setdefault("send", []).append(manager.timings["send"])
+
+    def _summarize(self, values: list[float]) -> dict[str, float]:
+        sorted_values = sorted(values)
+        return {
+            f"p{percentile}": _percentile(sorted_values, percentile)
+            for percentile in self.PERCENTILES
+        }
+
+    def summary(self) -> dict[str, dict[str, t.Any]]:
+        """
+        Return, for each message key prefix, the number of computations, the
+        number of errors by origin, and the p50, p95, and p99 of the total
+        duration and of each phase, in seconds.
+        """
+        with self._lock:
+            return {
+                prefix: {
+                    "count": len(durations),
+                    "error_origins": dict(self._error_origins.get(prefix, {})),
+                    "duration_seconds": self._summarize(durations),
+                    "phases": {
+                        phase: self._summarize(values)
+                        for phase, values in self._phases.get(prefix, {}).items()
+                    },
+                }
+                for prefix, durations in self._durations.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._durations.clear()
+            self._phases.clear()
+            self._error_origins.clear()
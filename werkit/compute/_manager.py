@@ -1,24 +1,49 @@
 import datetime
 import sys
+import time
 import typing as t
+from contextlib import contextmanager
 from types import TracebackType
-from ._destination import Destination
+from typing_extensions import Unpack
+from ._destination import AsyncDestination, Destination
+from ._encoding import Encoder, EncoderName, get_encoder
+from ._error_printing import print_handled_error
 from ._formatting import format_time
+from ._hooks import ManagerHooks
 from ._schema import Schema
-from ._serialization import serialize_exception, serialize_result
+from ._serialization import ErrorFormat, serialize_exception, serialize_result
 from ._types import (
     WerkitErrorOutputMessage,
     WerkitOutputMessage,
     WerkitSuccessOutputMessage,
+    WerkitTimingPhase,
 )
+from ._validation_policy import ValidationPolicy, ValidationTarget
 
 if t.TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor
+    from jsonschema import Draft7Validator
     from typing_extensions import Self
 
 MessageKeyType = t.TypeVar("MessageKeyType")
 ResultType = t.TypeVar("ResultType")
 
 
+class ManagerKwargs(t.TypedDict, total=False):
+    runtime_info: t.Any
+    handle_exceptions: bool
+    verbose: bool
+    time_precision: int
+    validation_policy: ValidationPolicy
+    include_timings: bool
+    hooks: t.Sequence[ManagerHooks]
+    traceback_limit: t.Optional[int]
+    error_format: ErrorFormat
+    print_handled_errors: bool
+    error_dedupe_window_seconds: t.Optional[float]
+    encoder: t.Union[Encoder, EncoderName, None]
+
+
 class Manager(t.Generic[ResultType, MessageKeyType]):
     """
     Wrap a bit of cloud or batch computation, automatically handling and
@@ -41,17 +66,33 @@ class Manager(t.Generic[ResultType, MessageKeyType]):
         timeouts.
     - `start_time` (`str`): The local start time of the computation, in ISO
         8601 with the time zone.
-    - `duration_seconds` (`float`): The time spent in computation.
+    - `duration_seconds` (`float`): The time spent in computation, measured
+        with a monotonic clock.
     - `runtime_info` (`object`): User-provided runtime metadata.
+    - `timings` (`dict`): With `include_timings=True`, the time in seconds
+        spent in each phase which precedes serialization: `input_validation`,
+        `work`, and `result_validation`.
+
+    Regardless, `manager.timings` records the time in seconds spent in each
+    phase, including the later `serialization`, `output_validation`, and
+    `send` phases.
 
     To pass along an already-serialized error output message, wrap it in a
     `werkit.compute.SyntheticError`.
 
+    The input message, the result, and the output message are each validated
+    at most once. When the result has been validated, only the envelope of the
+    output message is validated, so the result is traversed once. Which of
+    them are validated is decided by a `werkit.compute.ValidationPolicy`.
+    `manager.validation_trace` lists the validations performed, in order,
+    which is useful for confirming this in tests.
+
     Args:
         schema (werkit.compute.Schema): A helper object containing the
             request, result, and serialized result schemas.
         destination (werkit.compute.Destination): An optional destination
-            to which the serialized result is dispatched.
+            to which the serialized result is dispatched. This may be a
+            `werkit.compute.AsyncDestination` when using `awork()`.
         handle_exceptions (bool): When `True`, exceptions thrown within the
             block are caught and serialized, as is useful for wrapping cloud
             processes or batch jobs, where you don't want to crash. When
@@ -62,6 +103,29 @@ class Manager(t.Generic[ResultType, MessageKeyType]):
         time_precision (int): The number of decimal places (of seconds) to
             include in the timing result. The default is 2, which rounds to
             the nearest hundredth of a second.
+        validation_policy (werkit.compute.ValidationPolicy): Which messages
+            to validate. Defaults to the schema's policy, if any, and
+            otherwise to `ValidationPolicy.from_environment()`.
+        include_timings (bool): When `True`, include the `timings` breakdown
+            in the output message. The output message schema must allow it.
+        hooks (list): `werkit.compute.ManagerHooks` instances which observe
+            the lifecycle, e.g. to collect metrics.
+        traceback_limit (int): The maximum number of stack frames to include
+            in a serialized error, as in the `traceback` module: a negative
+            limit keeps the innermost frames. The default includes them all.
+        error_format (str): `"traceback"` (the default) to serialize errors
+            as formatted tracebacks, or `"frames"` for a cheaper list of
+            frames which omits source lines.
+        print_handled_errors (bool): When `True`, the default, print handled
+            errors to stdout.
+        error_dedupe_window_seconds (float): When set, a handled error which
+            is identical to one printed in the past this many seconds, by
+            any manager in the process, is not printed again. The count of
+            suppressed errors is printed along with the next copy.
+        encoder (werkit.compute.Encoder): The encoder used by
+            `encode_output_message()`, given as an instance or by name.
+            Defaults to the destination's `encoder`, so the two encode alike,
+            and otherwise to `werkit.compute.default_encoder()`.
 
     Example:
         def work():
@@ -76,24 +140,39 @@ class Manager(t.Generic[ResultType, MessageKeyType]):
             verbose=verbose,
         )
         return manager.work(work, should_send=False, should_return=True)
+
+    In asyncio code, use `awork()` instead, which accepts a coroutine
+    function:
+
+        return await manager.awork(work, should_send=True, should_return=True)
     """
 
     message_key: t.Any
     should_send: t.Optional[bool]
     output_message: t.Optional[WerkitOutputMessage[ResultType, MessageKeyType]]
+    validation_trace: list[str]
+    timings: dict[WerkitTimingPhase, float]
 
     def __init__(
         self,
         input_message: t.Mapping[str, t.Any],
         schema: Schema,
-        destination: t.Optional[Destination] = None,
+        destination: t.Optional[t.Union[Destination, AsyncDestination]] = None,
         runtime_info: t.Any = None,
         handle_exceptions: bool = True,
         verbose: bool = False,
         time_precision: int = 2,
+        validation_policy: t.Optional[ValidationPolicy] = None,
+        include_timings: bool = False,
+        hooks: t.Sequence[ManagerHooks] = (),
+        traceback_limit: t.Optional[int] = None,
+        error_format: ErrorFormat = "traceback",
+        print_handled_errors: bool = True,
+        error_dedupe_window_seconds: t.Optional[float] = None,
+        encoder: t.Union[Encoder, EncoderName, None] = None,
     ):
         # Import late to avoid circular import.
-        from werkit.compute import Destination, Schema
+        from werkit.compute import AsyncDestination, Destination, Schema
 
         if not isinstance(schema, Schema):
             raise ValueError(
@@ -101,9 +180,12 @@ class Manager(t.Generic[ResultType, MessageKeyType]):
             )
         self.schema = schema
 
-        if destination is not None and not isinstance(destination, Destination):
+        if destination is not None and not isinstance(
+            destination, (Destination, AsyncDestination)
+        ):
             raise ValueError(
-                "Expected destination to be an instance of werkit.compute.Destination"
+                "Expected destination to be an instance of werkit.compute.Destination "
+                + "or werkit.compute.AsyncDestination"
             )
         self.destination = destination
 
@@ -111,7 +193,26 @@ class Manager(t.Generic[ResultType, MessageKeyType]):
         self.handle_exceptions = handle_exceptions
         self.verbose = verbose
         self.time_precision = time_precision
+        self.validation_policy = (
+            validation_policy
+            or schema.validation_policy
+            or ValidationPolicy.from_environment()
+        )
+        self._validation_targets = self.validation_policy.targets()
+        self.include_timings = include_timings
+        self.timings = {}
+        self.hooks = list(hooks)
+        self.traceback_limit = traceback_limit
+        self.error_format = error_format
+        self.print_handled_errors = print_handled_errors
+        self.error_dedupe_window_seconds = error_dedupe_window_seconds
+        self.encoder = encoder
         self.input_message = input_message
+        self.output_message = None
+        self.validation_trace = []
+        self._result_is_validated = False
+        self._input_message_is_checked = False
+        self._needs_send = False
         try:
             self.message_key = self.input_message["message_key"]
         except (KeyError, TypeError):
@@ -119,20 +220,96 @@ class Manager(t.Generic[ResultType, MessageKeyType]):
             # message key is for.
             raise ValueError("Input message is missing `message_key` property")
 
+    def _start_clock(self) -> None:
+        self.start_time = datetime.datetime.now()
+        self._start_counter = time.perf_counter()
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """
+        The unrounded time elapsed since the computation started.
+        """
+        return time.perf_counter() - self._start_counter
+
     @property
     def duration_seconds(self) -> float:
-        return round(
-            (datetime.datetime.now() - self.start_time).total_seconds(),
-            self.time_precision,
-        )
+        return round(self.elapsed_seconds, self.time_precision)
 
-    def __enter__(self) -> "Self":
-        self.start_time = datetime.datetime.now()
+    @contextmanager
+    def _timed(self, phase: WerkitTimingPhase) -> t.Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] = time.perf_counter() - start
+
+    def _timings_for_output_message(
+        self,
+    ) -> t.Optional[dict[WerkitTimingPhase, float]]:
+        return dict(self.timings) if self.include_timings else None
+
+    def _validate(
+        self,
+        target: ValidationTarget,
+        validator: "Draft7Validator",
+        value: t.Any,
+        label: t.Optional[str] = None,
+    ) -> bool:
+        """
+        Validate the value when the validation policy calls for it. Return
+        `True` if it was validated.
+        """
+        if target not in self._validation_targets:
+            return False
+        self.validation_trace.append(label or target)
+        validator.validate(value)
+        if self.hooks:
+            for hook in self.hooks:
+                hook.on_validated(self, label or target)
+        return True
+
+    def _validate_input_message(self) -> None:
+        self._start_clock()
+        if self.hooks:
+            for hook in self.hooks:
+                hook.on_start(self)
+        self._input_message_is_checked = True
+        with self._timed("input_validation"):
+            self._validate(
+                "input_message", self.schema.input_message, self.input_message
+            )
+
+    def _begin(self) -> None:
+        """
+        Start the clock and check the input message. When it fails validation
+        and the error is handled, the output message is set.
+        """
         try:
-            self.schema.input_message.validate(self.input_message)
+            self._validate_input_message()
         except:  # noqa: E722
             if not self.__exit__(*sys.exc_info()):
                 raise
+
+    async def _abegin(self) -> None:
+        try:
+            self._validate_input_message()
+        except:  # noqa: E722
+            if not await self.__aexit__(*sys.exc_info()):
+                raise
+
+    def __enter__(self) -> "Self":
+        if self._input_message_is_checked:
+            # The input message was checked up front, e.g. by `work_batch()`.
+            self._start_clock()
+        else:
+            self._begin()
+        return self
+
+    async def __aenter__(self) -> "Self":
+        if self._input_message_is_checked:
+            self._start_clock()
+        else:
+            await self._abegin()
         return self
 
     @property
@@ -141,7 +318,10 @@ class Manager(t.Generic[ResultType, MessageKeyType]):
 
     @result.setter
     def result(self, value: ResultType) -> None:
-        self.schema.output.validate(value)
+        with self._timed("result_validation"):
+            self._result_is_validated = self._validate(
+                "output", self.schema.output, value
+            )
         self._result = value
 
     def serialize_result(
@@ -153,17 +333,29 @@ class Manager(t.Generic[ResultType, MessageKeyType]):
             start_time=self.start_time,
             duration_seconds=self.duration_seconds,
             runtime_info=self.runtime_info,
+            timings=self._timings_for_output_message(),
         )
 
     def _note_compute_success(self, result: ResultType) -> None:
-        self.output_message = self.serialize_result(result)
-        self.schema.output_message.validate(self.output_message)
-        if self.should_send:
-            if self.destination is None:
-                raise ValueError("With `should_send=True`, expected a destination")
-            self.destination.send(
-                message_key=self.message_key, output_message=self.output_message
-            )
+        with self._timed("serialization"):
+            self.output_message = self.serialize_result(result)
+        with self._timed("output_validation"):
+            if self._result_is_validated and self.schema.output_message_envelope:
+                # Since the result has been validated, skip descending into it.
+                self._validate(
+                    "output_message",
+                    self.schema.output_message_envelope,
+                    self.output_message,
+                    label="output_message_envelope",
+                )
+            else:
+                self._validate(
+                    "output_message", self.schema.output_message, self.output_message
+                )
+        if self.hooks:
+            for hook in self.hooks:
+                hook.on_success(self)
+        self._needs_send = bool(self.should_send)
 
     def serialize_exception(
         self, exception: BaseException
@@ -175,35 +367,114 @@ class Manager(t.Generic[ResultType, MessageKeyType]):
             start_time=self.start_time,
             duration_seconds=self.duration_seconds,
             runtime_info=self.runtime_info,
+            timings=self._timings_for_output_message(),
+            traceback_limit=self.traceback_limit,
+            error_format=self.error_format,
         )
 
     def _note_compute_exception(self, exception: BaseException) -> bool:
         """
         Return a value suitable for returning from `__exit__`.
         """
-        self.output_message = self.serialize_exception(exception)
-        self.schema.output_message.validate(self.output_message)
-        if self.handle_exceptions:
-            print(
-                "Error handled by werkit. (To disable, invoke `Manager()` with `handle_exceptions=False`.)"
+        with self._timed("serialization"):
+            self.output_message = self.serialize_exception(exception)
+        with self._timed("output_validation"):
+            self._validate(
+                "output_message", self.schema.output_message, self.output_message
             )
-            print("".join(self.output_message["error"]))
-            if self.should_send:
-                if self.destination is None:
-                    raise ValueError("With `should_send=True`, expected a destination")
-                self.destination.send(
-                    message_key=self.message_key, output_message=self.output_message
+        if self.hooks:
+            for hook in self.hooks:
+                hook.on_error(self, exception)
+        if self.handle_exceptions:
+            if self.print_handled_errors:
+                print_handled_error(
+                    self.output_message["error"],
+                    dedupe_window_seconds=self.error_dedupe_window_seconds,
                 )
+            self._needs_send = bool(self.should_send)
             return True
         else:
             return False
 
+    def encode_output_message(self) -> bytes:
+        """
+        Encode the output message as JSON, e.g. to return it from a handler
+        without re-encoding it elsewhere.
+        """
+        if self.output_message is None:
+            raise ValueError("The output message is not ready")
+        encoder = self.encoder
+        if encoder is None and self.destination is not None:
+            encoder = self.destination.encoder
+        return get_encoder(encoder).encode(self.output_message)
+
+    def _destination_for_send(self) -> t.Union[Destination, AsyncDestination]:
+        self._needs_send = False
+        if self.destination is None:
+            raise ValueError("With `should_send=True`, expected a destination")
+        return self.destination
+
+    def _send(self) -> None:
+        destination = self._destination_for_send()
+        if isinstance(destination, AsyncDestination):
+            raise ValueError(
+                "To send to an AsyncDestination, use `awork()` or `async with`"
+            )
+        with self._timed("send"):
+            destination.send(
+                message_key=self.message_key, output_message=self.output_message
+            )
+        self._note_sent()
+
+    async def _asend(self) -> None:
+        destination = self._destination_for_send()
+        with self._timed("send"):
+            if isinstance(destination, AsyncDestination):
+                await destination.asend(
+                    message_key=self.message_key, output_message=self.output_message
+                )
+            else:
+                destination.send(
+                    message_key=self.message_key, output_message=self.output_message
+                )
+        self._note_sent()
+
+    def _note_sent(self) -> None:
+        if self.hooks:
+            for hook in self.hooks:
+                hook.on_sent(self)
+
     def __exit__(
         self,
         type: t.Optional[t.Type[BaseException]],
         value: t.Optional[BaseException],
         traceback: t.Optional[TracebackType],
     ) -> t.Optional[bool]:
+        should_suppress = self._close(type, value)
+        if self._needs_send:
+            self._send()
+        return should_suppress
+
+    async def __aexit__(
+        self,
+        type: t.Optional[t.Type[BaseException]],
+        value: t.Optional[BaseException],
+        traceback: t.Optional[TracebackType],
+    ) -> t.Optional[bool]:
+        should_suppress = self._close(type, value)
+        if self._needs_send:
+            await self._asend()
+        return should_suppress
+
+    def _close(
+        self,
+        type: t.Optional[t.Type[BaseException]],
+        value: t.Optional[BaseException],
+    ) -> t.Optional[bool]:
+        """
+        Note the outcome of the computation. Return a value suitable for
+        returning from `__exit__`.
+        """
         if type in [KeyboardInterrupt, SystemExit]:
             assert isinstance(value, BaseException)
             raise value
@@ -215,6 +486,11 @@ class Manager(t.Generic[ResultType, MessageKeyType]):
                 )
             return self._note_compute_exception(value)
 
+        if self.output_message is not None:
+            # The outcome has already been noted, which happens when the input
+            # message fails validation in `__enter__()`.
+            return None
+
         # In case of success, make sure the `result` setter has been invoked
         # inside the block.
         try:
@@ -267,17 +543,227 @@ class Manager(t.Generic[ResultType, MessageKeyType]):
         self.should_send = should_send
 
         with self:
-            try:
-                self.schema.input_message.validate(self.input_message)
-            except:  # noqa: E722
-                if not self.__exit__(*sys.exc_info()):
-                    raise
-                else:
-                    return self.output_message
+            # When the input message fails validation and the error is handled,
+            # `__enter__()` has already set the output message.
+            if self.output_message is None:
+                with self._timed("work"):
+                    result = work_fn(self.input_message)
+                self.result = result
 
-            self.result = work_fn(self.input_message)
+        if should_return:
+            return self.output_message
+        else:
+            return None
+
+    @t.overload
+    async def awork(  # noqa: E704
+        self,
+        work_fn: t.Callable,
+        should_send: bool,
+        should_return: t.Literal[True],
+    ) -> WerkitOutputMessage[ResultType, MessageKeyType]: ...
+
+    @t.overload
+    async def awork(  # noqa: E704
+        self,
+        work_fn: t.Callable,
+        should_send: bool,
+        should_return: t.Literal[False],
+    ) -> None: ...
+
+    @t.overload
+    async def awork(  # noqa: E704
+        self,
+        work_fn: t.Callable,
+        should_send: bool,
+        should_return: bool,
+    ) -> t.Optional[WerkitOutputMessage[ResultType, MessageKeyType]]: ...
+
+    async def awork(
+        self,
+        work_fn: t.Callable,
+        should_send: bool,
+        should_return: bool,
+    ) -> t.Optional[WerkitOutputMessage[ResultType, MessageKeyType]]:
+        """
+        The asyncio counterpart of `work()`. `work_fn` may be a coroutine
+        function. When the destination is a `werkit.compute.AsyncDestination`,
+        the output message is sent without blocking the event loop.
+        """
+        import inspect
+
+        self.should_send = should_send
+
+        async with self:
+            # When the input message fails validation and the error is handled,
+            # `__aenter__()` has already set the output message.
+            if self.output_message is None:
+                with self._timed("work"):
+                    result = work_fn(self.input_message)
+                    if inspect.isawaitable(result):
+                        result = await result
+                self.result = result
 
         if should_return:
             return self.output_message
         else:
             return None
+
+    @t.overload
+    @classmethod
+    def work_batch(  # noqa: E704
+        cls,
+        work_fn: t.Callable,
+        input_messages: t.Sequence[t.Mapping[str, t.Any]],
+        schema: Schema,
+        should_send: bool,
+        should_return: t.Literal[True],
+        destination: t.Optional[Destination] = None,
+        executor: t.Optional["Executor"] = None,
+        **kwargs: Unpack[ManagerKwargs],
+    ) -> list[WerkitOutputMessage[ResultType, MessageKeyType]]: ...
+
+    @t.overload
+    @classmethod
+    def work_batch(  # noqa: E704
+        cls,
+        work_fn: t.Callable,
+        input_messages: t.Sequence[t.Mapping[str, t.Any]],
+        schema: Schema,
+        should_send: bool,
+        should_return: t.Literal[False],
+        destination: t.Optional[Destination] = None,
+        executor: t.Optional["Executor"] = None,
+        **kwargs: Unpack[ManagerKwargs],
+    ) -> None: ...
+
+    @t.overload
+    @classmethod
+    def work_batch(  # noqa: E704
+        cls,
+        work_fn: t.Callable,
+        input_messages: t.Sequence[t.Mapping[str, t.Any]],
+        schema: Schema,
+        should_send: bool,
+        should_return: bool,
+        destination: t.Optional[Destination] = None,
+        executor: t.Optional["Executor"] = None,
+        **kwargs: Unpack[ManagerKwargs],
+    ) -> t.Optional[list[WerkitOutputMessage[ResultType, MessageKeyType]]]: ...
+
+    @classmethod
+    def work_batch(
+        cls,
+        work_fn: t.Callable,
+        input_messages: t.Sequence[t.Mapping[str, t.Any]],
+        schema: Schema,
+        should_send: bool,
+        should_return: bool,
+        destination: t.Optional[Destination] = None,
+        executor: t.Optional["Executor"] = None,
+        **kwargs: Unpack[ManagerKwargs],
+    ) -> t.Optional[list[WerkitOutputMessage[ResultType, MessageKeyType]]]:
+        """
+        Process a batch of input messages, invoking `work_fn` once per message.
+
+        All the input messages are validated before any work begins. Each
+        message is then timed separately and its errors are handled
+        separately, so one failure doesn't affect the rest of the batch. With
+        `should_send=True`, the output messages are dispatched together using
+        `destination.send_batch()` once the whole batch is complete.
+
+        By default the messages are processed serially. To process them in
+        parallel, pass a `concurrent.futures.Executor`: a `ThreadPoolExecutor`
+        for I/O-bound work or work which releases the GIL, or a
+        `ProcessPoolExecutor` for CPU-bound work. The executor's worker count
+        bounds the parallelism. With a process pool, `work_fn` and the
+        input messages must be picklable, and each message's work, result
+        validation, and serialization happen in the worker process. Hooks
+        require a thread pool, since in a process pool they'd observe only
+        copies of the managers.
+
+        Once the batch is sent, each manager's `timings["send"]` is the
+        duration of the batch send, and the hooks' `on_sent()` is invoked for
+        each manager.
+
+        When `handle_exceptions` is `False`, the first exception (in input
+        order) propagates, work which hasn't started is cancelled, and
+        nothing is sent.
+
+        Return the output messages in the order of the input messages.
+
+        Args:
+            work_fn (callable): Invoked with each input message.
+            input_messages (list): The input messages.
+            schema (werkit.compute.Schema): As for `Manager`.
+            should_send (bool): When `True`, send the output messages to
+                the destination.
+            should_return (bool): When `True`, return the output messages.
+            destination (werkit.compute.Destination): As for `Manager`.
+            executor (concurrent.futures.Executor): An optional executor on
+                which to run the messages in parallel.
+            kwargs: Other arguments for `Manager`.
+        """
+        if should_send and destination is None:
+            raise ValueError("With `should_send=True`, expected a destination")
+        if kwargs.get("hooks") and not (
+            executor is None or _is_thread_pool_executor(executor)
+        ):
+            # The work would run in other processes, where the hooks would
+            # observe copies of the managers, and their state would be lost.
+            raise ValueError("Hooks can only be used with a ThreadPoolExecutor")
+
+        managers = [
+            cls(input_message=input_message, schema=schema, **kwargs)
+            for input_message in input_messages
+        ]
+
+        for manager in managers:
+            manager.should_send = False
+            manager._begin()
+
+        if executor is None:
+            output_messages = [_work_item(manager, work_fn) for manager in managers]
+        else:
+            futures = [
+                executor.submit(_work_item, manager, work_fn) for manager in managers
+            ]
+            try:
+                output_messages = [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        if should_send:
+            assert destination is not None
+            start = time.perf_counter()
+            destination.send_batch(
+                [
+                    (manager.message_key, output_message)
+                    for manager, output_message in zip(managers, output_messages)
+                ]
+            )
+            # Each manager records the duration of the whole batch send.
+            send_seconds = time.perf_counter() - start
+            for manager in managers:
+                manager.timings["send"] = send_seconds
+                manager._note_sent()
+
+        if should_return:
+            return output_messages
+        else:
+            return None
+
+
+def _is_thread_pool_executor(executor: "Executor") -> bool:
+    from concurrent.futures import ThreadPoolExecutor
+
+    return isinstance(executor, ThreadPoolExecutor)
+
+
+def _work_item(
+    manager: Manager[ResultType, MessageKeyType], work_fn: t.Callable
+) -> WerkitOutputMessage[ResultType, MessageKeyType]:
+    # This is a module-level function so it can be pickled for process pools.
+    return manager.work(work_fn, should_send=False, should_return=True)
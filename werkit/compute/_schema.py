@@ -1,8 +1,68 @@
+import hashlib
+import json
+import threading
 import typing as t
 from typing_extensions import Unpack
 
 if t.TYPE_CHECKING:  # pragma: no cover
     from jsonschema import Draft7Validator
+    from referencing import Registry
+    from ._validation_policy import ValidationPolicy
+
+# Parsing a schema and compiling its validators is relatively costly, and
+# handlers tend to construct a `Schema` per cold start or even per invocation.
+# These process-wide caches let every `Schema` built from the same content
+# share a registry and compiled validators.
+_cache_lock = threading.RLock()
+# Keyed by `(real path, mtime in ns, size)`. Values are `(contents, digest)`.
+_loaded_schemas: dict[tuple[str, int, int], tuple[t.Any, str]] = {}
+# Keyed by the `id()` of contents loaded from a path. Values hold a reference
+# to the contents, so the id can't be reused while the entry exists.
+_loaded_schema_digests: dict[int, tuple[t.Any, str]] = {}
+# Keyed by content digest.
+_registries: dict[str, "Registry"] = {}
+# Keyed by `(content digest, ref)`.
+_validators: dict[tuple[str, str], "Draft7Validator"] = {}
+
+
+def _digest_for(schema: t.Any) -> str:
+    try:
+        contents, digest = _loaded_schema_digests[id(schema)]
+        if contents is schema:
+            return digest
+    except KeyError:
+        pass
+    return hashlib.sha256(
+        json.dumps(schema, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+
+
+def _schema_without_ref(schema: t.Any, ref: str) -> t.Optional[t.Any]:
+    """
+    Return a copy of the schema with the definition at the given JSON pointer
+    ref replaced by the empty schema, which matches anything. Return `None`
+    when the ref can't be resolved that way.
+    """
+    from urllib.parse import unquote
+
+    if not ref.startswith("#/") or not isinstance(schema, dict):
+        return None
+    path = [
+        unquote(part).replace("~1", "/").replace("~0", "~")
+        for part in ref[2:].split("/")
+    ]
+
+    # Copy only the containers along the path, leaving the original untouched.
+    root = node = dict(schema)
+    for part in path[:-1]:
+        child = node.get(part)
+        if not isinstance(child, dict):
+            return None
+        node[part] = node = dict(child)
+    if path[-1] not in node:
+        return None
+    node[path[-1]] = {}
+    return root
 
 
 class RefKwargs(t.TypedDict, total=False):
@@ -11,9 +71,33 @@ class RefKwargs(t.TypedDict, total=False):
     output_message_ref: str
 
 
+class SchemaKwargs(RefKwargs, total=False):
+    validation_policy: "ValidationPolicy"
+
+
 class Schema:
     """
-    Helper for validating request, result, and serialized result schemas
+    Helper for validating request, result, and serialized result schemas.
+
+    Registries and compiled validators are cached for the life of the process,
+    keyed by a digest of the schema contents and the ref, so constructing
+    several `Schema` objects from the same contents is cheap. To pay the
+    remaining setup cost at import time rather than on the first request,
+    call `warm()`:
+
+        schema = Schema.load_relative_to_file(__file__, [...]).warm()
+
+    `output_message_envelope` validates an output message without descending
+    into the result: it's the output message schema with the `output_ref`
+    definition replaced by the empty schema. Once a result has been validated
+    against `output`, validating the output message against the envelope is
+    equivalent to validating it against `output_message`, but large results
+    are traversed once rather than twice. It's `None` when `output_ref` isn't
+    a JSON pointer into the schema.
+
+    A `werkit.compute.ValidationPolicy` may be attached to the schema, in which
+    case it applies to every `Manager` using the schema which does not specify
+    its own.
     """
 
     REGISTRY_URI = "https://example.test/"
@@ -24,33 +108,97 @@ class Schema:
         input_message_ref: str = "#/definitions/AnyInputMessage",
         output_ref: str = "#/definitions/Output",
         output_message_ref: str = "#/definitions/AnyOutputMessage",
+        validation_policy: t.Optional["ValidationPolicy"] = None,
     ):
-        from referencing import Registry, Resource
+        self.schema = schema
+        self.validation_policy = validation_policy
+        self.input_message_ref = input_message_ref
+        self.output_ref = output_ref
+        self.output_message_ref = output_message_ref
+        self.digest = _digest_for(schema)
+        self.registry = self._registry(self.digest, schema)
+        self._compile_validators()
 
-        self.registry = Registry().with_resource(
-            uri=self.REGISTRY_URI, resource=Resource.from_contents(schema)
-        )
+    def _compile_validators(self) -> None:
         self.input_message = (
-            None if input_message_ref is None else self.validator_for(input_message_ref)
+            None
+            if self.input_message_ref is None
+            else self.validator_for(self.input_message_ref)
+        )
+        self.output = (
+            None if self.output_ref is None else self.validator_for(self.output_ref)
         )
-        self.output = None if output_ref is None else self.validator_for(output_ref)
         self.output_message = (
             None
-            if output_message_ref is None
-            else self.validator_for(output_message_ref)
+            if self.output_message_ref is None
+            else self.validator_for(self.output_message_ref)
+        )
+        self.output_message_envelope = self._envelope_validator()
+
+    def _envelope_validator(self) -> t.Optional["Draft7Validator"]:
+        if self.output_ref is None or self.output_message_ref is None:
+            return None
+        digest = f"{self.digest}-without-{self.output_ref}"
+        with _cache_lock:
+            if digest in _registries:
+                registry = _registries[digest]
+            else:
+                contents = _schema_without_ref(self.schema, self.output_ref)
+                if contents is None:
+                    return None
+                registry = self._registry(digest, contents)
+            return self._validator(digest, registry, self.output_message_ref)
+
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        # Validators can't be pickled. Rebuild them (using the cache of the
+        # receiving process) instead, e.g. when the schema is sent to a worker
+        # process.
+        return (
+            self.__class__,
+            (
+                self.schema,
+                self.input_message_ref,
+                self.output_ref,
+                self.output_message_ref,
+                self.validation_policy,
+            ),
         )
 
     @classmethod
     def load_from_path(
-        cls, schema_filename: str, **kwargs: Unpack[RefKwargs]
+        cls, schema_filename: str, **kwargs: Unpack[SchemaKwargs]
     ) -> "Schema":
+        """
+        Load the schema at the given path. The parsed contents are cached until
+        the file is modified. Each call returns its own copy of the contents
+        in `schema`, so modifying it doesn't affect the cache or other schemas
+        loaded from the same file. (Nor does it affect the validators, which
+        are compiled from the cached contents.)
+        """
+        import copy
+        import os
         from missouri import json
 
-        return cls(schema=json.load(schema_filename), **kwargs)
+        real_path = os.path.realpath(schema_filename)
+        stat = os.stat(real_path)
+        cache_key = (real_path, stat.st_mtime_ns, stat.st_size)
+
+        with _cache_lock:
+            try:
+                contents, _ = _loaded_schemas[cache_key]
+            except KeyError:
+                contents = json.load(real_path)
+                entry = (contents, _digest_for(contents))
+                _loaded_schemas[cache_key] = entry
+                _loaded_schema_digests[id(contents)] = entry
+
+        schema = cls(schema=contents, **kwargs)
+        schema.schema = copy.deepcopy(contents)
+        return schema
 
     @classmethod
     def load_relative_to_file(
-        cls, filename: str, path_components: list[str], **kwargs: Unpack[RefKwargs]
+        cls, filename: str, path_components: list[str], **kwargs: Unpack[SchemaKwargs]
     ) -> "Schema":
         """
         By convention, the schema is placed in
@@ -66,9 +214,62 @@ class Schema:
             **kwargs,
         )
 
-    def validator_for(self, ref: str) -> "Draft7Validator":
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Discard all cached schemas, registries, and validators.
+        """
+        with _cache_lock:
+            _loaded_schemas.clear()
+            _loaded_schema_digests.clear()
+            _registries.clear()
+            _validators.clear()
+
+    def _registry(self, digest: str, contents: t.Any) -> "Registry":
+        from referencing import Registry, Resource
+
+        with _cache_lock:
+            try:
+                return _registries[digest]
+            except KeyError:
+                registry = _registries[digest] = Registry().with_resource(
+                    uri=self.REGISTRY_URI,
+                    resource=Resource.from_contents(contents),
+                )
+                return registry
+
+    def _validator(
+        self, digest: str, registry: "Registry", ref: str
+    ) -> "Draft7Validator":
         from jsonschema import Draft7Validator
 
-        return Draft7Validator(
-            {"$ref": f"{self.REGISTRY_URI}{ref}"}, registry=self.registry
-        )
+        cache_key = (digest, ref)
+        with _cache_lock:
+            try:
+                return _validators[cache_key]
+            except KeyError:
+                validator = _validators[cache_key] = Draft7Validator(
+                    {"$ref": f"{self.REGISTRY_URI}{ref}"}, registry=registry
+                )
+                return validator
+
+    def validator_for(self, ref: str) -> "Draft7Validator":
+        return self._validator(self.digest, self.registry, ref)
+
+    def warm(self) -> "Schema":
+        """
+        Crawl the registry up front and recompile the validators against the
+        crawled registry. Return `self`, so the call can be chained when the
+        schema is loaded at import time.
+        """
+        with _cache_lock:
+            # This includes the envelope, whose digest is derived from ours.
+            for digest in [key for key in _registries if key.startswith(self.digest)]:
+                _registries[digest] = _registries[digest].crawl()
+            for cache_key in [
+                key for key in _validators if key[0].startswith(self.digest)
+            ]:
+                del _validators[cache_key]
+            self.registry = _registries[self.digest]
+            self._compile_validators()
+        return self
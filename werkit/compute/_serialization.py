@@ -4,11 +4,14 @@ from ._types import (
     WerkitErrorOrigin,
     WerkitErrorOutputMessage,
     WerkitSuccessOutputMessage,
+    WerkitTimingPhase,
 )
 
 ResultType = t.TypeVar("ResultType")
 MessageKeyType = t.TypeVar("MessageKeyType")
 
+ErrorFormat = t.Literal["traceback", "frames"]
+
 
 def serialize_result(
     message_key: t.Any,
@@ -16,6 +19,7 @@ def serialize_result(
     start_time: datetime.datetime,
     duration_seconds: float,
     runtime_info: t.Any = None,
+    timings: t.Optional[t.Mapping[WerkitTimingPhase, float]] = None,
 ) -> WerkitSuccessOutputMessage[ResultType, MessageKeyType]:
     """
     Wrap the computation result in the `werkit.Manager` result schema.
@@ -25,8 +29,9 @@ def serialize_result(
         start_time (datetime.datetime): The start time of the computation.
         duration_seconds (int): The computation time.
         runtime_info (object): Serializable runtime metadata.
+        timings (dict): An optional breakdown of the time spent in each phase.
     """
-    return {
+    output_message: WerkitSuccessOutputMessage[ResultType, MessageKeyType] = {
         "message_key": message_key,
         "success": True,
         "result": serializable_result,
@@ -36,6 +41,9 @@ def serialize_result(
         "duration_seconds": duration_seconds,
         "runtime_info": runtime_info,
     }
+    if timings is not None:
+        output_message["timings"] = dict(timings)
+    return output_message
 
 
 def serialize_exception(
@@ -45,6 +53,9 @@ def serialize_exception(
     start_time: datetime.datetime,
     duration_seconds: float = -1,
     runtime_info: t.Any = None,
+    timings: t.Optional[t.Mapping[WerkitTimingPhase, float]] = None,
+    traceback_limit: t.Optional[int] = None,
+    error_format: ErrorFormat = "traceback",
 ) -> WerkitErrorOutputMessage[MessageKeyType]:
     """
     Wrap an exception in the `werkit.Manager` result schema.
@@ -58,18 +69,30 @@ def serialize_exception(
         duration_seconds (int): The time elapsed before the error occurred,
             if known.
         runtime_info (object): Serializable runtime metadata.
+        timings (dict): An optional breakdown of the time spent in each phase.
+        traceback_limit (int): The maximum number of stack frames to include,
+            as in the `traceback` module: a positive limit keeps the outermost
+            frames and a negative limit keeps the innermost ones. The default
+            includes every frame.
+        error_format (str): With `"traceback"`, the default, the error is the
+            formatted traceback, including chained exceptions and source
+            lines. With `"frames"`, the error is a list with one
+            `"filename:lineno in function"` entry per frame, followed by the
+            exception itself. This skips reading source files and omits
+            chained exceptions, so it's considerably cheaper to produce.
     """
-    import traceback
     from ._synthetic_error import SyntheticError
 
     if isinstance(exception, SyntheticError):
         error = exception.error
         out_error_origin = exception.error_origin
     else:
-        error = traceback.format_exception(None, exception, exception.__traceback__)
+        error = format_error(
+            exception, traceback_limit=traceback_limit, error_format=error_format
+        )
         out_error_origin = error_origin
 
-    return {
+    output_message: WerkitErrorOutputMessage[MessageKeyType] = {
         "message_key": message_key,
         "success": False,
         "result": None,
@@ -79,3 +102,30 @@ def serialize_exception(
         "start_time": start_time.astimezone().isoformat(),
         "runtime_info": runtime_info,
     }
+    if timings is not None:
+        output_message["timings"] = dict(timings)
+    return output_message
+
+
+def format_error(
+    exception: BaseException,
+    traceback_limit: t.Optional[int] = None,
+    error_format: ErrorFormat = "traceback",
+) -> list[str]:
+    import traceback
+
+    if error_format == "traceback":
+        return traceback.format_exception(
+            None, exception, exception.__traceback__, limit=traceback_limit
+        )
+    elif error_format == "frames":
+        frames = traceback.StackSummary.extract(
+            traceback.walk_tb(exception.__traceback__),
+            limit=traceback_limit,
+            lookup_lines=False,
+        )
+        return [
+            f"{frame.filename}:{frame.lineno} in {frame.name}\n" for frame in frames
+        ] + traceback.format_exception_only(type(exception), exception)
+    else:
+        raise ValueError(f"Unknown error format: {error_format}")
@@ -1,14 +1,24 @@
 import typing as t
-from typing_extensions import TypedDict
+from typing_extensions import NotRequired, TypedDict
 
 MessageKeyType = t.TypeVar("MessageKeyType")
 ResultType = t.TypeVar("ResultType")
 
+WerkitTimingPhase = t.Literal[
+    "input_validation",
+    "work",
+    "result_validation",
+    "serialization",
+    "output_validation",
+    "send",
+]
+
 
 class WerkitComputeMeta(TypedDict):
     start_time: str
     duration_seconds: float
     runtime_info: t.Optional[t.Any]
+    timings: NotRequired[dict[WerkitTimingPhase, float]]
 
 
 class WerkitSuccessOutputMessage(
@@ -0,0 +1,95 @@
+import os
+import random
+import typing as t
+
+ValidationLevel = t.Literal["full", "sampled", "input_only", "off"]
+ValidationTarget = t.Literal["input_message", "output", "output_message"]
+
+ALL_TARGETS: frozenset[ValidationTarget] = frozenset(
+    ["input_message", "output", "output_message"]
+)
+
+
+class ValidationPolicy:
+    """
+    Decide which of the validations `werkit.compute.Manager` performs.
+
+    - `"full"`: Validate the input message, the result, and the output message.
+    - `"sampled"`: Always validate the input message. Validate the result and
+        the output message for a random `sample_rate` fraction of calls.
+    - `"input_only"`: Validate only the input message.
+    - `"off"`: Skip validation entirely.
+
+    The decision is made once per manager, so a sampled call validates both
+    its result and its output message, or neither.
+
+    When no policy is passed to the `Manager` or the `Schema`, the policy is
+    read from the environment using `ValidationPolicy.from_environment()`.
+
+    Args:
+        level (str): One of the levels above.
+        sample_rate (float): For the `"sampled"` level, the fraction of calls
+            (between 0 and 1) for which the result and output message are
+            validated.
+    """
+
+    LEVEL_ENV_VAR = "WERKIT_VALIDATION_LEVEL"
+    SAMPLE_RATE_ENV_VAR = "WERKIT_VALIDATION_SAMPLE_RATE"
+    PRODUCTION_SAMPLE_RATE = 0.01
+
+    def __init__(self, level: ValidationLevel = "full", sample_rate: float = 1.0):
+        if level not in t.get_args(ValidationLevel):
+            raise ValueError(f"Unknown validation level: {level}")
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("Expected sample_rate to be between 0 and 1")
+        self.level = level
+        self.sample_rate = sample_rate
+
+    @classmethod
+    def production(
+        cls, sample_rate: float = PRODUCTION_SAMPLE_RATE
+    ) -> "ValidationPolicy":
+        """
+        A policy suited to production: always validate the input message, and
+        validate the result and output message for a sample of calls.
+        """
+        return cls(level="sampled", sample_rate=sample_rate)
+
+    @classmethod
+    def from_environment(cls) -> "ValidationPolicy":
+        """
+        Read the level from `WERKIT_VALIDATION_LEVEL` and the sample rate from
+        `WERKIT_VALIDATION_SAMPLE_RATE`. When unset, the level is `"full"` and
+        the sample rate is `PRODUCTION_SAMPLE_RATE`.
+        """
+        level = os.environ.get(cls.LEVEL_ENV_VAR, "full")
+        sample_rate = os.environ.get(cls.SAMPLE_RATE_ENV_VAR, None)
+        return cls(
+            level=t.cast(ValidationLevel, level),
+            sample_rate=(
+                cls.PRODUCTION_SAMPLE_RATE
+                if sample_rate is None
+                else float(sample_rate)
+            ),
+        )
+
+    def targets(self) -> frozenset[ValidationTarget]:
+        """
+        Choose the validations to perform for a single call.
+        """
+        if self.level == "full":
+            return ALL_TARGETS
+        elif self.level == "sampled":
+            if self.sample_rate > 0 and random.random() < self.sample_rate:
+                return ALL_TARGETS
+            else:
+                return frozenset(["input_message"])
+        elif self.level == "input_only":
+            return frozenset(["input_message"])
+        else:
+            return frozenset()
+
+    def __repr__(self) -> str:
+        return (
+            f"ValidationPolicy(level={self.level!r}, sample_rate={self.sample_rate!r})"
+        )
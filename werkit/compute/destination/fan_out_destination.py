@@ -0,0 +1,258 @@
+import threading
+import time
+import typing as t
+
+from werkit.compute import AsyncDestination, Destination
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import ThreadPoolExecutor
+
+FanOutPolicy = t.Literal["all", "any", "best_effort"]
+
+Timeouts = t.Union[None, float, t.Sequence[t.Optional[float]]]
+
+
+class FanOutError(Exception):
+    """
+    Raised when sending to a `FanOutDestination` fails under its policy.
+    `errors` maps the index of each failed destination to its error. A
+    destination which timed out has a `TimeoutError`.
+    """
+
+    def __init__(self, errors: dict[int, BaseException]):
+        self.errors = errors
+        super().__init__(
+            "Sending failed for "
+            + ", ".join(
+                f"destination {index} ({error!r})" for index, error in errors.items()
+            )
+        )
+
+
+def _timeouts_for(
+    timeout_seconds: Timeouts, destination_count: int
+) -> list[t.Optional[float]]:
+    if timeout_seconds is None or isinstance(timeout_seconds, (int, float)):
+        return [timeout_seconds] * destination_count
+    timeouts = list(timeout_seconds)
+    if len(timeouts) != destination_count:
+        raise ValueError("Expected one timeout per destination")
+    return timeouts
+
+
+def _check_policy(
+    policy: FanOutPolicy,
+    destinations: t.Sequence[t.Any],
+    errors: dict[int, BaseException],
+    on_error: t.Optional[t.Callable[[t.Any, BaseException], None]],
+) -> None:
+    if not errors:
+        return
+    if on_error is not None:
+        for index, error in errors.items():
+            on_error(destinations[index], error)
+    if policy == "all" or (policy == "any" and len(errors) == len(destinations)):
+        raise FanOutError(errors)
+
+
+class _FanOutOptions:
+    def __init__(
+        self,
+        destinations: t.Sequence[t.Any],
+        policy: FanOutPolicy,
+        timeout_seconds: Timeouts,
+        on_error: t.Optional[t.Callable[[t.Any, BaseException], None]],
+    ):
+        if not destinations:
+            raise ValueError("Expected at least one destination")
+        if policy not in t.get_args(FanOutPolicy):
+            raise ValueError(f"Unknown policy: {policy}")
+        self.destinations = list(destinations)
+        self.policy = policy
+        self.timeouts = _timeouts_for(timeout_seconds, len(self.destinations))
+        self.on_error = on_error
+
+
+class FanOutDestination(_FanOutOptions, Destination):
+    """
+    Send each output message to several destinations concurrently, using a
+    thread pool, so adding a destination doesn't add its latency to the
+    caller's.
+
+    The `policy` decides when sending fails, raising a `FanOutError`:
+
+    - `"all"`, the default: When any destination fails.
+    - `"any"`: When every destination fails.
+    - `"best_effort"`: Never.
+
+    Each destination may be given a timeout, measured from when the message is
+    dispatched. A destination which exceeds it counts as failed, though since
+    threads can't be interrupted, its send runs to completion in the
+    background.
+
+    Args:
+        destinations (list): The `werkit.compute.Destination` instances.
+        policy (str): One of the policies above.
+        timeout_seconds (float): A timeout for every destination, or a list
+            with one timeout (or `None`) per destination.
+        on_error (callable): Invoked with the destination and the error for
+            every failed destination, regardless of the policy.
+        max_workers (int): The size of the thread pool. Defaults to one
+            thread per destination.
+    """
+
+    def __init__(
+        self,
+        destinations: t.Sequence[Destination],
+        policy: FanOutPolicy = "all",
+        timeout_seconds: Timeouts = None,
+        on_error: t.Optional[t.Callable[[Destination, BaseException], None]] = None,
+        max_workers: t.Optional[int] = None,
+    ):
+        super().__init__(
+            destinations=destinations,
+            policy=policy,
+            timeout_seconds=timeout_seconds,
+            on_error=on_error,
+        )
+        self.max_workers = max_workers or len(self.destinations)
+        self._lock = threading.Lock()
+        self._executor: t.Optional["ThreadPoolExecutor"] = None
+
+    def _get_executor(self) -> "ThreadPoolExecutor":
+        from concurrent.futures import ThreadPoolExecutor
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="werkit-fan-out-destination",
+                )
+            return self._executor
+
+    def _dispatch(self, operation: t.Callable[[Destination], None]) -> None:
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+
+        executor = self._get_executor()
+        start = time.monotonic()
+        futures = [
+            executor.submit(operation, destination) for destination in self.destinations
+        ]
+
+        errors: dict[int, BaseException] = {}
+        for index, (future, timeout) in enumerate(zip(futures, self.timeouts)):
+            remaining = (
+                None if timeout is None else max(start + timeout - time.monotonic(), 0)
+            )
+            try:
+                future.result(timeout=remaining)
+            except FutureTimeoutError:
+                errors[index] = TimeoutError(
+                    f"Destination {index} timed out after {timeout} seconds"
+                )
+            except Exception as e:
+                errors[index] = e
+
+        _check_policy(self.policy, self.destinations, errors, self.on_error)
+
+    def send(self, message_key: t.Any, output_message: t.Any) -> None:
+        self._dispatch(
+            lambda destination: destination.send(
+                message_key=message_key, output_message=output_message
+            )
+        )
+
+    def send_batch(self, messages: t.Sequence[tuple[t.Any, t.Any]]) -> None:
+        self._dispatch(lambda destination: destination.send_batch(messages))
+
+    def close(self) -> None:
+        """
+        Release the thread pool, waiting for sends which are still running.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+class AsyncFanOutDestination(_FanOutOptions, AsyncDestination):
+    """
+    The asyncio counterpart of `FanOutDestination`, for `Manager.awork()`. The
+    destinations may be a mix of `werkit.compute.AsyncDestination` instances,
+    which are awaited concurrently, and `werkit.compute.Destination`
+    instances, which are run in threads using `asyncio.to_thread()`.
+
+    Timed-out `AsyncDestination` sends are cancelled.
+
+    Args:
+        destinations (list): The destinations.
+        policy, timeout_seconds, on_error: As for `FanOutDestination`.
+    """
+
+    def __init__(
+        self,
+        destinations: t.Sequence[t.Union[Destination, AsyncDestination]],
+        policy: FanOutPolicy = "all",
+        timeout_seconds: Timeouts = None,
+        on_error: t.Optional[
+            t.Callable[[t.Union[Destination, AsyncDestination], BaseException], None]
+        ] = None,
+    ):
+        super().__init__(
+            destinations=destinations,
+            policy=policy,
+            timeout_seconds=timeout_seconds,
+            on_error=on_error,
+        )
+
+    async def _dispatch(
+        self,
+        operation: t.Callable[[Destination], None],
+        async_operation: t.Callable[[AsyncDestination], t.Awaitable[None]],
+    ) -> None:
+        import asyncio
+
+        def awaitable_for(
+            destination: t.Union[Destination, AsyncDestination],
+        ) -> t.Awaitable[None]:
+            if isinstance(destination, AsyncDestination):
+                return async_operation(destination)
+            else:
+                return asyncio.to_thread(operation, destination)
+
+        results = await asyncio.gather(
+            *[
+                asyncio.wait_for(awaitable_for(destination), timeout)
+                for destination, timeout in zip(self.destinations, self.timeouts)
+            ],
+            return_exceptions=True,
+        )
+
+        errors: dict[int, BaseException] = {}
+        for index, (result, timeout) in enumerate(zip(results, self.timeouts)):
+            if isinstance(result, asyncio.TimeoutError):
+                errors[index] = TimeoutError(
+                    f"Destination {index} timed out after {timeout} seconds"
+                )
+            elif isinstance(result, Exception):
+                errors[index] = result
+            elif isinstance(result, BaseException):
+                raise result
+
+        _check_policy(self.policy, self.destinations, errors, self.on_error)
+
+    async def asend(self, message_key: t.Any, output_message: t.Any) -> None:
+        await self._dispatch(
+            lambda destination: destination.send(
+                message_key=message_key, output_message=output_message
+            ),
+            lambda destination: destination.asend(
+                message_key=message_key, output_message=output_message
+            ),
+        )
+
+    async def asend_batch(self, messages: t.Sequence[tuple[t.Any, t.Any]]) -> None:
+        await self._dispatch(
+            lambda destination: destination.send_batch(messages),
+            lambda destination: destination.asend_batch(messages),
+        )
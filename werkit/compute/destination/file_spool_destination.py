@@ -0,0 +1,355 @@
+import contextlib
+import os
+import struct
+import threading
+import time
+import typing as t
+import zlib
+
+from werkit.compute import Destination, Encoder, EncoderName
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from typing_extensions import Self
+
+# Each record is its payload length and CRC-32, followed by the payload, which
+# is a JSON-encoded `{"message_key": ..., "output_message": ...}` object.
+_HEADER = struct.Struct(">II")
+
+
+@contextlib.contextmanager
+def _exclusive_lock(f: t.IO[bytes]) -> t.Iterator[None]:
+    """
+    Hold an advisory lock on the spool file, which excludes writers while the
+    replayer compacts it. Where `fcntl` isn't available, this does nothing.
+    """
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover
+        yield
+        return
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class SpoolCorruptionError(Exception):
+    """
+    Raised when a complete spool record fails its checksum.
+    """
+
+
+class FileSpoolDestination(Destination):
+    """
+    Durably append output messages to a local file, to be delivered later by a
+    `SpoolReplayer`. This decouples compute throughput from delivery: results
+    survive network failures and process restarts once they're synced to
+    disk.
+
+    The file is an append-only log of length-prefixed, checksummed records.
+    Rather than syncing every record, which is slow, the file is synced once
+    `fsync_every` records are pending, or `fsync_interval_seconds` after the
+    oldest pending record, whichever comes first, and at the end of each
+    `send_batch()`. Invoke `flush()` or `close()` to sync the rest. Records are
+    written under a lock on the file, so a `SpoolReplayer` can compact it
+    while it's being written.
+
+    Args:
+        path (str): The spool file, which is created if needed.
+        fsync_every (int): The number of records written between syncs.
+        fsync_interval_seconds (float): The maximum age of a pending record,
+            checked when the next record is written.
+        encoder (werkit.compute.Encoder): The record encoder, given as an
+            instance or by name.
+    """
+
+    def __init__(
+        self,
+        path: t.Union[str, "os.PathLike[str]"],
+        fsync_every: int = 100,
+        fsync_interval_seconds: float = 1.0,
+        encoder: t.Union[Encoder, EncoderName, None] = None,
+    ):
+        self.path = os.fspath(path)
+        self.fsync_every = fsync_every
+        self.fsync_interval_seconds = fsync_interval_seconds
+        self.encoder = encoder
+        self._lock = threading.Lock()
+        self._file: t.Optional[t.BinaryIO] = None
+        self._pending_count = 0
+        self._oldest_pending_at = 0.0
+
+    def _record(self, message_key: t.Any, output_message: t.Any) -> bytes:
+        payload = self.encode(
+            {"message_key": message_key, "output_message": output_message}
+        )
+        return _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+    def _write(self, records: bytes, count: int) -> None:
+        """
+        Append the records. The caller holds the lock.
+        """
+        if self._file is None:
+            self._file = open(self.path, "ab")
+        with _exclusive_lock(self._file):
+            self._file.write(records)
+            self._file.flush()
+        if self._pending_count == 0:
+            self._oldest_pending_at = time.monotonic()
+        self._pending_count += count
+
+    def _sync(self) -> None:
+        """
+        Sync pending records to disk. The caller holds the lock.
+        """
+        if self._file is not None and self._pending_count:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._pending_count = 0
+
+    def send(self, message_key: t.Any, output_message: t.Any) -> None:
+        record = self._record(message_key, output_message)
+        with self._lock:
+            self._write(record, 1)
+            if (
+                self._pending_count >= self.fsync_every
+                or time.monotonic() - self._oldest_pending_at
+                >= self.fsync_interval_seconds
+            ):
+                self._sync()
+
+    def send_batch(self, messages: t.Sequence[tuple[t.Any, t.Any]]) -> None:
+        records = b"".join(
+            self._record(message_key, output_message)
+            for message_key, output_message in messages
+        )
+        with self._lock:
+            self._write(records, len(messages))
+            self._sync()
+
+    def flush(self) -> None:
+        """
+        Sync every record written so far to disk.
+        """
+        with self._lock:
+            self._sync()
+
+    def close(self) -> None:
+        with self._lock:
+            self._sync()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
+
+
+def read_spool(
+    path: t.Union[str, "os.PathLike[str]"], offset: int = 0
+) -> t.Iterator[tuple[int, t.Any, t.Any]]:
+    """
+    Read the records of a spool file starting at the given byte offset. Yield
+    `(offset after the record, message_key, output_message)` tuples. A
+    truncated record at the end of the file, which is left by a writer which
+    is still writing or which crashed, ends the iteration.
+    """
+    import json
+
+    with open(path, "rb") as f:
+        f.seek(offset)
+        while True:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            length, checksum = _HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length:
+                return
+            if zlib.crc32(payload) != checksum:
+                raise SpoolCorruptionError(
+                    f"Record at offset {offset} of {os.fspath(path)} failed its checksum"
+                )
+            offset += _HEADER.size + length
+            record = json.loads(payload)
+            yield offset, record["message_key"], record["output_message"]
+
+
+class SpoolReplayer:
+    """
+    Drain a spool written by `FileSpoolDestination` into another destination,
+    with at-least-once semantics.
+
+    Messages are sent using the destination's `send_batch()`. After each batch
+    is sent, the offset of the next record is durably saved in `offset_path`,
+    so a later `replay()`, e.g. after a restart, picks up where the last one
+    left off. A batch which was sent just before a crash may be sent again.
+
+    Messages whose `message_key` was already sent are skipped, which drops
+    duplicates within the spool, e.g. when a send was spooled by a retrying
+    writer more than once. Up to `dedupe_capacity` of the most recent keys
+    are remembered. On the first `replay()`, they're loaded from the records
+    which were already replayed, so they survive a restart.
+
+    Once every record has been replayed, the spool is truncated, so it
+    doesn't grow without bound. The keys of the records it held remain
+    remembered by this replayer, but not by a later one. Compaction relies
+    on `fcntl`, and is skipped where it isn't available.
+
+    Replay can run concurrently with a writer appending to the spool. A
+    record still being written is picked up by the next `replay()`.
+
+    Args:
+        path (str): The spool file.
+        destination (werkit.compute.Destination): Where to send the messages.
+        offset_path (str): Where to save the offset. Defaults to the spool
+            path with `.offset` appended.
+        batch_size (int): The maximum number of messages per `send_batch()`.
+        dedupe_capacity (int): The number of message keys remembered for
+            deduplication. Pass `0` to disable deduplication.
+        compact (bool): When `True`, the default, truncate the spool once
+            every record has been replayed.
+    """
+
+    def __init__(
+        self,
+        path: t.Union[str, "os.PathLike[str]"],
+        destination: Destination,
+        offset_path: t.Optional[t.Union[str, "os.PathLike[str]"]] = None,
+        batch_size: int = 100,
+        dedupe_capacity: int = 100_000,
+        compact: bool = True,
+    ):
+        from collections import OrderedDict
+
+        self.path = os.fspath(path)
+        self.destination = destination
+        self.offset_path = (
+            f"{self.path}.offset" if offset_path is None else os.fspath(offset_path)
+        )
+        self.batch_size = batch_size
+        self.dedupe_capacity = dedupe_capacity
+        self.compact = compact
+        self._sent_keys: "OrderedDict[str, None]" = OrderedDict()
+        self._loaded_sent_keys = False
+
+    @property
+    def offset(self) -> int:
+        """
+        The offset of the first record which has not been replayed.
+        """
+        try:
+            with open(self.offset_path, "r") as f:
+                return int(f.read())
+        except FileNotFoundError:
+            return 0
+
+    def _save_offset(self, offset: int) -> None:
+        temp_path = f"{self.offset_path}.tmp"
+        with open(temp_path, "w") as f:
+            f.write(str(offset))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.offset_path)
+
+    def _dedupe_key(self, message_key: t.Any) -> str:
+        import json
+
+        return json.dumps(message_key, sort_keys=True, default=str)
+
+    def _remember(self, key: str) -> None:
+        self._sent_keys[key] = None
+        self._sent_keys.move_to_end(key)
+        while len(self._sent_keys) > self.dedupe_capacity:
+            self._sent_keys.popitem(last=False)
+
+    def _is_duplicate(self, message_key: t.Any) -> bool:
+        if not self.dedupe_capacity:
+            return False
+        key = self._dedupe_key(message_key)
+        if key in self._sent_keys:
+            self._sent_keys.move_to_end(key)
+            return True
+        self._remember(key)
+        return False
+
+    def _load_sent_keys(self, offset: int) -> None:
+        """
+        Remember the keys of the records before the offset, which were
+        replayed before this replayer was created.
+        """
+        if self._loaded_sent_keys or not self.dedupe_capacity:
+            return
+        self._loaded_sent_keys = True
+        for record_end, message_key, _ in read_spool(self.path):
+            if record_end > offset:
+                break
+            self._remember(self._dedupe_key(message_key))
+
+    def _compact(self, offset: int) -> None:
+        """
+        Truncate the spool if every record up to its end has been replayed.
+        Writers are excluded meanwhile, so no record is lost.
+        """
+        try:
+            import fcntl  # noqa: F401
+        except ImportError:  # pragma: no cover
+            # Without the lock, a record written meanwhile could be lost.
+            return
+
+        with open(self.path, "r+b") as f:
+            with _exclusive_lock(f):
+                if os.fstat(f.fileno()).st_size != offset:
+                    return
+                # Save the offset first. A crash in between means the records
+                # are replayed again, rather than the offset pointing past the
+                # end of the spool.
+                self._save_offset(0)
+                f.truncate(0)
+                os.fsync(f.fileno())
+
+    def replay(self) -> int:
+        """
+        Send the records which have not been replayed yet. Return the number
+        of messages sent, not counting duplicates. When the destination
+        raises, the error propagates, and the failed batch is retried by the
+        next `replay()`.
+        """
+        if not os.path.exists(self.path):
+            return 0
+
+        sent_count = 0
+        batch: list[tuple[t.Any, t.Any]] = []
+        batch_end = offset = self.offset
+        self._load_sent_keys(offset)
+
+        def send_batch() -> None:
+            nonlocal batch, sent_count
+            if batch:
+                try:
+                    self.destination.send_batch(batch)
+                except BaseException:
+                    # Those keys weren't sent after all.
+                    for message_key, _ in batch:
+                        self._sent_keys.pop(self._dedupe_key(message_key), None)
+                    raise
+                sent_count += len(batch)
+                batch = []
+            if batch_end != offset:
+                self._save_offset(batch_end)
+
+        for batch_end, message_key, output_message in read_spool(self.path, offset):
+            if not self._is_duplicate(message_key):
+                batch.append((message_key, output_message))
+            if len(batch) >= self.batch_size:
+                send_batch()
+                offset = batch_end
+        send_batch()
+
+        if self.compact and batch_end > 0:
+            self._compact(batch_end)
+        return sent_count
@@ -1,38 +1,62 @@
 import typing as t
 
-from werkit.compute import Destination
+from werkit.compute import Destination, Encoder, EncoderName
 
 if t.TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
     from mypy_boto3_lambda.client import LambdaClient
 
-_lambda_client = None
+# The maximum payload size for an asynchronous (`"Event"`) invocation.
+MAX_ASYNC_PAYLOAD_BYTES = 256 * 1024
 
 
 def get_lambda_client() -> "LambdaClient":
-    import boto3
+    from werkit.aws_clients import get_client
 
-    global _lambda_client
-    if not _lambda_client:  # pragma: no cover
-        _lambda_client = boto3.client("lambda")
-
-    return _lambda_client
+    return get_client("lambda")
 
 
 class LambdaDestination(Destination):
+    """
+    Send each output message to a Lambda function using an asynchronous
+    invocation, wrapped in a `DestinationMessage`.
+
+    Args:
+        task_identifier (str): Passed through to the receiving function.
+            Defaults to `DESTINATION_LAMBDA_TASK_IDENTIFIER`.
+        function_name (str): The function to invoke. Defaults to
+            `DESTINATION_LAMBDA_FUNCTION_NAME`.
+        qualifier (str): The version or alias to invoke. Defaults to
+            `DESTINATION_LAMBDA_QUALIFIER`.
+        encoder (werkit.compute.Encoder): The payload encoder, given as an
+            instance or by name.
+
+    The environment is read on the first send.
+    """
+
     def __init__(
         self,
         task_identifier: t.Optional[str] = None,
         function_name: t.Optional[str] = None,
         qualifier: t.Optional[str] = None,
+        encoder: t.Union[Encoder, EncoderName, None] = None,
     ):
         self.task_identifier = task_identifier
         self.function_name = function_name
         self.qualifier = qualifier
+        self.encoder = encoder
+        self._resolved: t.Optional[tuple[str, str, t.Optional[str]]] = None
 
-    def send(self, message_key: t.Any, output_message: t.Any) -> None:
-        from missouri import json
+    def _resolve(self) -> tuple[str, str, t.Optional[str]]:
+        """
+        Return the task identifier, function name, and qualifier, falling back
+        to the environment.
+        """
         import os
 
+        if self._resolved is not None:
+            return self._resolved
+
         task_identifier = self.task_identifier or os.environ.get(
             "DESTINATION_LAMBDA_TASK_IDENTIFIER", None
         )
@@ -53,20 +77,235 @@ class LambdaDestination(Destination):
             "DESTINATION_LAMBDA_QUALIFIER", None
         )
 
-        # Keep this in sync with the DestinationMessage interface.
-        message = {"taskIdentifier": self.task_identifier, "payload": output_message}
+        self._resolved = (task_identifier, function_name, qualifier)
+        return self._resolved
+
+    def _get_client(self) -> "LambdaClient":
+        return get_lambda_client()
+
+    def _invoke(self, payload: bytes) -> None:
+        _, function_name, qualifier = self._resolve()
 
         # TODO: Dry this while satisfying the type checker...
         if qualifier is None:
-            get_lambda_client().invoke(
+            self._get_client().invoke(
                 FunctionName=function_name,
                 InvocationType="Event",
-                Payload=json.dumps(message),
+                Payload=payload,
             )
         else:
-            get_lambda_client().invoke(
+            self._get_client().invoke(
                 FunctionName=function_name,
                 InvocationType="Event",
-                Payload=json.dumps(message),
+                Payload=payload,
                 Qualifier=qualifier,
             )
+
+    def send(self, message_key: t.Any, output_message: t.Any) -> None:
+        task_identifier, _, _ = self._resolve()
+
+        # Keep this in sync with the DestinationMessage interface.
+        message = {"taskIdentifier": task_identifier, "payload": output_message}
+
+        self._invoke(self.encode(message))
+
+
+class BatchingLambdaDestination(LambdaDestination):
+    """
+    Coalesce output messages into `BatchDestinationMessage` payloads no larger
+    than `max_payload_bytes`, and send them to a Lambda function from a
+    background thread pool, keeping the invocations off the critical path.
+
+    A batch is sent once the next message would not fit, or when `flush()` is
+    invoked. Handlers must invoke `flush()` (or `close()`) before returning,
+    since the Lambda runtime freezes background threads between invocations.
+    `flush()` waits for the pending invocations and raises the first error,
+    if any. The messages of a batch whose invocation fails, e.g. because it's
+    throttled, are kept, and sent again by the next `flush()`. To hand them to
+    a fallback instead, use `take_unsent()`. The destination can also be used
+    as a context manager, which closes it on exit.
+
+        destination = BatchingLambdaDestination()
+
+        def handler(event, context):
+            try:
+                for input_message in event["input_messages"]:
+                    Manager(..., destination=destination).work(...)
+            finally:
+                destination.flush()
+
+    Args:
+        task_identifier, function_name, qualifier, encoder: As for
+            `LambdaDestination`.
+        max_payload_bytes (int): The maximum size of an encoded batch. The
+            default is the limit for asynchronous invocations.
+        max_workers (int): The number of threads sending batches, which is
+            also the size of the connection pool.
+        lambda_client (LambdaClient): A client to use instead of the shared
+            client with a connection pool sized for `max_workers`.
+    """
+
+    def __init__(
+        self,
+        task_identifier: t.Optional[str] = None,
+        function_name: t.Optional[str] = None,
+        qualifier: t.Optional[str] = None,
+        encoder: t.Union[Encoder, EncoderName, None] = None,
+        max_payload_bytes: int = MAX_ASYNC_PAYLOAD_BYTES,
+        max_workers: int = 4,
+        lambda_client: t.Optional["LambdaClient"] = None,
+    ):
+        import threading
+
+        super().__init__(
+            task_identifier=task_identifier,
+            function_name=function_name,
+            qualifier=qualifier,
+            encoder=encoder,
+        )
+        self.max_payload_bytes = max_payload_bytes
+        self.max_workers = max_workers
+        self._client = lambda_client
+        self._lock = threading.Lock()
+        self._executor: t.Optional["ThreadPoolExecutor"] = None
+        self._futures: list["Future[None]"] = []
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        # The messages of batches whose invocation failed.
+        self._failed: list[list[bytes]] = []
+        self._closed = False
+        self._envelope_parts: t.Optional[tuple[bytes, bytes]] = None
+
+    def _get_client(self) -> "LambdaClient":
+        if self._client is None:
+            from botocore.config import Config
+            from werkit.aws_clients import get_client
+
+            self._client = get_client(
+                "lambda",
+                config=Config(
+                    max_pool_connections=self.max_workers, tcp_keepalive=True
+                ),
+            )
+        return self._client
+
+    def _envelope(self) -> tuple[bytes, bytes]:
+        """
+        Return the encoded batch message up to and after its payloads, so
+        already-encoded messages can be joined into it.
+        """
+        if self._envelope_parts is None:
+            task_identifier, _, _ = self._resolve()
+            # Keep this in sync with the BatchDestinationMessage interface.
+            prefix = self.encode({"taskIdentifier": task_identifier}).rstrip()[:-1]
+            self._envelope_parts = (prefix + b',"payloads":[', b"]}")
+        return self._envelope_parts
+
+    def _invoke_batch(self, messages: list[bytes]) -> None:
+        prefix, suffix = self._envelope()
+        try:
+            self._invoke(prefix + b",".join(messages) + suffix)
+        except BaseException:
+            with self._lock:
+                self._failed.append(messages)
+            raise
+
+    def _submit(self, messages: list[bytes]) -> None:
+        """
+        Submit the messages as one batch. The caller holds the lock.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Create the client up front, rather than racing to in the workers.
+        self._get_client()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="werkit-lambda-destination",
+            )
+        self._futures.append(self._executor.submit(self._invoke_batch, messages))
+
+    def _submit_pending(self) -> None:
+        """
+        Submit the pending messages as one batch. The caller holds the lock.
+        """
+        if not self._pending:
+            return
+        messages = self._pending
+        self._pending = []
+        self._pending_bytes = 0
+        self._submit(messages)
+
+    def send(self, message_key: t.Any, output_message: t.Any) -> None:
+        encoded = self.encode(output_message)
+        prefix, suffix = self._envelope()
+        overhead = len(prefix) + len(suffix)
+        if overhead + len(encoded) > self.max_payload_bytes:
+            raise ValueError(
+                f"Output message for {message_key!r} is {len(encoded)} bytes, "
+                + f"which exceeds the limit of {self.max_payload_bytes - overhead}"
+            )
+
+        with self._lock:
+            if self._closed:
+                raise ValueError("Destination is closed")
+            # Add one byte for the separating comma.
+            size_with_message = (
+                overhead + self._pending_bytes + len(self._pending) + len(encoded)
+            )
+            if size_with_message > self.max_payload_bytes:
+                self._submit_pending()
+            self._pending.append(encoded)
+            self._pending_bytes += len(encoded)
+
+    def flush(self) -> None:
+        """
+        Send any pending messages, and again the messages of failed batches,
+        and wait for every invocation to finish. Raise the first error
+        encountered, if any, keeping the messages of the failed batches.
+        """
+        with self._lock:
+            failed, self._failed = self._failed, []
+            for messages in failed:
+                self._submit(messages)
+            self._submit_pending()
+            futures, self._futures = self._futures, []
+
+        exceptions = [future.exception() for future in futures]
+        for exception in exceptions:
+            if exception is not None:
+                raise exception
+
+    def take_unsent(self) -> list[bytes]:
+        """
+        Remove and return the encoded output messages which haven't been
+        submitted, including those of failed batches, e.g. to hand them to a
+        fallback after `flush()` raises. Messages whose invocations are still
+        running aren't included.
+        """
+        with self._lock:
+            unsent = [message for messages in self._failed for message in messages]
+            unsent.extend(self._pending)
+            self._failed = []
+            self._pending = []
+            self._pending_bytes = 0
+        return unsent
+
+    def close(self) -> None:
+        """
+        Flush, then release the thread pool.
+        """
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                self._closed = True
+                executor, self._executor = self._executor, None
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def __enter__(self) -> "BatchingLambdaDestination":
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
@@ -0,0 +1,207 @@
+import random
+import threading
+import time
+import typing as t
+
+from werkit.compute import Destination
+
+CircuitState = t.Literal["closed", "open", "half_open"]
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised by `RetryingDestination` when the circuit breaker is open and there
+    is no fallback destination.
+    """
+
+
+class RetryingDestination(Destination):
+    """
+    Wrap a destination, retrying failed sends with exponential backoff and
+    full jitter, so a throttled or briefly unavailable destination doesn't
+    lose an already-computed result.
+
+    Retries are limited by a retry budget, a token bucket which holds at most
+    `retry_budget` tokens. Each retry spends a token, and each send deposits
+    `retry_budget_ratio` tokens, so under sustained failure retries add at
+    most that fraction of extra load.
+
+    A circuit breaker opens after `failure_threshold` consecutive failed
+    attempts. While it's open, sends fail fast without reaching the wrapped
+    destination. After `reset_timeout_seconds`, a single send is let through:
+    if it succeeds the circuit closes, and otherwise it opens again.
+
+    When a send fails for good, or the circuit is open, the message is sent to
+    the `fallback` destination, e.g. one which writes to local disk. Without one,
+    the last error, or a `CircuitOpenError`, is raised.
+
+    `send_batch()` is retried as a unit, using the wrapped destination's
+    `send_batch()`.
+
+    Args:
+        destination (werkit.compute.Destination): The destination to wrap.
+        max_attempts (int): The maximum number of attempts per send,
+            including the first.
+        base_delay_seconds (float): The backoff before the first retry, before
+            jitter. It doubles with each retry.
+        max_delay_seconds (float): The maximum backoff, before jitter.
+        retry_budget (float): The capacity of the retry budget, which starts
+            out full.
+        retry_budget_ratio (float): The tokens deposited by each send.
+        failure_threshold (int): The number of consecutive failed attempts
+            which opens the circuit.
+        reset_timeout_seconds (float): How long the circuit stays open.
+        fallback (werkit.compute.Destination): A destination for messages
+            which can't be delivered.
+        retry_on (tuple): The exception types which are retried. Others fail
+            the send immediately, though they still count toward the circuit
+            breaker.
+        sleep (callable): Used to wait between attempts.
+        clock (callable): A monotonic clock, in seconds.
+        random (callable): Returns a random float in `[0, 1)`, for jitter.
+    """
+
+    def __init__(
+        self,
+        destination: Destination,
+        max_attempts: int = 5,
+        base_delay_seconds: float = 0.1,
+        max_delay_seconds: float = 10.0,
+        retry_budget: float = 10.0,
+        retry_budget_ratio: float = 0.1,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        fallback: t.Optional[Destination] = None,
+        retry_on: tuple[t.Type[BaseException], ...] = (Exception,),
+        sleep: t.Callable[[float], None] = time.sleep,
+        clock: t.Callable[[], float] = time.monotonic,
+        random: t.Callable[[], float] = random.random,
+    ):
+        if max_attempts < 1:
+            raise ValueError("Expected max_attempts to be at least 1")
+        self.destination = destination
+        self.max_attempts = max_attempts
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.retry_budget = retry_budget
+        self.retry_budget_ratio = retry_budget_ratio
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.fallback = fallback
+        self.retry_on = retry_on
+        self.sleep = sleep
+        self.clock = clock
+        self.random = random
+
+        self._lock = threading.Lock()
+        self._retry_tokens = retry_budget
+        self._consecutive_failures = 0
+        self._opened_at: t.Optional[float] = None
+        self._trial_in_progress = False
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            elif self.clock() - self._opened_at < self.reset_timeout_seconds:
+                return "open"
+            else:
+                return "half_open"
+
+    def _backoff_seconds(self, retry: int) -> float:
+        return self.random() * min(
+            self.max_delay_seconds, self.base_delay_seconds * 2**retry
+        )
+
+    def _may_attempt(self) -> bool:
+        """
+        Whether the circuit lets an attempt through. In the half-open state,
+        only one trial is let through at a time.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            elif self.clock() - self._opened_at < self.reset_timeout_seconds:
+                return False
+            elif self._trial_in_progress:
+                return False
+            else:
+                self._trial_in_progress = True
+                return True
+
+    def _note_attempt(self, succeeded: bool) -> None:
+        with self._lock:
+            self._trial_in_progress = False
+            if succeeded:
+                self._consecutive_failures = 0
+                self._opened_at = None
+            else:
+                self._consecutive_failures += 1
+                if (
+                    self._opened_at is not None
+                    or self._consecutive_failures >= self.failure_threshold
+                ):
+                    self._opened_at = self.clock()
+
+    def _withdraw_retry_token(self) -> bool:
+        with self._lock:
+            if self._retry_tokens >= 1:
+                self._retry_tokens -= 1
+                return True
+            else:
+                return False
+
+    def _deposit(self) -> None:
+        with self._lock:
+            self._retry_tokens = min(
+                self.retry_budget, self._retry_tokens + self.retry_budget_ratio
+            )
+
+    def _attempt(self, operation: t.Callable[[], None]) -> None:
+        """
+        Run the operation, retrying as permitted. Raise the last error, or a
+        `CircuitOpenError`.
+        """
+        self._deposit()
+        for attempt in range(self.max_attempts):
+            if not self._may_attempt():
+                raise CircuitOpenError("Circuit breaker is open")
+            try:
+                operation()
+            except self.retry_on:
+                self._note_attempt(succeeded=False)
+                if (
+                    attempt + 1 == self.max_attempts
+                    or self.circuit_state == "open"
+                    or not self._withdraw_retry_token()
+                ):
+                    raise
+                self.sleep(self._backoff_seconds(attempt))
+            except BaseException:
+                self._note_attempt(succeeded=False)
+                raise
+            else:
+                self._note_attempt(succeeded=True)
+                return
+
+    def _send_with_fallback(
+        self,
+        operation: t.Callable[[Destination], None],
+    ) -> None:
+        try:
+            self._attempt(lambda: operation(self.destination))
+        except Exception:
+            if self.fallback is None:
+                raise
+            operation(self.fallback)
+
+    def send(self, message_key: t.Any, output_message: t.Any) -> None:
+        self._send_with_fallback(
+            lambda destination: destination.send(
+                message_key=message_key, output_message=output_message
+            )
+        )
+
+    def send_batch(self, messages: t.Sequence[tuple[t.Any, t.Any]]) -> None:
+        self._send_with_fallback(lambda destination: destination.send_batch(messages))
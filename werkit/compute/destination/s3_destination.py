@@ -0,0 +1,267 @@
+import hashlib
+import io
+import typing as t
+
+from werkit.compute import Destination, Encoder, EncoderName, get_encoder
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from boto3.s3.transfer import TransferConfig
+    from mypy_boto3_s3.client import S3Client
+
+Compression = t.Literal["none", "gzip", "zstd"]
+
+_CONTENT_ENCODINGS: dict[Compression, t.Optional[str]] = {
+    "none": None,
+    "gzip": "gzip",
+    "zstd": "zstd",
+}
+_EXTENSIONS: dict[Compression, str] = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+# Small enough to leave room for the destination's envelope within the 256 KB
+# limit on asynchronous Lambda invocations.
+DEFAULT_CLAIM_CHECK_THRESHOLD_BYTES = 200 * 1024
+
+
+class ClaimCheck(t.TypedDict):
+    """
+    Keep this in sync with the ClaimCheck interface.
+    """
+
+    bucket: str
+    key: str
+    compression: Compression
+    size_bytes: int
+
+
+def compress(body: bytes, compression: Compression) -> bytes:
+    if compression == "none":
+        return body
+    elif compression == "gzip":
+        import gzip
+
+        return gzip.compress(body, mtime=0)
+    elif compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor().compress(body)
+    else:
+        raise ValueError(f"Unknown compression: {compression}")
+
+
+def decompress(body: bytes, compression: Compression) -> bytes:
+    if compression == "none":
+        return body
+    elif compression == "gzip":
+        import gzip
+
+        return gzip.decompress(body)
+    elif compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    else:
+        raise ValueError(f"Unknown compression: {compression}")
+
+
+def default_key_for(message_key: t.Any) -> str:
+    """
+    A key derived from a digest of the message key, so the same message key
+    always maps to the same object.
+    """
+    import json
+
+    return hashlib.sha256(
+        json.dumps(message_key, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+
+
+class S3Destination(Destination):
+    """
+    Write each output message to an S3 object, optionally compressed using
+    gzip or zstd. (zstd requires the `zstandard` package.)
+
+    Objects are written using `upload_fileobj()`, which switches to a
+    concurrent multipart upload for large bodies, as tuned by
+    `transfer_config`.
+
+    Args:
+        bucket (str): The bucket.
+        prefix (str): Prepended to every key.
+        key_for (callable): Compute the key, before the prefix and extension,
+            from the message key. The default is a SHA-256 digest of the
+            message key.
+        compression (str): `"none"`, `"gzip"`, or `"zstd"`.
+        encoder (werkit.compute.Encoder): The output message encoder, given as
+            an instance or by name.
+        s3_client (S3Client): The client to use. By default, the shared client
+            from `werkit.aws_clients` is used.
+        transfer_config (boto3.s3.transfer.TransferConfig): Multipart
+            thresholds and concurrency.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        key_for: t.Callable[[t.Any], str] = default_key_for,
+        compression: Compression = "none",
+        encoder: t.Union[Encoder, EncoderName, None] = None,
+        s3_client: t.Optional["S3Client"] = None,
+        transfer_config: t.Optional["TransferConfig"] = None,
+    ):
+        if compression not in t.get_args(Compression):
+            raise ValueError(f"Unknown compression: {compression}")
+        self.bucket = bucket
+        self.prefix = prefix
+        self.key_for = key_for
+        self.compression = compression
+        self.encoder = encoder
+        self._s3_client = s3_client
+        self.transfer_config = transfer_config
+
+    @property
+    def s3_client(self) -> "S3Client":
+        if self._s3_client is None:
+            from werkit.aws_clients import get_client
+
+            self._s3_client = get_client("s3")
+        return self._s3_client
+
+    def object_key(self, message_key: t.Any) -> str:
+        return f"{self.prefix}{self.key_for(message_key)}.json{_EXTENSIONS[self.compression]}"
+
+    def upload(self, message_key: t.Any, encoded_output_message: bytes) -> ClaimCheck:
+        """
+        Compress and upload an already-encoded output message. Return a claim
+        check pointing to it.
+        """
+        key = self.object_key(message_key)
+        body = compress(encoded_output_message, self.compression)
+
+        extra_args = {"ContentType": "application/json"}
+        content_encoding = _CONTENT_ENCODINGS[self.compression]
+        if content_encoding is not None:
+            extra_args["ContentEncoding"] = content_encoding
+
+        if self.transfer_config is None:
+            self.s3_client.upload_fileobj(
+                io.BytesIO(body), self.bucket, key, ExtraArgs=extra_args
+            )
+        else:
+            self.s3_client.upload_fileobj(
+                io.BytesIO(body),
+                self.bucket,
+                key,
+                ExtraArgs=extra_args,
+                Config=self.transfer_config,
+            )
+
+        return {
+            "bucket": self.bucket,
+            "key": key,
+            "compression": self.compression,
+            "size_bytes": len(body),
+        }
+
+    def send(self, message_key: t.Any, output_message: t.Any) -> None:
+        self.upload(message_key, self.encode(output_message))
+
+
+def fetch_claim_check(
+    claim_check: ClaimCheck, s3_client: t.Optional["S3Client"] = None
+) -> t.Any:
+    """
+    Download and decode the output message a claim check points to.
+    """
+    import json
+
+    if s3_client is None:
+        from werkit.aws_clients import get_client
+
+        s3_client = get_client("s3")
+
+    response = s3_client.get_object(
+        Bucket=claim_check["bucket"], Key=claim_check["key"]
+    )
+    return json.loads(decompress(response["Body"].read(), claim_check["compression"]))
+
+
+def resolve_claim_check(
+    message: t.Any, s3_client: t.Optional["S3Client"] = None
+) -> t.Any:
+    """
+    Given a message received from a `ClaimCheckDestination`, return the output
+    message, fetching it from S3 if needed.
+    """
+    if isinstance(message, dict) and "claim_check" in message:
+        return fetch_claim_check(message["claim_check"], s3_client=s3_client)
+    else:
+        return message
+
+
+class ClaimCheckDestination(Destination):
+    """
+    Send small output messages through a primary destination, such as a
+    `LambdaDestination`, and offload large ones to S3, sending only a pointer
+    to the object through the primary destination:
+
+        {"message_key": ..., "claim_check": {"bucket": ..., "key": ...}}
+
+    Receivers can use `resolve_claim_check()` to handle either kind of message.
+
+    Each output message is encoded to measure it. A small message is then
+    encoded again by the primary destination, which is the cost of deciding
+    where to send it. (The primary destination's payload generally wraps the
+    output message, so the measured bytes can't be reused.) Large messages
+    are encoded once.
+
+    Args:
+        destination (werkit.compute.Destination): The primary destination.
+        s3_destination (S3Destination): Where large output messages are
+            written.
+        threshold_bytes (int): Output messages which encode to more than this
+            many bytes are offloaded.
+        encoder (werkit.compute.Encoder): The encoder used to measure the
+            output messages and to encode the ones which are offloaded.
+            Defaults to the primary destination's `encoder`, so messages are
+            measured as it encodes them.
+    """
+
+    def __init__(
+        self,
+        destination: Destination,
+        s3_destination: S3Destination,
+        threshold_bytes: int = DEFAULT_CLAIM_CHECK_THRESHOLD_BYTES,
+        encoder: t.Union[Encoder, EncoderName, None] = None,
+    ):
+        self.destination = destination
+        self.s3_destination = s3_destination
+        self.threshold_bytes = threshold_bytes
+        self.encoder = encoder
+
+    def encode(self, value: t.Any) -> bytes:
+        if self.encoder is None:
+            self.encoder = get_encoder(self.destination.encoder)
+        return super().encode(value)
+
+    def _message_for(self, message_key: t.Any, output_message: t.Any) -> t.Any:
+        encoded = self.encode(output_message)
+        if len(encoded) <= self.threshold_bytes:
+            return output_message
+        claim_check = self.s3_destination.upload(message_key, encoded)
+        # Keep this in sync with the ClaimCheckMessage interface.
+        return {"message_key": message_key, "claim_check": claim_check}
+
+    def send(self, message_key: t.Any, output_message: t.Any) -> None:
+        self.destination.send(
+            message_key=message_key,
+            output_message=self._message_for(message_key, output_message),
+        )
+
+    def send_batch(self, messages: t.Sequence[tuple[t.Any, t.Any]]) -> None:
+        self.destination.send_batch(
+            [
+                (message_key, self._message_for(message_key, output_message))
+                for message_key, output_message in messages
+            ]
+        )
@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+import typing as t
+import pytest
+from werkit.compute import AsyncDestination, Destination
+from werkit.compute.destination.fan_out_destination import (
+    AsyncFanOutDestination,
+    FanOutDestination,
+    FanOutError,
+)
+
+
+class SlowDestination(Destination):
+    def __init__(
+        self, delay_seconds: float = 0, error: t.Optional[Exception] = None
+    ) -> None:
+        self.delay_seconds = delay_seconds
+        self.error = error
+        self.sent: list[tuple[t.Any, t.Any]] = []
+
+    def send(self, message_key: t.Any, output_message: t.Any) -> None:
+        time.sleep(self.delay_seconds)
+        if self.error:
+            raise self.error
+        self.sent.append((message_key, output_message))
+
+
+class SlowAsyncDestination(AsyncDestination):
+    def __init__(self, delay_seconds: float = 0) -> None:
+        self.delay_seconds = delay_seconds
+        self.sent: list[tuple[t.Any, t.Any]] = []
+
+    async def asend(self, message_key: t.Any, output_message: t.Any) -> None:
+        await asyncio.sleep(self.delay_seconds)
+        self.sent.append((message_key, output_message))
+
+
+def test_fan_out_destination_sends_concurrently() -> None:
+    targets = [SlowDestination(delay_seconds=0.2) for _ in range(3)]
+    destination = FanOutDestination(targets)
+
+    start = time.monotonic()
+    destination.send(1, "one")
+    elapsed = time.monotonic() - start
+
+    assert all(target.sent == [(1, "one")] for target in targets)
+    assert elapsed < 0.4
+    destination.close()
+
+
+def test_fan_out_destination_send_batch() -> None:
+    targets = [SlowDestination(), SlowDestination()]
+    destination = FanOutDestination(targets)
+    destination.send_batch([(1, "one"), (2, "two")])
+    assert all(target.sent == [(1, "one"), (2, "two")] for target in targets)
+    destination.close()
+
+
+def test_fan_out_destination_policy_all() -> None:
+    ok = SlowDestination()
+    destination = FanOutDestination([ok, SlowDestination(error=RuntimeError("No"))])
+
+    with pytest.raises(FanOutError, match="destination 1") as exc_info:
+        destination.send(1, "one")
+
+    assert list(exc_info.value.errors.keys()) == [1]
+    assert ok.sent == [(1, "one")]
+
+
+def test_fan_out_destination_policy_any() -> None:
+    errors: list[tuple[Destination, BaseException]] = []
+    failing = SlowDestination(error=RuntimeError("No"))
+    destination = FanOutDestination(
+        [SlowDestination(), failing],
+        policy="any",
+        on_error=lambda target, error: errors.append((target, error)),
+    )
+    destination.send(1, "one")
+    assert [(target, str(error)) for target, error in errors] == [(failing, "No")]
+
+    destination = FanOutDestination([failing, failing], policy="any")
+    with pytest.raises(FanOutError):
+        destination.send(1, "one")
+
+
+def test_fan_out_destination_policy_best_effort() -> None:
+    destination = FanOutDestination(
+        [SlowDestination(error=RuntimeError("No"))], policy="best_effort"
+    )
+    destination.send(1, "one")
+
+
+def test_fan_out_destination_timeout() -> None:
+    fast = SlowDestination()
+    slow = SlowDestination(delay_seconds=0.4)
+    destination = FanOutDestination([fast, slow], timeout_seconds=[None, 0.1])
+
+    start = time.monotonic()
+    with pytest.raises(FanOutError) as exc_info:
+        destination.send(1, "one")
+
+    assert time.monotonic() - start < 0.3
+    assert isinstance(exc_info.value.errors[1], TimeoutError)
+    assert fast.sent == [(1, "one")]
+
+    # Sends which time out run to completion in the background.
+    destination.close()
+    assert slow.sent == [(1, "one")]
+
+
+def test_fan_out_destination_validates_arguments() -> None:
+    with pytest.raises(ValueError, match="at least one destination"):
+        FanOutDestination([])
+    with pytest.raises(ValueError, match="Unknown policy"):
+        FanOutDestination([SlowDestination()], policy=t.cast(t.Any, "most"))
+    with pytest.raises(ValueError, match="one timeout per destination"):
+        FanOutDestination([SlowDestination()], timeout_seconds=[1, 2])
+
+
+def test_async_fan_out_destination() -> None:
+    async_target = SlowAsyncDestination(delay_seconds=0.2)
+    sync_target = SlowDestination(delay_seconds=0.2)
+    destination = AsyncFanOutDestination([async_target, sync_target])
+
+    start = time.monotonic()
+    asyncio.run(destination.asend(1, "one"))
+
+    assert time.monotonic() - start < 0.4
+    assert async_target.sent == [(1, "one")]
+    assert sync_target.sent == [(1, "one")]
+
+    asyncio.run(destination.asend_batch([(2, "two")]))
+    assert async_target.sent == [(1, "one"), (2, "two")]
+    assert sync_target.sent == [(1, "one"), (2, "two")]
+
+
+def test_async_fan_out_destination_timeout_cancels_async_send() -> None:
+    slow = SlowAsyncDestination(delay_seconds=1)
+    destination = AsyncFanOutDestination(
+        [slow, SlowDestination()], policy="any", timeout_seconds=0.1
+    )
+    errors: list[BaseException] = []
+    destination.on_error = lambda _, error: errors.append(error)
+
+    asyncio.run(destination.asend(1, "one"))
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], TimeoutError)
+    assert slow.sent == []
+
+
+def test_fan_out_destination_is_thread_safe() -> None:
+    target = SlowDestination()
+    destination = FanOutDestination([target, SlowDestination()])
+
+    threads = [
+        threading.Thread(target=destination.send, args=(index, "message"))
+        for index in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(key for key, _ in target.sent) == list(range(10))
+    destination.close()
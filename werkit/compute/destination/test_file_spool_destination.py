@@ -0,0 +1,208 @@
+import typing as t
+from pathlib import Path
+import pytest
+from werkit.compute import Destination
+from werkit.compute.destination.file_spool_destination import (
+    FileSpoolDestination,
+    SpoolCorruptionError,
+    SpoolReplayer,
+    read_spool,
+)
+
+
+class RecordingBatchDestination(Destination):
+    def __init__(self) -> None:
+        self.batches: list[list[tuple[t.Any, t.Any]]] = []
+
+    def send(self, message_key: t.Any, output_message: t.Any) -> None:
+        raise NotImplementedError()
+
+    def send_batch(self, messages: t.Sequence[tuple[t.Any, t.Any]]) -> None:
+        self.batches.append(list(messages))
+
+    @property
+    def sent(self) -> list[tuple[t.Any, t.Any]]:
+        return [message for batch in self.batches for message in batch]
+
+
+def output_message(index: int) -> dict[str, t.Any]:
+    return {"message_key": {"id": index}, "success": True, "result": index}
+
+
+def spool_messages(path: Path, indices: t.Iterable[int]) -> None:
+    with FileSpoolDestination(path) as spool:
+        for index in indices:
+            spool.send({"id": index}, output_message(index))
+
+
+def test_file_spool_destination_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "spool.log"
+    with FileSpoolDestination(path) as spool:
+        spool.send({"id": 0}, output_message(0))
+        spool.send_batch(
+            [({"id": 1}, output_message(1)), ({"id": 2}, output_message(2))]
+        )
+
+    records = list(read_spool(path))
+
+    assert [(key, message) for _, key, message in records] == [
+        ({"id": index}, output_message(index)) for index in range(3)
+    ]
+    assert records[-1][0] == path.stat().st_size
+
+
+def test_file_spool_destination_batches_fsync(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import os
+
+    synced: list[int] = []
+    monkeypatch.setattr(os, "fsync", synced.append)
+
+    spool = FileSpoolDestination(
+        tmp_path / "spool.log", fsync_every=3, fsync_interval_seconds=60
+    )
+    for index in range(7):
+        spool.send({"id": index}, output_message(index))
+    assert len(synced) == 2
+
+    spool.send_batch([({"id": 7}, output_message(7))])
+    assert len(synced) == 3
+
+    spool.flush()
+    assert len(synced) == 3
+    spool.close()
+
+
+def test_read_spool_stops_at_truncated_record(tmp_path: Path) -> None:
+    path = tmp_path / "spool.log"
+    spool_messages(path, range(2))
+    complete_size = path.stat().st_size
+    with open(path, "ab") as f:
+        f.write(b"\x00\x00\x01\x00\x00")
+
+    assert len(list(read_spool(path))) == 2
+
+    with open(path, "r+b") as f:
+        f.truncate(complete_size - 3)
+    assert len(list(read_spool(path))) == 1
+
+
+def test_read_spool_detects_corruption(tmp_path: Path) -> None:
+    path = tmp_path / "spool.log"
+    spool_messages(path, range(2))
+    contents = bytearray(path.read_bytes())
+    contents[10] ^= 0xFF
+    path.write_bytes(bytes(contents))
+
+    with pytest.raises(SpoolCorruptionError, match="offset 0"):
+        list(read_spool(path))
+
+
+def test_spool_replayer(tmp_path: Path) -> None:
+    path = tmp_path / "spool.log"
+    spool_messages(path, range(5))
+    destination = RecordingBatchDestination()
+    replayer = SpoolReplayer(path, destination, batch_size=2)
+
+    assert replayer.replay() == 5
+    assert [len(batch) for batch in destination.batches] == [2, 2, 1]
+    assert destination.sent == [({"id": i}, output_message(i)) for i in range(5)]
+    assert replayer.offset == path.stat().st_size
+
+    assert replayer.replay() == 0
+
+    spool_messages(path, range(5, 7))
+    assert SpoolReplayer(path, destination).replay() == 2
+    assert len(destination.sent) == 7
+
+
+def test_spool_replayer_dedupes_by_message_key(tmp_path: Path) -> None:
+    path = tmp_path / "spool.log"
+    spool_messages(path, [0, 1, 0, 2, 1])
+    destination = RecordingBatchDestination()
+
+    assert SpoolReplayer(path, destination).replay() == 3
+    assert [key for key, _ in destination.sent] == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+
+def test_spool_replayer_without_dedupe(tmp_path: Path) -> None:
+    path = tmp_path / "spool.log"
+    spool_messages(path, [0, 0])
+    destination = RecordingBatchDestination()
+
+    assert SpoolReplayer(path, destination, dedupe_capacity=0).replay() == 2
+
+
+def test_spool_replayer_resumes_after_failure(tmp_path: Path) -> None:
+    path = tmp_path / "spool.log"
+    spool_messages(path, range(4))
+    destination = RecordingBatchDestination()
+    replayer = SpoolReplayer(path, destination, batch_size=2)
+
+    original_send_batch = destination.send_batch
+    calls = 0
+
+    def fail_second_batch(messages: t.Sequence[tuple[t.Any, t.Any]]) -> None:
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise RuntimeError("Network blip")
+        original_send_batch(messages)
+
+    setattr(destination, "send_batch", fail_second_batch)
+    with pytest.raises(RuntimeError, match="Network blip"):
+        replayer.replay()
+    assert [key for key, _ in destination.sent] == [{"id": 0}, {"id": 1}]
+
+    # The failed batch is sent by the next replay, and isn't treated as a
+    # duplicate.
+    assert replayer.replay() == 2
+    assert [key for key, _ in destination.sent] == [{"id": i} for i in range(4)]
+
+
+def test_spool_replayer_compacts_the_spool(tmp_path: Path) -> None:
+    path = tmp_path / "spool.log"
+    destination = RecordingBatchDestination()
+    with FileSpoolDestination(path) as spool:
+        for index in range(3):
+            spool.send({"id": index}, output_message(index))
+        spool.flush()
+
+        replayer = SpoolReplayer(path, destination)
+        assert replayer.replay() == 3
+        assert path.stat().st_size == 0
+        assert replayer.offset == 0
+
+        # The open writer appends to the compacted spool.
+        spool.send({"id": 3}, output_message(3))
+        spool.flush()
+
+    assert SpoolReplayer(path, destination).replay() == 1
+    assert destination.sent == [({"id": i}, output_message(i)) for i in range(4)]
+    assert path.stat().st_size == 0
+
+
+def test_spool_replayer_without_compaction(tmp_path: Path) -> None:
+    path = tmp_path / "spool.log"
+    spool_messages(path, range(2))
+    replayer = SpoolReplayer(path, RecordingBatchDestination(), compact=False)
+
+    assert replayer.replay() == 2
+    assert replayer.offset == path.stat().st_size > 0
+
+
+def test_spool_replayer_dedupes_across_restarts(tmp_path: Path) -> None:
+    path = tmp_path / "spool.log"
+    spool_messages(path, [0, 1])
+    destination = RecordingBatchDestination()
+    assert SpoolReplayer(path, destination, compact=False).replay() == 2
+
+    spool_messages(path, [1, 2])
+    assert SpoolReplayer(path, destination, compact=False).replay() == 1
+    assert [key for key, _ in destination.sent] == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+
+def test_spool_replayer_without_spool(tmp_path: Path) -> None:
+    destination = RecordingBatchDestination()
+    assert SpoolReplayer(tmp_path / "missing.log", destination).replay() == 0
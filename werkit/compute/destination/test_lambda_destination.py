@@ -0,0 +1,192 @@
+import json
+import threading
+import typing as t
+import pytest
+from werkit.aws_clients import override_client
+from werkit.compute.destination.lambda_destination import (
+    BatchingLambdaDestination,
+    LambdaDestination,
+)
+
+
+class FakeLambdaClient:
+    def __init__(self, error: t.Optional[Exception] = None) -> None:
+        self.error = error
+        self.invocations: list[dict[str, t.Any]] = []
+        self._lock = threading.Lock()
+
+    def invoke(self, **kwargs: t.Any) -> None:
+        if self.error:
+            raise self.error
+        with self._lock:
+            self.invocations.append(kwargs)
+
+    def payloads(self) -> list[t.Any]:
+        return [json.loads(invocation["Payload"]) for invocation in self.invocations]
+
+
+def output_message(index: int, size: int = 10) -> dict[str, t.Any]:
+    return {"message_key": index, "success": True, "result": "x" * size}
+
+
+def test_lambda_destination(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = FakeLambdaClient()
+    monkeypatch.setenv("DESTINATION_LAMBDA_TASK_IDENTIFIER", "my-task")
+    monkeypatch.setenv("DESTINATION_LAMBDA_FUNCTION_NAME", "my-function")
+    monkeypatch.delenv("DESTINATION_LAMBDA_QUALIFIER", raising=False)
+
+    destination = LambdaDestination()
+    with override_client("lambda", client):
+        destination.send(1, output_message(1))
+        monkeypatch.setenv("DESTINATION_LAMBDA_TASK_IDENTIFIER", "ignored")
+        destination.send(2, output_message(2))
+
+    assert [invocation["FunctionName"] for invocation in client.invocations] == [
+        "my-function",
+        "my-function",
+    ]
+    assert "Qualifier" not in client.invocations[0]
+    assert client.payloads() == [
+        {"taskIdentifier": "my-task", "payload": output_message(1)},
+        {"taskIdentifier": "my-task", "payload": output_message(2)},
+    ]
+
+
+def test_lambda_destination_requires_function_name(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("DESTINATION_LAMBDA_FUNCTION_NAME", raising=False)
+    destination = LambdaDestination(task_identifier="my-task")
+    with pytest.raises(ValueError, match="DESTINATION_LAMBDA_FUNCTION_NAME"):
+        destination.send(1, output_message(1))
+
+
+def create_batching_destination(
+    client: FakeLambdaClient, **kwargs: t.Any
+) -> BatchingLambdaDestination:
+    return BatchingLambdaDestination(
+        task_identifier="my-task",
+        function_name="my-function",
+        qualifier="live",
+        lambda_client=t.cast(t.Any, client),
+        **kwargs,
+    )
+
+
+def test_batching_lambda_destination_coalesces_messages() -> None:
+    client = FakeLambdaClient()
+    destination = create_batching_destination(client)
+
+    for index in range(5):
+        destination.send(index, output_message(index))
+    assert client.invocations == []
+
+    destination.flush()
+
+    assert len(client.invocations) == 1
+    assert client.invocations[0]["Qualifier"] == "live"
+    assert client.invocations[0]["InvocationType"] == "Event"
+    assert client.payloads() == [
+        {
+            "taskIdentifier": "my-task",
+            "payloads": [output_message(index) for index in range(5)],
+        }
+    ]
+
+    destination.flush()
+    assert len(client.invocations) == 1
+    destination.close()
+
+
+@pytest.mark.parametrize("encoder", ["missouri", "standard"])
+def test_batching_lambda_destination_respects_max_payload_bytes(
+    encoder: t.Any,
+) -> None:
+    client = FakeLambdaClient()
+    max_payload_bytes = 1000
+    with create_batching_destination(
+        client, max_payload_bytes=max_payload_bytes, encoder=encoder
+    ) as destination:
+        for index in range(50):
+            destination.send(index, output_message(index, size=100))
+
+    assert len(client.invocations) > 1
+    assert all(
+        len(invocation["Payload"]) <= max_payload_bytes
+        for invocation in client.invocations
+    )
+    # Every batch but the last fills up, since each message is ~120 bytes.
+    # The batches may be sent in any order.
+    sizes = sorted(len(invocation["Payload"]) for invocation in client.invocations)
+    assert all(size > max_payload_bytes - 150 for size in sizes[1:])
+
+    received = [
+        message for payload in client.payloads() for message in payload["payloads"]
+    ]
+    assert sorted(received, key=lambda message: message["message_key"]) == [
+        output_message(index, size=100) for index in range(50)
+    ]
+
+
+def test_batching_lambda_destination_rejects_oversized_message() -> None:
+    destination = create_batching_destination(FakeLambdaClient(), max_payload_bytes=100)
+    with pytest.raises(ValueError, match="exceeds the limit"):
+        destination.send(1, output_message(1, size=100))
+
+
+def test_batching_lambda_destination_flush_raises_send_error() -> None:
+    client = FakeLambdaClient(error=RuntimeError("Throttled"))
+    destination = create_batching_destination(client)
+    destination.send(1, output_message(1))
+    with pytest.raises(RuntimeError, match="Throttled"):
+        destination.flush()
+    # The failed batch is kept, and retried by the next flush.
+    with pytest.raises(RuntimeError, match="Throttled"):
+        destination.flush()
+
+    client.error = None
+    destination.send(2, output_message(2))
+    destination.flush()
+
+    received = [
+        message for payload in client.payloads() for message in payload["payloads"]
+    ]
+    assert sorted(received, key=lambda message: message["message_key"]) == [
+        output_message(1),
+        output_message(2),
+    ]
+    destination.flush()
+    assert len(client.invocations) == 2
+
+
+def test_batching_lambda_destination_take_unsent_after_throttling() -> None:
+    client = FakeLambdaClient(error=RuntimeError("Throttled"))
+    destination = create_batching_destination(client, max_payload_bytes=200)
+    # Each message is ~60 bytes, so the first batch is sent from `send()`.
+    for index in range(4):
+        destination.send(index, output_message(index))
+    with pytest.raises(RuntimeError, match="Throttled"):
+        destination.flush()
+
+    unsent = destination.take_unsent()
+    assert sorted(
+        (json.loads(message) for message in unsent),
+        key=lambda message: message["message_key"],
+    ) == [output_message(index) for index in range(4)]
+
+    client.error = None
+    destination.flush()
+    assert destination.take_unsent() == []
+    assert client.invocations == []
+    destination.close()
+
+
+def test_batching_lambda_destination_close() -> None:
+    client = FakeLambdaClient()
+    destination = create_batching_destination(client)
+    destination.send(1, output_message(1))
+    destination.close()
+
+    assert len(client.invocations) == 1
+    with pytest.raises(ValueError, match="Destination is closed"):
+        destination.send(2, output_message(2))
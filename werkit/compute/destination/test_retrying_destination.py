@@ -0,0 +1,194 @@
+import typing as t
+import pytest
+from werkit.compute import Destination
+from werkit.compute.destination.retrying_destination import (
+    CircuitOpenError,
+    RetryingDestination,
+)
+
+
+class Throttled(Exception):
+    pass
+
+
+class FlakyDestination(Destination):
+    def __init__(self, failures: int = 0, error: Exception = Throttled()) -> None:
+        self.failures = failures
+        self.error = error
+        self.attempts = 0
+        self.sent: list[tuple[t.Any, t.Any]] = []
+
+    def send(self, message_key: t.Any, output_message: t.Any) -> None:
+        self.attempts += 1
+        if self.failures:
+            self.failures -= 1
+            raise self.error
+        self.sent.append((message_key, output_message))
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def create_destination(
+    destination: Destination, clock: FakeClock, **kwargs: t.Any
+) -> RetryingDestination:
+    return RetryingDestination(
+        destination, sleep=clock.sleep, clock=clock, random=lambda: 0.5, **kwargs
+    )
+
+
+def test_retrying_destination_retries_with_backoff() -> None:
+    clock = FakeClock()
+    flaky = FlakyDestination(failures=3)
+    destination = create_destination(flaky, clock, base_delay_seconds=1.0)
+
+    destination.send(1, "one")
+
+    assert flaky.sent == [(1, "one")]
+    assert flaky.attempts == 4
+    # Full jitter with `random()` returning 0.5 halves each exponential step.
+    assert clock.sleeps == [0.5, 1.0, 2.0]
+    assert destination.circuit_state == "closed"
+
+
+def test_retrying_destination_caps_backoff() -> None:
+    clock = FakeClock()
+    destination = create_destination(
+        FlakyDestination(failures=4),
+        clock,
+        base_delay_seconds=1.0,
+        max_delay_seconds=3.0,
+    )
+    destination.send(1, "one")
+    assert clock.sleeps == [0.5, 1.0, 1.5, 1.5]
+
+
+def test_retrying_destination_raises_after_max_attempts() -> None:
+    clock = FakeClock()
+    flaky = FlakyDestination(failures=10)
+    destination = create_destination(flaky, clock, max_attempts=3)
+
+    with pytest.raises(Throttled):
+        destination.send(1, "one")
+    assert flaky.attempts == 3
+
+
+def test_retrying_destination_does_not_retry_other_errors() -> None:
+    clock = FakeClock()
+    flaky = FlakyDestination(failures=1, error=ValueError("Bad payload"))
+    destination = create_destination(flaky, clock, retry_on=(Throttled,))
+
+    with pytest.raises(ValueError, match="Bad payload"):
+        destination.send(1, "one")
+    assert flaky.attempts == 1
+
+
+def test_retrying_destination_retry_budget() -> None:
+    clock = FakeClock()
+    flaky = FlakyDestination(failures=100)
+    destination = create_destination(
+        flaky,
+        clock,
+        max_attempts=10,
+        retry_budget=3,
+        retry_budget_ratio=0.5,
+        failure_threshold=1000,
+    )
+
+    with pytest.raises(Throttled):
+        destination.send(1, "one")
+    # The first attempt, then three retries.
+    assert flaky.attempts == 4
+
+    # The deposit is half a token, which isn't enough for a retry.
+    with pytest.raises(Throttled):
+        destination.send(2, "two")
+    assert flaky.attempts == 5
+
+    # Now there's a whole token.
+    with pytest.raises(Throttled):
+        destination.send(3, "three")
+    assert flaky.attempts == 7
+
+
+def test_retrying_destination_circuit_breaker() -> None:
+    clock = FakeClock()
+    flaky = FlakyDestination(failures=5)
+    destination = create_destination(
+        flaky,
+        clock,
+        max_attempts=10,
+        failure_threshold=3,
+        reset_timeout_seconds=60,
+    )
+
+    with pytest.raises(Throttled):
+        destination.send(1, "one")
+    assert flaky.attempts == 3
+    assert destination.circuit_state == "open"
+
+    with pytest.raises(CircuitOpenError):
+        destination.send(2, "two")
+    assert flaky.attempts == 3
+
+    # After the timeout, a trial send fails, which opens the circuit again.
+    clock.now += 60
+    assert destination.circuit_state == "half_open"
+    with pytest.raises(Throttled):
+        destination.send(3, "three")
+    assert flaky.attempts == 4
+    assert destination.circuit_state == "open"
+
+    # The next trial fails too. Once the destination recovers, a trial
+    # succeeds and closes the circuit.
+    clock.now += 60
+    with pytest.raises(Throttled):
+        destination.send(4, "four")
+    clock.now += 60
+    destination.send(5, "five")
+    assert destination.circuit_state == "closed"
+    assert flaky.sent == [(5, "five")]
+
+
+def test_retrying_destination_fallback() -> None:
+    clock = FakeClock()
+    fallback = FlakyDestination()
+    destination = create_destination(
+        FlakyDestination(failures=100),
+        clock,
+        max_attempts=2,
+        failure_threshold=2,
+        fallback=fallback,
+    )
+
+    destination.send(1, "one")
+    assert destination.circuit_state == "open"
+    destination.send(2, "two")
+
+    assert fallback.sent == [(1, "one"), (2, "two")]
+
+
+def test_retrying_destination_send_batch() -> None:
+    clock = FakeClock()
+    flaky = FlakyDestination(failures=1)
+    destination = create_destination(flaky, clock)
+
+    destination.send_batch([(1, "one"), (2, "two")])
+
+    assert flaky.sent == [(1, "one"), (2, "two")]
+    assert len(clock.sleeps) == 1
+
+
+def test_retrying_destination_validates_max_attempts() -> None:
+    with pytest.raises(ValueError, match="max_attempts"):
+        RetryingDestination(FlakyDestination(), max_attempts=0)
@@ -0,0 +1,170 @@
+import io
+import json
+import os
+import typing as t
+import uuid
+import pytest
+from werkit.compute import Destination
+from werkit.compute.destination.s3_destination import (
+    ClaimCheckDestination,
+    S3Destination,
+    decompress,
+    default_key_for,
+    resolve_claim_check,
+)
+
+
+class FakeS3Client:
+    def __init__(self) -> None:
+        self.objects: dict[tuple[str, str], tuple[bytes, dict[str, t.Any]]] = {}
+        self.configs: list[t.Any] = []
+
+    def upload_fileobj(
+        self,
+        fileobj: t.BinaryIO,
+        bucket: str,
+        key: str,
+        ExtraArgs: dict[str, t.Any],
+        Config: t.Any = None,
+    ) -> None:
+        self.objects[(bucket, key)] = (fileobj.read(), ExtraArgs)
+        self.configs.append(Config)
+
+    def get_object(self, Bucket: str, Key: str) -> dict[str, t.Any]:
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)][0])}
+
+
+class RecordingDestination(Destination):
+    def __init__(self) -> None:
+        self.sent: list[tuple[t.Any, t.Any]] = []
+
+    def send(self, message_key: t.Any, output_message: t.Any) -> None:
+        self.sent.append((message_key, output_message))
+
+
+def output_message(index: int, size: int = 10) -> dict[str, t.Any]:
+    return {"message_key": {"id": index}, "success": True, "result": "x" * size}
+
+
+def create_s3_destination(client: FakeS3Client, **kwargs: t.Any) -> S3Destination:
+    return S3Destination(bucket="my-bucket", s3_client=t.cast(t.Any, client), **kwargs)
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip", "zstd"])
+def test_s3_destination(compression: t.Any) -> None:
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    client = FakeS3Client()
+    destination = create_s3_destination(
+        client, prefix="results/", compression=compression
+    )
+
+    destination.send({"id": 1}, output_message(1))
+
+    [((bucket, key), (body, extra_args))] = client.objects.items()
+    assert bucket == "my-bucket"
+    assert key.startswith(f"results/{default_key_for({'id': 1})}.json")
+    assert json.loads(decompress(body, compression)) == output_message(1)
+    assert extra_args["ContentType"] == "application/json"
+    if compression == "none":
+        assert "ContentEncoding" not in extra_args
+    else:
+        assert extra_args["ContentEncoding"] == compression
+
+
+def test_s3_destination_passes_transfer_config() -> None:
+    from boto3.s3.transfer import TransferConfig
+
+    client = FakeS3Client()
+    config = TransferConfig(multipart_threshold=1024)
+    create_s3_destination(client, transfer_config=config).send(1, output_message(1))
+    assert client.configs == [config]
+
+
+def test_s3_destination_key_for() -> None:
+    client = FakeS3Client()
+    create_s3_destination(
+        client, key_for=lambda message_key: f"item-{message_key['id']}"
+    ).send({"id": 7}, output_message(7))
+    assert list(client.objects.keys()) == [("my-bucket", "item-7.json")]
+
+
+def test_default_key_for_is_stable() -> None:
+    assert default_key_for({"a": 1, "b": 2}) == default_key_for({"b": 2, "a": 1})
+    assert default_key_for({"a": 1}) != default_key_for({"a": 2})
+
+
+def test_s3_destination_rejects_unknown_compression() -> None:
+    with pytest.raises(ValueError, match="Unknown compression"):
+        S3Destination(bucket="my-bucket", compression=t.cast(t.Any, "lz4"))
+
+
+def test_claim_check_destination() -> None:
+    client = FakeS3Client()
+    primary = RecordingDestination()
+    destination = ClaimCheckDestination(
+        primary,
+        create_s3_destination(client, compression="gzip"),
+        threshold_bytes=1000,
+    )
+
+    small, large = output_message(1, size=10), output_message(2, size=2000)
+    destination.send_batch([({"id": 1}, small)])
+    destination.send({"id": 2}, large)
+
+    assert primary.sent[0] == ({"id": 1}, small)
+    message_key, pointer = primary.sent[1]
+    assert message_key == {"id": 2}
+    assert pointer["message_key"] == {"id": 2}
+    assert pointer["claim_check"]["bucket"] == "my-bucket"
+    assert pointer["claim_check"]["compression"] == "gzip"
+    assert pointer["claim_check"]["size_bytes"] < 1000
+    assert len(json.dumps(pointer)) < 1000
+
+    s3_client = t.cast(t.Any, client)
+    assert resolve_claim_check(pointer, s3_client=s3_client) == large
+    assert resolve_claim_check(small, s3_client=s3_client) == small
+
+
+def test_claim_check_destination_measures_with_the_primary_encoder() -> None:
+    from werkit.compute import MissouriEncoder, StandardEncoder
+
+    primary = RecordingDestination()
+    primary.encoder = "standard"
+    destination = ClaimCheckDestination(
+        primary, create_s3_destination(FakeS3Client()), threshold_bytes=1000
+    )
+    destination.send({"id": 1}, output_message(1))
+
+    assert isinstance(destination.encoder, StandardEncoder)
+
+    destination = ClaimCheckDestination(
+        primary,
+        create_s3_destination(FakeS3Client()),
+        threshold_bytes=1000,
+        encoder="missouri",
+    )
+    destination.send({"id": 1}, output_message(1))
+
+    assert isinstance(destination.encoder, MissouriEncoder)
+
+
+@pytest.mark.slow
+def test_claim_check_destination_on_s3() -> None:
+    import boto3
+
+    bucket = os.environ["INTEGRATION_TEST_BUCKET"]
+    prefix = f"test_{uuid.uuid4().hex}/"
+    primary = RecordingDestination()
+    s3_destination = S3Destination(bucket=bucket, prefix=prefix, compression="gzip")
+    large = output_message(1, size=300 * 1024)
+
+    ClaimCheckDestination(primary, s3_destination).send({"id": 1}, large)
+
+    _, pointer = primary.sent[0]
+    try:
+        assert resolve_claim_check(pointer) == large
+    finally:
+        boto3.client("s3").delete_object(
+            Bucket=bucket, Key=pointer["claim_check"]["key"]
+        )
@@ -1,16 +1,20 @@
+from ._batch import evaluate_batch  # noqa: F401
 from ._binding import DefaultStateManagerProtocol, bind_state_manager  # noqa: F401
 from ._built_in_type import (  # noqa: F401
     BuiltInValueType,
 )
 from ._custom_type import CustomType  # noqa: F401
 from ._dependency_graph import (  # noqa: F401
+    CircularDependencyError,
     ComputeNode,
     DependencyGraph,
     DependencyGraphJSONType,
     Input,
     Intermediate,
     Output,
+    UnresolvedDependencyError,
     intermediate,
     output,
 )
+from ._node_cache import NodeCache, NodeCacheStats, node_fingerprint  # noqa: F401
 from ._state_manager import StateManager, Store  # noqa: F401
@@ -0,0 +1,96 @@
+import typing as t
+from ._dependency_graph import DependencyGraph, dependency_graph_for_class
+from ._state_manager import Store
+
+Rows = t.Sequence[t.Mapping[str, t.Any]]
+Columns = t.Mapping[str, t.Sequence[t.Any]]
+
+
+def _columns_from_rows(
+    dependency_graph: DependencyGraph, rows: Rows
+) -> dict[str, list[t.Any]]:
+    names = list(rows[0].keys()) if rows else []
+    for index, row in enumerate(rows):
+        if row.keys() != set(names):
+            raise ValueError(f"Row {index} has different keys than row 0")
+    Store(dependency_graph)._assert_known_keys(names)
+    return {
+        name: [
+            dependency_graph.all_nodes[name].normalize(name=name, value=row[name])
+            for row in rows
+        ]
+        for name in names
+    }
+
+
+def evaluate_batch(
+    cls: t.Type,
+    inputs: t.Union[Rows, Columns],
+    targets: t.Optional[t.List[str]] = None,
+) -> dict[str, t.Sequence[t.Any]]:
+    """
+    Evaluate the graph of a compute class over many sets of inputs, sharing
+    the analysis of the graph and a single instance of the class across rows.
+    Return a column of values, one per row, for each target, or when
+    `targets` is `None`, for every compute node.
+
+    Each node's method is invoked once per row, and its values normalized. A
+    node with a vectorized implementation, registered using
+    `ComputeNode.vectorized()`, is instead invoked once for the whole batch
+    with a column for each dependency, and its result is used as is.
+
+    Node methods receive every value they need as parameters. Reading other
+    nodes through `self` isn't supported.
+
+    Args:
+        cls (type): The compute class, which must be constructible without
+            arguments.
+        inputs: Either a list of rows, each a dict of values keyed by name,
+            which are normalized as by `StateManager.set()`, or a dict of
+            equal-length columns, such as NumPy arrays, which are used as is.
+            For an empty list, every column is empty.
+        targets (list): The names to evaluate.
+    """
+    dependency_graph = dependency_graph_for_class(cls)
+    # Used to check names.
+    store = Store(dependency_graph)
+
+    columns: dict[str, t.Sequence[t.Any]]
+    if isinstance(inputs, t.Mapping):
+        store._assert_known_keys(inputs.keys())
+        columns = dict(inputs)
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("Expected columns to have the same length")
+        row_count = lengths.pop() if lengths else 0
+    else:
+        columns = dict(_columns_from_rows(dependency_graph, inputs))
+        row_count = len(inputs)
+
+    if targets is None:
+        targets = list(dependency_graph.compute_nodes.keys())
+    else:
+        store._assert_known_keys(targets)
+
+    if not isinstance(inputs, t.Mapping) and row_count == 0:
+        # With no rows, there are no names to resolve the graph from.
+        return {name: [] for name in targets}
+
+    order = dependency_graph.evaluation_order(targets, available=columns)
+    instance = cls()
+
+    for name in order:
+        node = dependency_graph.compute_nodes[name]
+        dependency_columns = [columns[dependency] for dependency in node.dependencies]
+        if node.vectorized_method is not None:
+            column = node.vectorized_method(instance, *dependency_columns)
+            if len(column) != row_count:
+                raise ValueError(
+                    f"Vectorized {name} returned {len(column)} values for {row_count} rows"
+                )
+        else:
+            rows = zip(*dependency_columns) if dependency_columns else ((),) * row_count
+            column = [node.normalize(name, node.method(instance, *row)) for row in rows]
+        columns[name] = column
+
+    return {name: columns[name] for name in targets}
@@ -1,6 +1,7 @@
 import typing as t
 
 from ._dependency_graph import ComputeNode, Input
+from ._node_cache import NodeCache
 from ._state_manager import StateManager
 
 # This decorator is hard to type, so we provide a protcol which can be used with
@@ -23,12 +24,19 @@ T = t.TypeVar("T")
 
 def bind_state_manager(
     attr_name: str = "state_manager",
+    cache: t.Optional[NodeCache] = None,
 ) -> t.Callable[[type[T]], type[T]]:
+    """
+    Add a state manager to each instance of the decorated class, which
+    evaluates its nodes when they're accessed as attributes. With a
+    `NodeCache`, node values are memoized across instances.
+    """
+
     def decorator(cls):  # type: ignore[no-untyped-def]
         class Bound(cls):  # type: ignore[no-untyped-def]
             def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
                 super().__init__(*args, **kwargs)
-                setattr(self, attr_name, StateManager(self))
+                setattr(self, attr_name, StateManager(self, cache=cache))
 
             def __getattribute__(self, name: str) -> t.Any:
                 attr = object.__getattribute__(self, name)
@@ -1,7 +1,9 @@
 from __future__ import annotations
+import functools
 import inspect
 import numbers
 import typing as t
+import weakref
 
 
 from ._built_in_type import (
@@ -35,6 +37,25 @@ def _find_duplicates(items: list[str]) -> list[str]:
 AnyValueType = t.Union[BuiltInValueType, t.Type[CustomType]]
 
 
+class CircularDependencyError(ValueError):
+    """
+    Raised when the compute nodes of a dependency graph depend on each other
+    in a cycle, so there's no order in which to evaluate them.
+    """
+
+
+class UnresolvedDependencyError(Exception):
+    """
+    Raised when evaluating a node requires a value which isn't available,
+    such as an input which has not been set. `dependencies` lists the
+    missing names.
+    """
+
+    def __init__(self, dependencies: t.List[str]):
+        self.dependencies = dependencies
+        super().__init__(f"Missing dependencies: {', '.join(dependencies)}")
+
+
 class BaseNode:
     def __init__(self, value_type: AnyValueType):
         if is_built_in_value_type(value_type) or (
@@ -102,6 +123,9 @@ class Input(BaseNode):
         return {"valueType": self.value_type_name}
 
 
+MethodType = t.TypeVar("MethodType", bound=t.Callable[..., t.Any])
+
+
 class ComputeNodeJSONType(t.TypedDict):
     valueType: str
     dependencies: t.List[str]
@@ -109,12 +133,37 @@ class ComputeNodeJSONType(t.TypedDict):
 
 class ComputeNode(BaseNode):
     # TODO: Use a narrower type for `method`.
-    def __init__(self, method: t.Callable, value_type: AnyValueType):
+    def __init__(
+        self, method: t.Callable, value_type: AnyValueType, cacheable: bool = True
+    ):
         super().__init__(value_type=value_type)
 
         self.method = method
+        # When `False`, the node is never memoized, e.g. because the method
+        # is non-deterministic.
+        self.cacheable = cacheable
+        self.vectorized_method: t.Optional[t.Callable] = None
         self.dependencies = [x for x in inspect.signature(method).parameters.keys()][1:]
 
+    def vectorized(self, method: MethodType) -> MethodType:
+        """
+        Register an implementation for `evaluate_batch()`, which takes the
+        same parameters as the node's method, but receives a column of values
+        for each, such as a list or a NumPy array, and returns a column of
+        results, one per row. Use it as a decorator, with a different name
+        than the node:
+
+            @intermediate(value_type=float)
+            def area(self, width: float, height: float) -> float:
+                return width * height
+
+            @area.vectorized
+            def area_batch(self, width: np.ndarray, height: np.ndarray) -> np.ndarray:
+                return np.asarray(width) * np.asarray(height)
+        """
+        self.vectorized_method = method
+        return method
+
     def bind(self, instance: ComputeNode) -> t.Callable:
         import functools
 
@@ -135,16 +184,20 @@ class Output(ComputeNode):
     pass
 
 
-def intermediate(value_type: AnyValueType) -> t.Callable[[t.Callable], Intermediate]:
+def intermediate(
+    value_type: AnyValueType, cacheable: bool = True
+) -> t.Callable[[t.Callable], Intermediate]:
     def decorator(method: t.Callable[..., t.Any]) -> Intermediate:
-        return Intermediate(method, value_type)
+        return Intermediate(method, value_type, cacheable=cacheable)
 
     return decorator
 
 
-def output(value_type: AnyValueType) -> t.Callable[[t.Callable], Output]:
+def output(
+    value_type: AnyValueType, cacheable: bool = True
+) -> t.Callable[[t.Callable], Output]:
     def decorator(method: t.Callable[..., t.Any]) -> Output:
-        return Output(method, value_type)
+        return Output(method, value_type, cacheable=cacheable)
 
     return decorator
 
@@ -279,6 +332,94 @@ class DependencyGraph:
             },
         )
 
+    @functools.cached_property
+    def topological_order(self) -> t.List[str]:
+        """
+        The compute nodes, ordered so that each follows the compute nodes it
+        depends on.
+        """
+        from graphlib import CycleError, TopologicalSorter
+
+        sorter = TopologicalSorter(
+            {
+                name: [
+                    dependency
+                    for dependency in node.dependencies
+                    if dependency in self.compute_nodes
+                ]
+                for name, node in self.compute_nodes.items()
+            }
+        )
+        try:
+            return list(sorter.static_order())
+        except CycleError as e:
+            raise CircularDependencyError(
+                f"Circular dependency: {' -> '.join(e.args[1])}"
+            ) from e
+
+    @functools.cached_property
+    def _topological_index(self) -> dict[str, int]:
+        return {name: index for index, name in enumerate(self.topological_order)}
+
+    @functools.cached_property
+    def _dependents(self) -> dict[str, t.List[str]]:
+        dependents: dict[str, t.List[str]] = {name: [] for name in self.all_nodes}
+        for name, node in self.compute_nodes.items():
+            for dependency in set(node.dependencies):
+                if dependency in dependents:
+                    dependents[dependency].append(name)
+        return dependents
+
+    def transitive_dependents(self, names: t.Iterable[str]) -> set[str]:
+        """
+        Return the compute nodes which depend on any of the given nodes,
+        directly or indirectly.
+        """
+        result: set[str] = set()
+        pending = list(names)
+        while pending:
+            for dependent in self._dependents.get(pending.pop(), []):
+                if dependent not in result:
+                    result.add(dependent)
+                    pending.append(dependent)
+        return result
+
+    def evaluation_order(
+        self, targets: t.Iterable[str], available: t.Container[str]
+    ) -> t.List[str]:
+        """
+        Return the compute nodes which need to be evaluated, in order, to
+        evaluate the targets, given the names whose values are available.
+        Only the targets and their missing ancestors are included.
+
+        Raise `UnresolvedDependencyError` when a value which is needed is not
+        available and can't be computed, such as an input which has not been
+        set.
+        """
+        needed: set[str] = set()
+        missing: set[str] = set()
+        pending = [name for name in targets if name not in available]
+        while pending:
+            name = pending.pop()
+            if name in needed:
+                continue
+            try:
+                node = self.compute_nodes[name]
+            except KeyError:
+                missing.add(name)
+                continue
+            needed.add(name)
+            pending.extend(
+                dependency
+                for dependency in node.dependencies
+                if dependency not in available and dependency not in needed
+            )
+
+        if missing:
+            raise UnresolvedDependencyError(sorted(missing))
+
+        return sorted(needed, key=self._topological_index.__getitem__)
+
     def keys(self) -> t.List[str]:
         return list(self.inputs.keys()) + list(self.compute_nodes.keys())
 
@@ -289,3 +430,23 @@ class DependencyGraph:
             "intermediates": {k: v.serialize() for k, v in self.intermediates.items()},
             "outputs": {k: v.serialize() for k, v in self.outputs.items()},
         }
+
+
+_dependency_graphs_by_class: weakref.WeakKeyDictionary[type, DependencyGraph] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def dependency_graph_for_class(in_class: t.Type) -> DependencyGraph:
+    """
+    Return the dependency graph of the class, which is collected on first use
+    and then cached for the life of the class, along with its evaluation
+    order.
+    """
+    try:
+        return _dependency_graphs_by_class[in_class]
+    except KeyError:
+        dependency_graph = _dependency_graphs_by_class[in_class] = (
+            DependencyGraph.from_class(in_class)
+        )
+        return dependency_graph
@@ -0,0 +1,331 @@
+import functools
+import hashlib
+import itertools
+import os
+import threading
+import types
+import typing as t
+import weakref
+from collections import OrderedDict
+from ._dependency_graph import ComputeNode, DependencyGraph
+
+_MISSING = object()
+
+
+class NodeCacheStats(t.TypedDict):
+    hits: int
+    disk_hits: int
+    misses: int
+    entries: int
+
+
+@functools.lru_cache(maxsize=1024)
+def _code_digest(code: types.CodeType) -> str:
+    digest = hashlib.sha256(code.co_code)
+    digest.update(repr((code.co_names, code.co_varnames)).encode("utf-8"))
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            # E.g. a nested function or comprehension.
+            digest.update(_code_digest(const).encode("utf-8"))
+        else:
+            digest.update(repr(const).encode("utf-8"))
+    return digest.hexdigest()
+
+
+# Objects whose contents can change are identified by a token, assigned from a
+# counter so a token is never reused. Tokens are looked up by `id()`, and each
+# entry holds a reference which confirms that the id still belongs to the same
+# object. Objects which support weak references are dropped once collected.
+# Others, such as lists and dicts, are kept alive so their ids can't be reused
+# while they're tracked, but only the most recently used are tracked, and
+# `NodeCache.clear()` releases them. An object which is no longer tracked is
+# assigned a new token, so its values are recomputed.
+_MAX_PINNED_IDENTITIES = 1024
+_identity_lock = threading.RLock()
+_identity_counter = itertools.count()
+_weak_identities: dict[int, tuple["weakref.ref[t.Any]", str]] = {}
+_pinned_identities: OrderedDict[int, tuple[t.Any, str]] = OrderedDict()
+
+
+def _forget_weak_identity(key: int, ref: "weakref.ref[t.Any]") -> None:
+    with _identity_lock:
+        entry = _weak_identities.get(key)
+        if entry is not None and entry[0] is ref:
+            del _weak_identities[key]
+
+
+def _object_identity(value: t.Any) -> str:
+    key = id(value)
+    with _identity_lock:
+        weak_entry = _weak_identities.get(key)
+        if weak_entry is not None and weak_entry[0]() is value:
+            return weak_entry[1]
+        pinned_entry = _pinned_identities.get(key)
+        if pinned_entry is not None and pinned_entry[0] is value:
+            _pinned_identities.move_to_end(key)
+            return pinned_entry[1]
+
+        token = f"{type(value).__qualname__}@{next(_identity_counter)}"
+        try:
+            ref = weakref.ref(value, functools.partial(_forget_weak_identity, key))
+        except TypeError:
+            _pinned_identities[key] = (value, token)
+            while len(_pinned_identities) > _MAX_PINNED_IDENTITIES:
+                _pinned_identities.popitem(last=False)
+        else:
+            _weak_identities[key] = (ref, token)
+        return token
+
+
+def _release_pinned_identities() -> None:
+    with _identity_lock:
+        _pinned_identities.clear()
+
+
+def _value_identity(value: t.Any) -> str:
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return repr(value)
+    elif isinstance(value, (tuple, frozenset)):
+        items = sorted(value, key=repr) if isinstance(value, frozenset) else value
+        return f"{type(value).__name__}({','.join(map(_value_identity, items))})"
+    elif isinstance(value, types.FunctionType):
+        return _function_identity(value)
+    elif isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    elif isinstance(value, types.ModuleType):
+        return value.__name__
+    else:
+        # Mutable or arbitrary objects, whose contents can change, are
+        # identified by identity.
+        return _object_identity(value)
+
+
+def _function_identity(function: types.FunctionType) -> str:
+    """
+    Identify a function by its bytecode, constants, defaults, and closure
+    values, so that functions which share a name but not an implementation,
+    such as methods of classes created by a factory, or a method before and
+    after an edit, are told apart.
+    """
+    parts = [
+        f"{function.__module__}.{function.__qualname__}",
+        _code_digest(function.__code__),
+        _value_identity(function.__defaults__),
+        _value_identity(
+            None
+            if function.__kwdefaults__ is None
+            else tuple(sorted(function.__kwdefaults__.items()))
+        ),
+    ]
+    for cell in function.__closure__ or ():
+        try:
+            parts.append(_value_identity(cell.cell_contents))
+        except ValueError:
+            # An empty cell.
+            parts.append("")
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def node_fingerprint(
+    dependency_graph: DependencyGraph,
+    name: str,
+    values: t.Mapping[str, t.Any],
+    namespace: str = "",
+) -> t.Optional[str]:
+    """
+    Compute a stable key for the value of a compute node from the namespace,
+    the identity of its method, including its bytecode and closure, and the
+    values of its dependencies, which are serialized using each dependency's
+    `serialize_value()`. Return `None` when the values can't be serialized to
+    JSON.
+    """
+    import json
+
+    node = dependency_graph.compute_nodes[name]
+    try:
+        encoded = json.dumps(
+            [
+                namespace,
+                _value_identity(node.method),
+                [
+                    dependency_graph.all_nodes[dependency].serialize_value(
+                        values[dependency]
+                    )
+                    for dependency in node.dependencies
+                ],
+            ],
+            sort_keys=True,
+            separators=(",", ":"),
+            allow_nan=False,
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class NodeCache:
+    """
+    Memoize the values of compute nodes across state managers, keyed by a
+    fingerprint of the node's method and its dependency values. Pass an
+    instance to `bind_state_manager()` to share it among the instances of a
+    class, or among several classes.
+
+    Recently used values are kept in memory. With a `directory`, every value
+    is also pickled to disk, so it survives the process and is shared with
+    other processes using the same directory.
+
+    Nodes declared with `cacheable=False`, and nodes whose dependency values
+    can't be serialized to JSON, are always computed. Cached values are
+    shared, so they must not be mutated.
+
+    Keys include the method's bytecode, defaults, and closure values, so a
+    method which is edited, or which is created by a factory with different
+    closure values, gets new keys. Keys don't cover the functions a method
+    calls, or the state of the instance, so methods should depend only on
+    their parameters. Change the `namespace` to invalidate values computed by
+    older versions of the code they call. Closure values other than numbers,
+    strings, tuples, functions, and classes are identified by identity. Their
+    keys differ from process to process, so values computed by such methods
+    are only served from memory. Such values which can't be weakly
+    referenced, such as lists, are kept alive while they're tracked: up to
+    1024 of them, the most recently used, until `clear()` is invoked.
+
+    Args:
+        max_entries (int): The number of values kept in memory.
+        directory (str): An optional directory for the on-disk tier, which is
+            created if needed.
+        namespace (str): Included in every key, e.g. a version number.
+    """
+
+    # Returned by `get()` and `lookup()` when there's no cached value.
+    MISSING: t.ClassVar[t.Any] = _MISSING
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        directory: t.Optional[t.Union[str, "os.PathLike[str]"]] = None,
+        namespace: str = "",
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries should be at least 1")
+        self.max_entries = max_entries
+        self.namespace = namespace
+        self.directory = None if directory is None else os.fspath(directory)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, t.Any] = OrderedDict()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    def _path_for(self, key: str) -> str:
+        assert self.directory is not None
+        return os.path.join(self.directory, f"{key}.pickle")
+
+    def _remember(self, key: str, value: t.Any) -> None:
+        """
+        Add the value to the memory tier. The caller holds the lock.
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> t.Any:
+        """
+        Return the cached value, or `MISSING`.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                pass
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+
+        if self.directory is not None:
+            import pickle
+
+            try:
+                with open(self._path_for(key), "rb") as f:
+                    value = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+            else:
+                with self._lock:
+                    self._remember(key, value)
+                    self._hits += 1
+                    self._disk_hits += 1
+                return value
+
+        with self._lock:
+            self._misses += 1
+        return self.MISSING
+
+    def put(self, key: str, value: t.Any) -> None:
+        with self._lock:
+            self._remember(key, value)
+
+        if self.directory is not None:
+            import pickle
+            import tempfile
+
+            os.makedirs(self.directory, exist_ok=True)
+            try:
+                encoded = pickle.dumps(value)
+            except Exception:
+                # Keep unpicklable values in memory only.
+                return
+            # Write atomically, so concurrent readers never see a partial
+            # file.
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(encoded)
+                os.replace(temp_path, self._path_for(key))
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+
+    def lookup(
+        self,
+        dependency_graph: DependencyGraph,
+        name: str,
+        values: t.Mapping[str, t.Any],
+    ) -> tuple[t.Optional[str], t.Any]:
+        """
+        Return the key for the node and its cached value, or `MISSING`. The
+        key is `None` when the node can't be cached.
+        """
+        node: ComputeNode = dependency_graph.compute_nodes[name]
+        if not node.cacheable:
+            return None, self.MISSING
+        key = node_fingerprint(dependency_graph, name, values, namespace=self.namespace)
+        if key is None:
+            return None, self.MISSING
+        return key, self.get(key)
+
+    def stats(self) -> NodeCacheStats:
+        """
+        Return the number of hits, the number of those which were read from
+        disk, the number of misses, and the number of values in memory.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "entries": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        """
+        Discard the values in memory and reset the statistics. Also release
+        the closure values kept alive to identify them, which are shared by
+        every cache. The on-disk tier is kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._disk_hits = self._misses = 0
+        _release_pinned_identities()
@@ -1,5 +1,19 @@
 import typing as t
-from ._dependency_graph import ComputeNode, DependencyGraph
+from ._dependency_graph import DependencyGraph, dependency_graph_for_class
+from ._node_cache import NodeCache
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor, Future
+
+
+def _values_equal(first: t.Any, second: t.Any) -> bool:
+    if first is second:
+        return True
+    try:
+        return bool(first == second)
+    except Exception:
+        # E.g. NumPy arrays, which compare elementwise. Assume they differ.
+        return False
 
 
 class Store:
@@ -8,7 +22,8 @@ class Store:
         self.store: dict[str, t.Any] = {}
 
     def _assert_known_keys(self, keys: t.Iterable[str]) -> None:
-        unknown_keys = set(keys) - set(self.dependency_graph.keys())
+        all_nodes = self.dependency_graph.all_nodes
+        unknown_keys = {key for key in keys if key not in all_nodes}
         if len(unknown_keys):
             raise KeyError(
                 f"Unknown {'key' if len(unknown_keys) == 1 else 'keys'}: {', '.join(sorted(list(unknown_keys)))}"
@@ -20,7 +35,7 @@ class Store:
             name: self.dependency_graph.all_nodes[name].deserialize(value)
             for name, value in kwargs.items()
         }
-        self.store.update(deserialized)
+        self._update(deserialized)
 
     def normalize(self, **kwargs: t.Any) -> dict[str, t.Any]:
         return {
@@ -33,7 +48,24 @@ class Store:
     def set(self, **kwargs: t.Any) -> None:
         self._assert_known_keys(kwargs.keys())
         normalized = self.normalize(**kwargs)
-        self.store.update(normalized)
+        self._update(normalized)
+
+    def _update(self, values: dict[str, t.Any]) -> None:
+        """
+        Store the values, and discard the stored values of the nodes which
+        depend on the ones that changed, so they're recomputed by the next
+        evaluation. A value equal to the stored one doesn't count as a
+        change.
+        """
+        changed = [
+            name
+            for name, value in values.items()
+            if name not in self.store or not _values_equal(self.store[name], value)
+        ]
+        for name in self.dependency_graph.transitive_dependents(changed):
+            if name not in values:
+                self.store.pop(name, None)
+        self.store.update((name, values[name]) for name in changed)
 
     def serialize(self, targets: t.Optional[t.List[str]] = None) -> dict[str, t.Any]:
         if targets is not None:
@@ -50,50 +82,153 @@ class Store:
 
 
 class StateManager(Store):
-    def __init__(self, instance: t.Any):
+    def __init__(self, instance: t.Any, cache: t.Optional[NodeCache] = None):
         super().__init__(
-            dependency_graph=DependencyGraph.from_class(instance.__class__)
+            dependency_graph=dependency_graph_for_class(instance.__class__)
         )
         self.instance = instance
+        self.cache = cache
 
     def evaluate(
-        self, targets: t.Optional[t.List[str]] = None, handle_exceptions: bool = False
+        self,
+        targets: t.Optional[t.List[str]] = None,
+        handle_exceptions: bool = False,
+        executor: t.Optional["Executor"] = None,
+        max_parallelism: t.Optional[int] = None,
     ) -> None:
-        import functools
-        from artifax import Artifax
-
-        if targets is not None:
-            if len(targets) == 0:
-                # TODO: afx.build(targets=[]) raises an exception. This seems
-                # like a bug in Artifax.
-                return
-            else:
-                self._assert_known_keys(targets)
-
-        def wrap_node(name: str, node: ComputeNode) -> t.Callable:
-            wrapped = node.bind(self.instance)
-
-            def wrapper(*args: list[t.Any]) -> t.Any:
-                value = wrapped(*args)
-                return node.normalize(name, value)
-
-            functools.update_wrapper(wrapper, wrapped)
-            return wrapper
-
-        afx = Artifax(
-            {
-                name: wrap_node(name, node)
-                for name, node in self.dependency_graph.compute_nodes.items()
-            }
-        )
-        if self.store:
-            afx.set(**self.store)
+        """
+        Evaluate the targets, or when `targets` is `None`, every compute node,
+        along with the ancestors whose values are not in the store. Values
+        already in the store are not recomputed.
+
+        Raise `UnresolvedDependencyError` before evaluating anything when a
+        needed input has not been set.
+
+        By default the nodes are evaluated serially. To evaluate independent
+        branches in parallel, pass a `concurrent.futures.ThreadPoolExecutor`,
+        which suits nodes which release the GIL, such as NumPy-heavy ones.
+        Each node is submitted as soon as its dependencies are in the store.
+        The store is only updated from the calling thread. When a node
+        raises, nodes which haven't started are cancelled, the ones running
+        are awaited, and the first exception propagates. Other executors,
+        such as a process pool, aren't supported, since the nodes are bound to
+        this instance and its store.
+
+        Args:
+            targets (list): The names to evaluate.
+            executor (concurrent.futures.ThreadPoolExecutor): An optional
+                executor on which to evaluate the nodes.
+            max_parallelism (int): With an executor, the maximum number of
+                nodes submitted at once. Defaults to no limit beyond the
+                executor's worker count.
+        """
+        if executor is not None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            if not isinstance(executor, ThreadPoolExecutor):
+                raise ValueError("executor should be a ThreadPoolExecutor")
+        if max_parallelism is not None and max_parallelism < 1:
+            raise ValueError("max_parallelism should be at least 1")
 
         if targets is None:
-            self.store.update(**afx.build(targets=targets))
+            targets = list(self.dependency_graph.compute_nodes.keys())
+        else:
+            self._assert_known_keys(targets)
+
+        order = self.dependency_graph.evaluation_order(targets, available=self.store)
+        if executor is None or len(order) < 2:
+            for name in order:
+                key, value = self._cached_value(name)
+                if value is NodeCache.MISSING:
+                    self._store_value(name, self._evaluate_node(name), key)
+                else:
+                    self.store[name] = value
         else:
-            values = afx.build(targets=targets)
-            self.store.update(**dict(zip(targets, values)))
+            self._evaluate_in_parallel(order, executor, max_parallelism)
+
+    def _evaluate_node(self, name: str) -> t.Any:
+        node = self.dependency_graph.compute_nodes[name]
+        return node.method(
+            self.instance,
+            *[self.store[dependency] for dependency in node.dependencies],
+        )
+
+    def _cached_value(self, name: str) -> tuple[t.Optional[str], t.Any]:
+        if self.cache is None:
+            return None, NodeCache.MISSING
+        return self.cache.lookup(self.dependency_graph, name, self.store)
+
+    def _store_value(
+        self, name: str, value: t.Any, cache_key: t.Optional[str] = None
+    ) -> None:
+        node = self.dependency_graph.compute_nodes[name]
+        normalized = self.store[name] = node.normalize(name, value)
+        if cache_key is not None:
+            assert self.cache is not None
+            self.cache.put(cache_key, normalized)
+
+    def _evaluate_in_parallel(
+        self,
+        order: t.List[str],
+        executor: "Executor",
+        max_parallelism: t.Optional[int],
+    ) -> None:
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        compute_nodes = self.dependency_graph.compute_nodes
+        needed = set(order)
+        # The number of unevaluated dependencies of each node, and the nodes
+        # which depend on each node.
+        pending_counts = {name: 0 for name in order}
+        dependents: dict[str, list[str]] = {name: [] for name in order}
+        for name in order:
+            for dependency in set(compute_nodes[name].dependencies):
+                if dependency in needed:
+                    pending_counts[name] += 1
+                    dependents[dependency].append(name)
+
+        # Evaluate in topological order where possible.
+        ready = [name for name in order if pending_counts[name] == 0]
+        ready.reverse()
+        # The name and cache key of each running node.
+        running: dict["Future[t.Any]", tuple[str, t.Optional[str]]] = {}
+
+        def mark_stored(name: str) -> None:
+            for dependent in dependents[name]:
+                pending_counts[dependent] -= 1
+                if pending_counts[dependent] == 0:
+                    ready.append(dependent)
+
+        def submit_ready() -> None:
+            while ready and (max_parallelism is None or len(running) < max_parallelism):
+                name = ready.pop()
+                key, value = self._cached_value(name)
+                if value is not NodeCache.MISSING:
+                    self.store[name] = value
+                    mark_stored(name)
+                    continue
+                node = compute_nodes[name]
+                future = executor.submit(
+                    node.method,
+                    self.instance,
+                    *[self.store[dependency] for dependency in node.dependencies],
+                )
+                running[future] = (name, key)
+
+        try:
+            submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, key = running.pop(future)
+                    self._store_value(name, future.result(), key)
+                    mark_stored(name)
+                submit_ready()
+        except BaseException:
+            for future in running:
+                future.cancel()
+            wait(running)
+            raise
 
     def get(self, name: str) -> t.Any:
         self._assert_known_keys([name])
@@ -0,0 +1,136 @@
+import typing as t
+import pytest
+
+from . import (
+    DefaultStateManagerProtocol,
+    Input,
+    UnresolvedDependencyError,
+    bind_state_manager,
+    evaluate_batch,
+    intermediate,
+    output,
+)
+from .testing_examples import MyComputeProcess, MyComputeProcessWithCustomType
+
+
+def test_evaluate_batch_with_rows() -> None:
+    assert evaluate_batch(
+        MyComputeProcess, inputs=[{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+    ) == {"i": [1, 3], "j": [2, 4], "r": [3, 7]}
+
+    assert evaluate_batch(
+        MyComputeProcess, inputs=[{"a": 1, "b": 2}, {"a": 3, "b": 4}], targets=["r"]
+    ) == {"r": [3, 7]}
+
+    # Only the ancestors of the targets are needed.
+    assert evaluate_batch(
+        MyComputeProcess, inputs=[{"a": 1}, {"a": 3}], targets=["i"]
+    ) == {"i": [1, 3]}
+
+
+def test_evaluate_batch_with_columns() -> None:
+    assert evaluate_batch(
+        MyComputeProcess, inputs={"a": (1, 3), "b": (2, 4)}, targets=["r"]
+    ) == {"r": [3, 7]}
+
+    with pytest.raises(ValueError, match="Expected columns to have the same length"):
+        evaluate_batch(MyComputeProcess, inputs={"a": [1, 3], "b": [2]})
+
+
+def test_evaluate_batch_with_no_rows() -> None:
+    assert evaluate_batch(MyComputeProcess, inputs=[]) == {"i": [], "j": [], "r": []}
+    assert evaluate_batch(MyComputeProcess, inputs=[], targets=["r"]) == {"r": []}
+    assert evaluate_batch(
+        MyComputeProcess, inputs={"a": [], "b": []}, targets=["r"]
+    ) == {"r": []}
+
+    with pytest.raises(KeyError, match="Unknown key: bogus"):
+        evaluate_batch(MyComputeProcess, inputs=[], targets=["bogus"])
+
+
+def test_evaluate_batch_matches_state_manager() -> None:
+    rows = [{"a": 1, "b": 2}, {"a": 5, "b": 8}]
+
+    columns = evaluate_batch(MyComputeProcessWithCustomType, inputs=rows)
+
+    for index, row in enumerate(rows):
+        state_manager = t.cast(
+            DefaultStateManagerProtocol, MyComputeProcessWithCustomType()
+        ).state_manager
+        state_manager.set(**row)
+        state_manager.evaluate()
+        assert state_manager.serialize(targets=["r", "other_thing"]) == {
+            "r": columns["r"][index],
+            "other_thing": list(columns["other_thing"][index]),
+        }
+
+
+def test_evaluate_batch_with_vectorized_node() -> None:
+    calls: list[str] = []
+
+    @bind_state_manager()
+    class VectorizedComputeProcess:
+        width = Input(value_type=float)
+        height = Input(value_type=float)
+
+        @intermediate(value_type=float)
+        def area(self, width: float, height: float) -> float:
+            calls.append("area")
+            return width * height
+
+        @area.vectorized
+        def area_batch(
+            self, width: t.Sequence[float], height: t.Sequence[float]
+        ) -> list[float]:
+            calls.append("vectorized area")
+            return [w * h for w, h in zip(width, height)]
+
+        @output(value_type=float)
+        def doubled(self, area: float) -> float:
+            return area * 2
+
+    assert evaluate_batch(
+        VectorizedComputeProcess,
+        inputs={"width": [1.0, 2.0, 3.0], "height": [4.0, 5.0, 6.0]},
+    ) == {"area": [4.0, 10.0, 18.0], "doubled": [8.0, 20.0, 36.0]}
+    assert calls == ["vectorized area"]
+
+    # The scalar method is still used by the state manager.
+    process = t.cast(t.Any, VectorizedComputeProcess())
+    process.state_manager.set(width=2.0, height=3.0)
+    assert process.doubled == 12.0
+    assert calls == ["vectorized area", "area"]
+
+
+def test_evaluate_batch_checks_vectorized_length() -> None:
+    @bind_state_manager()
+    class BrokenComputeProcess:
+        a = Input(value_type=int)
+
+        @output(value_type=int)
+        def r(self, a: int) -> int:
+            return a
+
+        @r.vectorized
+        def r_batch(self, a: t.Sequence[int]) -> list[int]:
+            return [0]
+
+    with pytest.raises(ValueError, match="Vectorized r returned 1 values for 2 rows"):
+        evaluate_batch(BrokenComputeProcess, inputs=[{"a": 1}, {"a": 2}])
+
+
+def test_evaluate_batch_errors() -> None:
+    with pytest.raises(UnresolvedDependencyError, match=r"^Missing dependencies: b$"):
+        evaluate_batch(MyComputeProcess, inputs=[{"a": 1}])
+
+    with pytest.raises(ValueError, match="Row 1 has different keys than row 0"):
+        evaluate_batch(MyComputeProcess, inputs=[{"a": 1}, {"b": 1}])
+
+    with pytest.raises(KeyError, match="Unknown key: bogus"):
+        evaluate_batch(MyComputeProcess, inputs=[{"bogus": 1}])
+
+    with pytest.raises(KeyError, match="Unknown key: bogus"):
+        evaluate_batch(MyComputeProcess, inputs=[{"a": 1}], targets=["bogus"])
+
+    with pytest.raises(ValueError, match="a should be type int, not bool"):
+        evaluate_batch(MyComputeProcess, inputs=[{"a": False}], targets=["i"])
@@ -1,4 +1,5 @@
 import numbers
+import pytest
 
 from . import DependencyGraph
 from .testing_examples import (
@@ -51,3 +52,45 @@ def test_dependency_graph_serialization_matches_schema() -> None:
     serialized = dependency_graph.serialize()
 
     assert_valid_dependency_graph_data(serialized)
+
+
+def test_dependency_graph_topological_order() -> None:
+    dependency_graph = DependencyGraph.from_class(MyComputeProcess)
+
+    order = dependency_graph.topological_order
+    assert sorted(order) == ["i", "j", "r"]
+    assert order[-1] == "r"
+
+
+def test_dependency_graph_evaluation_order() -> None:
+    from . import UnresolvedDependencyError
+
+    dependency_graph = DependencyGraph.from_class(MyComputeProcess)
+
+    assert dependency_graph.evaluation_order(["r"], available={"a", "b"}) in (
+        ["i", "j", "r"],
+        ["j", "i", "r"],
+    )
+    assert dependency_graph.evaluation_order(["r"], available={"b", "i"}) == ["j", "r"]
+    assert dependency_graph.evaluation_order(["r"], available={"r"}) == []
+
+    with pytest.raises(UnresolvedDependencyError, match=r"^Missing dependencies: a$"):
+        dependency_graph.evaluation_order(["r"], available={"b"})
+
+
+def test_dependency_graph_circular_dependency() -> None:
+    from . import CircularDependencyError, intermediate
+
+    class CircularComputeProcess:
+        @intermediate(value_type=int)
+        def i(self, j: int) -> int:
+            return j
+
+        @intermediate(value_type=int)
+        def j(self, i: int) -> int:
+            return i
+
+    dependency_graph = DependencyGraph.from_class(CircularComputeProcess)
+
+    with pytest.raises(CircularDependencyError, match=r"^Circular dependency: "):
+        dependency_graph.evaluation_order(["i"], available={})
@@ -0,0 +1,271 @@
+import typing as t
+from pathlib import Path
+import pytest
+
+from . import (
+    DefaultStateManagerProtocol,
+    Input,
+    NodeCache,
+    StateManager,
+    bind_state_manager,
+    intermediate,
+    node_fingerprint,
+    output,
+)
+from .testing_examples import MyComputeProcessWithCustomType
+
+
+def counting_compute_process(cache: NodeCache, calls: list[str]) -> type:
+    @bind_state_manager(cache=cache)
+    class CountingComputeProcess:
+        a = Input(value_type=float)
+        b = Input(value_type=float)
+
+        @intermediate(value_type=float)
+        def i(self, a: float) -> float:
+            calls.append("i")
+            return a * 2
+
+        @intermediate(value_type=float, cacheable=False)
+        def j(self, b: float) -> float:
+            calls.append("j")
+            return b * 2
+
+        @output(value_type=float)
+        def r(self, i: float, j: float) -> float:
+            calls.append("r")
+            return i + j
+
+    return CountingComputeProcess
+
+
+def evaluate(cls: type, **inputs: t.Any) -> dict[str, t.Any]:
+    state_manager = t.cast(DefaultStateManagerProtocol, cls()).state_manager
+    state_manager.set(**inputs)
+    state_manager.evaluate()
+    return state_manager.store
+
+
+def test_node_cache_memoizes_across_instances() -> None:
+    cache = NodeCache()
+    calls: list[str] = []
+    cls = counting_compute_process(cache, calls)
+
+    assert evaluate(cls, a=1.0, b=2.0) == {"a": 1, "b": 2, "i": 2, "j": 4, "r": 6}
+    assert calls == ["i", "j", "r"]
+    assert cache.stats() == {"hits": 0, "disk_hits": 0, "misses": 2, "entries": 2}
+
+    calls.clear()
+    assert evaluate(cls, a=1.0, b=2.0) == {"a": 1, "b": 2, "i": 2, "j": 4, "r": 6}
+    # `j` isn't cacheable.
+    assert calls == ["j"]
+    assert cache.stats() == {"hits": 2, "disk_hits": 0, "misses": 2, "entries": 2}
+
+    calls.clear()
+    evaluate(cls, a=3.0, b=2.0)
+    assert calls == ["i", "j", "r"]
+
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "disk_hits": 0, "misses": 0, "entries": 0}
+
+
+def test_node_cache_evicts_least_recently_used() -> None:
+    cache = NodeCache(max_entries=2)
+    calls: list[str] = []
+    cls = counting_compute_process(cache, calls)
+
+    evaluate(cls, a=1.0, b=2.0)
+    evaluate(cls, a=3.0, b=2.0)
+    assert cache.stats()["entries"] == 2
+
+    calls.clear()
+    evaluate(cls, a=1.0, b=2.0)
+    assert calls == ["i", "j", "r"]
+
+    with pytest.raises(ValueError, match="max_entries should be at least 1"):
+        NodeCache(max_entries=0)
+
+
+def test_node_cache_on_disk(tmp_path: Path) -> None:
+    calls: list[str] = []
+    evaluate(
+        counting_compute_process(NodeCache(directory=tmp_path), calls), a=1.0, b=2.0
+    )
+
+    # A new cache, e.g. in another process, reads the values from disk.
+    cache = NodeCache(directory=tmp_path)
+    calls.clear()
+    assert evaluate(counting_compute_process(cache, calls), a=1.0, b=2.0)["r"] == 6
+    assert calls == ["j"]
+    assert cache.stats() == {"hits": 2, "disk_hits": 2, "misses": 0, "entries": 2}
+
+
+def test_node_cache_skips_values_which_cannot_be_serialized() -> None:
+    cache = NodeCache()
+    calls: list[str] = []
+    cls = counting_compute_process(cache, calls)
+
+    for _ in range(2):
+        evaluate(cls, a=float("nan"), b=2.0)
+    assert calls == ["i", "j", "r"] * 2
+
+
+def test_node_cache_with_custom_types() -> None:
+    cache = NodeCache()
+    state_manager = StateManager(MyComputeProcessWithCustomType(), cache=cache)
+    state_manager.deserialize(other_thing=[1, 2, 3])
+    state_manager.evaluate(targets=["further_derived_thing"])
+
+    key = node_fingerprint(
+        state_manager.dependency_graph, "further_derived_thing", state_manager.store
+    )
+    assert key is not None
+    assert cache.get(key) == "(1, 2, 3)"
+
+    other_state_manager = StateManager(MyComputeProcessWithCustomType(), cache=cache)
+    other_state_manager.deserialize(other_thing=[1, 2, 3])
+    other_state_manager.evaluate(targets=["further_derived_thing"])
+    # Including the `get()` above.
+    assert cache.stats()["hits"] == 2
+
+
+def test_node_cache_with_executor() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = NodeCache()
+    calls: list[str] = []
+    cls = counting_compute_process(cache, calls)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for _ in range(2):
+            state_manager = t.cast(DefaultStateManagerProtocol, cls()).state_manager
+            state_manager.set(a=1.0, b=2.0)
+            state_manager.evaluate(executor=executor)
+            assert state_manager.store["r"] == 6
+
+    assert sorted(calls) == ["i", "j", "j", "r"]
+
+
+def scaling_compute_process(cache: NodeCache, factor: float) -> type:
+    @bind_state_manager(cache=cache)
+    class ScalingComputeProcess:
+        a = Input(value_type=float)
+
+        @output(value_type=float)
+        def i(self, a: float) -> float:
+            return a * factor
+
+    return ScalingComputeProcess
+
+
+def test_node_cache_distinguishes_closures() -> None:
+    cache = NodeCache()
+
+    assert evaluate(scaling_compute_process(cache, 2.0), a=1.0)["i"] == 2.0
+    assert evaluate(scaling_compute_process(cache, 10.0), a=1.0)["i"] == 10.0
+    assert evaluate(scaling_compute_process(cache, 2.0), a=1.0)["i"] == 2.0
+    assert cache.stats()["hits"] == 1
+
+
+def test_node_cache_distinguishes_method_bodies(tmp_path: Path) -> None:
+    def make(edited: bool) -> type:
+        # Same qualified names, different code, as before and after an edit.
+        if edited:
+
+            @bind_state_manager(cache=NodeCache(directory=tmp_path))
+            class ComputeProcess:
+                a = Input(value_type=float)
+
+                @output(value_type=float)
+                def i(self, a: float) -> float:
+                    return a + 1
+
+        else:
+
+            @bind_state_manager(cache=NodeCache(directory=tmp_path))
+            class ComputeProcess:  # type: ignore[no-redef]
+                a = Input(value_type=float)
+
+                @output(value_type=float)
+                def i(self, a: float) -> float:
+                    return a
+
+        return ComputeProcess
+
+    assert evaluate(make(edited=False), a=1.0)["i"] == 1.0
+    assert evaluate(make(edited=True), a=1.0)["i"] == 2.0
+
+
+class Scale:
+    def __init__(self, factor: float):
+        self.factor = factor
+
+
+def test_node_cache_releases_closure_values() -> None:
+    import gc
+
+    from . import _node_cache
+
+    cache = NodeCache()
+
+    def evaluate_with_closure_values() -> None:
+        scale = Scale(3.0)
+        offsets = [1.0]
+
+        @bind_state_manager(cache=cache)
+        class ComputeProcess:
+            a = Input(value_type=float)
+
+            @output(value_type=float)
+            def i(self, a: float) -> float:
+                return a * scale.factor + offsets[0]
+
+        assert evaluate(ComputeProcess, a=1.0)["i"] == 4.0
+        assert evaluate(ComputeProcess, a=1.0)["i"] == 4.0
+
+    weak_count = len(_node_cache._weak_identities)
+    pinned_count = len(_node_cache._pinned_identities)
+    evaluate_with_closure_values()
+    assert cache.stats()["hits"] == 1
+    assert len(_node_cache._pinned_identities) == pinned_count + 1
+
+    gc.collect()
+    # The object is released once it's collected.
+    assert len(_node_cache._weak_identities) == weak_count
+    # The list is kept alive until the cache is cleared.
+    cache.clear()
+    assert len(_node_cache._pinned_identities) == 0
+
+
+def test_node_cache_bounds_pinned_closure_values(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from . import _node_cache
+
+    monkeypatch.setattr(_node_cache, "_MAX_PINNED_IDENTITIES", 2)
+    NodeCache().clear()
+    values = [[index] for index in range(3)]
+    tokens = [_node_cache._value_identity(value) for value in values]
+
+    assert len(set(tokens)) == 3
+    assert len(_node_cache._pinned_identities) == 2
+    assert _node_cache._value_identity(values[2]) == tokens[2]
+    # The least recently used is no longer tracked, and gets a new token.
+    assert _node_cache._value_identity(values[0]) not in tokens
+
+
+def test_node_cache_namespace(tmp_path: Path) -> None:
+    calls: list[str] = []
+    evaluate(
+        counting_compute_process(NodeCache(directory=tmp_path, namespace="1"), calls),
+        a=1.0,
+        b=2.0,
+    )
+
+    cache = NodeCache(directory=tmp_path, namespace="2")
+    evaluate(counting_compute_process(cache, calls), a=1.0, b=2.0)
+    assert cache.stats()["disk_hits"] == 0
+
+    cache = NodeCache(directory=tmp_path, namespace="1")
+    evaluate(counting_compute_process(cache, calls), a=1.0, b=2.0)
+    assert cache.stats()["disk_hits"] == 2
@@ -1,9 +1,8 @@
 import typing as t
-from artifax.exceptions import UnresolvedDependencyError
 from jsonschema.exceptions import ValidationError
 import pytest
 
-from . import DefaultStateManagerProtocol
+from . import DefaultStateManagerProtocol, UnresolvedDependencyError
 from .testing_examples import (
     MyComputeProcess,
     MyComputeProcessSubclass,
@@ -235,3 +234,235 @@ def test_state_manager_serializes_custom_type() -> None:
         "count": 25,
     }
     assert serialized["other_thing"] == [1.52, 2.52, 3.52]
+
+
+def test_state_manager_evaluates_only_missing_ancestors() -> None:
+    from . import Input, bind_state_manager, intermediate, output
+
+    calls: list[str] = []
+
+    @bind_state_manager()
+    class CountingComputeProcess:
+        a = Input(value_type=int)
+        b = Input(value_type=int)
+
+        @intermediate(value_type=int)
+        def i(self, a: int) -> int:
+            calls.append("i")
+            return a
+
+        @intermediate(value_type=int)
+        def j(self, b: int) -> int:
+            calls.append("j")
+            return b
+
+        @output(value_type=int)
+        def r(self, i: int, j: int) -> int:
+            calls.append("r")
+            return i + j
+
+    process = CountingComputeProcess()
+    state_manager = t.cast(DefaultStateManagerProtocol, process).state_manager
+    state_manager.set(a=1)
+
+    # `b` isn't needed.
+    state_manager.evaluate(targets=["i"])
+    assert calls == ["i"]
+
+    state_manager.set(b=2)
+    assert t.cast(t.Any, process).r == 3
+    assert calls == ["i", "j", "r"]
+
+    # Stored values are not recomputed.
+    assert t.cast(t.Any, process).r == 3
+    state_manager.evaluate()
+    assert calls == ["i", "j", "r"]
+
+
+def test_state_manager_evaluate_reports_missing_dependencies() -> None:
+    state_manager = t.cast(
+        DefaultStateManagerProtocol, MyComputeProcess()
+    ).state_manager
+    state_manager.set(a=1)
+
+    with pytest.raises(UnresolvedDependencyError, match=r"^Missing dependencies: b$"):
+        state_manager.evaluate(targets=["r"])
+    # Nothing is evaluated.
+    assert state_manager.store == {"a": 1}
+
+    with pytest.raises(UnresolvedDependencyError) as e:
+        t.cast(DefaultStateManagerProtocol, MyComputeProcess()).state_manager.evaluate()
+    assert e.value.dependencies == ["a", "b"]
+
+
+def test_state_manager_shares_dependency_graph_per_class() -> None:
+    assert (
+        t.cast(
+            DefaultStateManagerProtocol, MyComputeProcess()
+        ).state_manager.dependency_graph
+        is t.cast(
+            DefaultStateManagerProtocol, MyComputeProcess()
+        ).state_manager.dependency_graph
+    )
+
+
+def test_state_manager_evaluate_in_parallel() -> None:
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from . import Input, bind_state_manager, intermediate, output
+
+    # Both branches must be running at once to pass the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+
+    @bind_state_manager()
+    class BranchingComputeProcess:
+        a = Input(value_type=int)
+        b = Input(value_type=int)
+
+        @intermediate(value_type=int)
+        def i(self, a: int) -> int:
+            barrier.wait()
+            return a
+
+        @intermediate(value_type=int)
+        def j(self, b: int) -> int:
+            barrier.wait()
+            return b
+
+        @output(value_type=int)
+        def r(self, i: int, j: int) -> int:
+            return i + j
+
+    state_manager = t.cast(
+        DefaultStateManagerProtocol, BranchingComputeProcess()
+    ).state_manager
+    state_manager.set(a=1, b=2)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        state_manager.evaluate(executor=executor)
+
+    assert state_manager.store == {"a": 1, "b": 2, "i": 1, "j": 2, "r": 3}
+
+
+def test_state_manager_evaluate_in_parallel_with_max_parallelism() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    state_manager = t.cast(
+        DefaultStateManagerProtocol, MyComputeProcessWithCustomType()
+    ).state_manager
+    state_manager.set(a=1, b=2)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        state_manager.evaluate(executor=executor, max_parallelism=1)
+
+    assert state_manager.store["further_derived_thing"] == "(1.52, 2.52, 3.52)"
+
+    with pytest.raises(ValueError, match="max_parallelism should be at least 1"):
+        state_manager.evaluate(executor=executor, max_parallelism=0)
+
+
+def test_state_manager_evaluate_rejects_process_pool() -> None:
+    from concurrent.futures import ProcessPoolExecutor
+
+    state_manager = t.cast(
+        DefaultStateManagerProtocol, MyComputeProcessWithCustomType()
+    ).state_manager
+    state_manager.set(a=1, b=2)
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(
+            ValueError, match=r"^executor should be a ThreadPoolExecutor$"
+        ):
+            state_manager.evaluate(executor=executor)
+
+    assert "further_derived_thing" not in state_manager.store
+
+
+def test_state_manager_evaluate_in_parallel_exceptions() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    state_manager = t.cast(
+        DefaultStateManagerProtocol, MyRaisingComputeProcess()
+    ).state_manager
+    state_manager.set(a=1, b=1)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(ValueError, match="Whoops"):
+            state_manager.evaluate(executor=executor)
+
+    assert "s" not in state_manager.store
+    assert "t" not in state_manager.store
+
+
+def test_state_manager_set_invalidates_dependents() -> None:
+    state_manager = t.cast(
+        DefaultStateManagerProtocol, MyComputeProcess()
+    ).state_manager
+    state_manager.set(a=1, b=2)
+    state_manager.evaluate()
+
+    state_manager.set(a=5)
+    assert state_manager.store == {"a": 5, "b": 2, "j": 2}
+
+    state_manager.evaluate()
+    assert state_manager.store == {"a": 5, "b": 2, "i": 5, "j": 2, "r": 7}
+
+    # An equal value doesn't invalidate anything.
+    state_manager.set(a=5)
+    assert state_manager.store == {"a": 5, "b": 2, "i": 5, "j": 2, "r": 7}
+
+    # Values set along with the changed inputs are kept.
+    state_manager.set(b=3, j=10)
+    assert state_manager.store == {"a": 5, "b": 3, "i": 5, "j": 10}
+
+
+def test_state_manager_deserialize_invalidates_dependents() -> None:
+    state_manager = t.cast(
+        DefaultStateManagerProtocol, MyComputeProcessWithCustomType()
+    ).state_manager
+    state_manager.set(a=1, b=2)
+    state_manager.evaluate()
+
+    state_manager.deserialize(other_thing=[3, 4, 5])
+    assert "further_derived_thing" not in state_manager.store
+
+    state_manager.evaluate()
+    assert state_manager.store["further_derived_thing"] == "(3, 4, 5)"
+
+
+def test_state_manager_recomputes_only_affected_nodes() -> None:
+    from . import Input, bind_state_manager, intermediate, output
+
+    calls: list[str] = []
+
+    @bind_state_manager()
+    class CountingComputeProcess:
+        a = Input(value_type=int)
+        b = Input(value_type=int)
+
+        @intermediate(value_type=int)
+        def i(self, a: int) -> int:
+            calls.append("i")
+            return a
+
+        @intermediate(value_type=int)
+        def j(self, b: int) -> int:
+            calls.append("j")
+            return b
+
+        @output(value_type=int)
+        def r(self, i: int, j: int) -> int:
+            calls.append("r")
+            return i + j
+
+    process = t.cast(t.Any, CountingComputeProcess())
+    state_manager = t.cast(DefaultStateManagerProtocol, process).state_manager
+    state_manager.set(a=1, b=2)
+    assert process.r == 3
+
+    calls.clear()
+    # Setting `a=1` again is a no-op.
+    for a in range(1, 5):
+        state_manager.set(a=a)
+        assert process.r == a + 2
+    assert calls == ["i", "r"] * 3
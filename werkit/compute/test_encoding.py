@@ -0,0 +1,116 @@
+import json
+import math
+import typing as t
+import pytest
+from werkit.compute import (
+    Destination,
+    MissouriEncoder,
+    OrjsonEncoder,
+    StandardEncoder,
+    default_encoder,
+    get_encoder,
+)
+
+EXAMPLE_VALUE = {
+    "someString": "this is a string! ✓",
+    "someNumber": math.pi,
+    "someList": [1, 2.5, None, True, {"nested": []}],
+}
+
+
+class ForJson:
+    def for_json(self) -> t.Any:
+        return {"encoded": True}
+
+
+@pytest.mark.parametrize("name", ["missouri", "standard", "orjson"])
+def test_encoders_round_trip(name: t.Any) -> None:
+    if name == "orjson":
+        pytest.importorskip("orjson")
+    encoder = get_encoder(name)
+    assert encoder.name == name
+
+    encoded = encoder.encode(EXAMPLE_VALUE)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == EXAMPLE_VALUE
+
+
+@pytest.mark.parametrize("name", ["missouri", "standard", "orjson"])
+def test_encoders_encode_for_json(name: t.Any) -> None:
+    if name == "orjson":
+        pytest.importorskip("orjson")
+    assert json.loads(get_encoder(name).encode([ForJson()])) == [{"encoded": True}]
+
+
+@pytest.mark.parametrize("name", ["missouri", "standard", "orjson"])
+def test_encoders_encode_non_string_keys(name: t.Any) -> None:
+    if name == "orjson":
+        pytest.importorskip("orjson")
+    assert json.loads(get_encoder(name).encode({1: "one", 2: {3: "three"}})) == {
+        "1": "one",
+        "2": {"3": "three"},
+    }
+
+
+@pytest.mark.parametrize("name", ["standard", "orjson"])
+def test_encoders_reject_unknown_types(name: t.Any) -> None:
+    if name == "orjson":
+        pytest.importorskip("orjson")
+    with pytest.raises(TypeError):
+        get_encoder(name).encode(object())
+
+
+def test_encoders_encode_numpy_arrays() -> None:
+    np = pytest.importorskip("numpy")
+    value = {
+        "array": np.arange(6, dtype=np.float32).reshape(2, 3),
+        "transposed": np.arange(6, dtype=np.int64).reshape(2, 3).T,
+        "scalar": np.float64(1.5),
+    }
+    expected = {
+        "array": [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]],
+        "transposed": [[0, 3], [1, 4], [2, 5]],
+        "scalar": 1.5,
+    }
+
+    assert json.loads(StandardEncoder().encode(value)) == expected
+    assert json.loads(MissouriEncoder(encode_as_primitives=True).encode(value)) == (
+        expected
+    )
+    try:
+        import orjson  # noqa: F401
+    except ImportError:  # pragma: no cover
+        pass
+    else:
+        assert json.loads(OrjsonEncoder().encode(value)) == expected
+
+
+def test_default_encoder(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("WERKIT_JSON_ENCODER", raising=False)
+    assert isinstance(default_encoder(), MissouriEncoder)
+    assert isinstance(get_encoder(), MissouriEncoder)
+
+    monkeypatch.setenv("WERKIT_JSON_ENCODER", "standard")
+    assert isinstance(default_encoder(), StandardEncoder)
+
+
+def test_get_encoder() -> None:
+    encoder = StandardEncoder()
+    assert get_encoder(encoder) is encoder
+    with pytest.raises(ValueError, match="Unknown encoder: bogus"):
+        get_encoder(t.cast(t.Any, "bogus"))
+
+
+def test_destination_encode() -> None:
+    class EncodingDestination(Destination):
+        def __init__(self, encoder: t.Any = None) -> None:
+            self.encoder = encoder
+
+        def send(self, message_key: t.Any, output_message: t.Any) -> None:
+            pass
+
+    assert EncodingDestination().encode({"a": 1}) == b'{"a": 1}'
+    destination = EncodingDestination(encoder="standard")
+    assert destination.encode({"a": 1}) == b'{"a":1}'
+    assert isinstance(destination.encoder, StandardEncoder)
@@ -0,0 +1,60 @@
+import typing as t
+from werkit.compute import InMemoryMetricsCollector, Manager, Schema, default_key_prefix
+
+schema = Schema.load_relative_to_file(
+    __file__,
+    ["generated", "manager_testing.schema.json"],
+)
+
+
+def example_input_message(message_key: t.Any) -> dict[str, t.Any]:
+    return {"label": "hey", "message": "there", "message_key": message_key}
+
+
+def work(input: t.Any) -> t.Any:
+    if input["message_key"].endswith("bad"):
+        raise ValueError("No good!")
+    return {"someString": "this is a string!", "someNumber": 3.14}
+
+
+def test_default_key_prefix() -> None:
+    assert default_key_prefix("thumbnails/123") == "thumbnails"
+    assert default_key_prefix("thumbnails") == "thumbnails"
+    assert default_key_prefix({"id": 1}) == "*"
+
+
+def test_in_memory_metrics_collector() -> None:
+    collector = InMemoryMetricsCollector()
+    for message_key in ["a/1", "a/2", "a/3", "a/bad", "b/1"]:
+        Manager(
+            input_message=example_input_message(message_key),
+            schema=schema,
+            hooks=[collector],
+        ).work(work, should_send=False, should_return=False)
+
+    summary = collector.summary()
+
+    assert set(summary.keys()) == {"a", "b"}
+    assert summary["a"]["count"] == 4
+    assert summary["a"]["error_origins"] == {"compute": 1}
+    assert summary["b"]["count"] == 1
+    assert summary["b"]["error_origins"] == {}
+    assert set(summary["a"]["duration_seconds"].keys()) == {"p50", "p95", "p99"}
+    assert "work" in summary["a"]["phases"]
+    assert "send" not in summary["a"]["phases"]
+
+    durations = summary["a"]["duration_seconds"]
+    assert durations["p50"] <= durations["p95"] <= durations["p99"]
+
+    collector.reset()
+    assert collector.summary() == {}
+
+
+def test_in_memory_metrics_collector_percentiles() -> None:
+    collector = InMemoryMetricsCollector()
+    assert collector._summarize([float(value) for value in range(100, 0, -1)]) == {
+        "p50": 50.0,
+        "p95": 95.0,
+        "p99": 99.0,
+    }
+    assert collector._summarize([7.0]) == {"p50": 7.0, "p95": 7.0, "p99": 7.0}
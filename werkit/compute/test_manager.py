@@ -1,9 +1,20 @@
 import datetime
 import math
+import time
 import typing as t
 from freezegun import freeze_time
+from jsonschema.exceptions import ValidationError
 import pytest
-from werkit.compute import Manager, Schema, WerkitOutputMessage
+from werkit.compute import (
+    AsyncDestination,
+    Destination,
+    InMemoryMetricsCollector,
+    Manager,
+    ManagerHooks,
+    Schema,
+    ValidationPolicy,
+    WerkitOutputMessage,
+)
 
 EXAMPLE_RUNTIME_INFO = {"foo": "bar"}
 EXAMPLE_MESSAGE_KEY = {"someParameters": ["just", "a", "message", "key", "nbd"]}
@@ -24,7 +35,7 @@ def create_manager(
     input_message: t.Any = EXAMPLE_INPUT_MESSAGE,
     schema: Schema = schema,
     runtime_info: t.Any = EXAMPLE_RUNTIME_INFO,
-    **kwargs: t.Any
+    **kwargs: t.Any,
 ) -> Manager:
     return Manager(
         input_message=input_message, schema=schema, runtime_info=runtime_info, **kwargs
@@ -222,3 +233,805 @@ def test_verbose_error(capfd: pytest.CaptureFixture[str]) -> None:
 
     out, err = capfd.readouterr()
     assert err == "Errored in 0.0 sec\n"
+
+
+class RecordingDestination(Destination):
+    def __init__(self) -> None:
+        self.sent: list[tuple[t.Any, t.Any]] = []
+
+    def send(self, message_key: t.Any, output_message: t.Any) -> None:
+        self.sent.append((message_key, output_message))
+
+
+def test_manager_validates_each_message_once_on_success() -> None:
+    def work(input: t.Any) -> t.Any:
+        return EXAMPLE_RESULT
+
+    destination = RecordingDestination()
+    manager = create_manager(destination=destination)
+    output_message = manager.work(work, should_send=True, should_return=True)
+
+    assert output_message["success"] is True
+    assert manager.validation_trace == [
+        "input_message",
+        "output",
+        "output_message_envelope",
+    ]
+    assert destination.sent == [(EXAMPLE_MESSAGE_KEY, output_message)]
+
+
+def test_manager_validates_each_message_once_on_error() -> None:
+    def work(input: t.Any) -> t.Any:
+        raise ValueError("No good!")
+
+    destination = RecordingDestination()
+    manager = create_manager(destination=destination)
+    output_message = manager.work(work, should_send=True, should_return=True)
+
+    assert output_message["success"] is False
+    assert manager.validation_trace == ["input_message", "output_message"]
+    assert destination.sent == [(EXAMPLE_MESSAGE_KEY, output_message)]
+
+
+def test_manager_validates_each_message_once_when_input_message_fails_validation() -> (
+    None
+):
+    from unittest.mock import Mock
+
+    mock = Mock()
+    destination = RecordingDestination()
+    manager = create_manager(
+        input_message={"message_key": None}, destination=destination
+    )
+    output_message = manager.work(mock, should_send=True, should_return=True)
+
+    mock.assert_not_called()
+    assert output_message["success"] is False
+    assert output_message["error"][-1].startswith(
+        "jsonschema.exceptions.ValidationError"
+    )
+    assert manager.output_message is output_message
+    assert manager.validation_trace == ["input_message", "output_message"]
+    assert destination.sent == [(None, output_message)]
+
+
+@pytest.mark.parametrize(
+    "validation_policy,expected_trace",
+    [
+        (ValidationPolicy(), ["input_message", "output", "output_message_envelope"]),
+        (
+            ValidationPolicy(level="sampled", sample_rate=1),
+            ["input_message", "output", "output_message_envelope"],
+        ),
+        (ValidationPolicy(level="sampled", sample_rate=0), ["input_message"]),
+        (ValidationPolicy(level="input_only"), ["input_message"]),
+        (ValidationPolicy(level="off"), []),
+    ],
+)
+def test_manager_validation_policy(
+    validation_policy: ValidationPolicy, expected_trace: list[str]
+) -> None:
+    def work(input: t.Any) -> t.Any:
+        return EXAMPLE_RESULT
+
+    manager = create_manager(validation_policy=validation_policy)
+    output_message = manager.work(work, should_send=False, should_return=True)
+
+    assert output_message["success"] is True
+    assert manager.validation_trace == expected_trace
+
+
+def test_manager_validation_policy_off_skips_result_validation() -> None:
+    def work(input: t.Any) -> t.Any:
+        return {"not": "valid"}
+
+    output_message = create_manager(validation_policy=ValidationPolicy("off")).work(
+        work, should_send=False, should_return=True
+    )
+    assert output_message["success"] is True
+
+    output_message = create_manager().work(work, should_send=False, should_return=True)
+    assert output_message["success"] is False
+
+
+def test_manager_validation_policy_from_schema() -> None:
+    schema = Schema.load_relative_to_file(
+        __file__,
+        ["generated", "manager_testing.schema.json"],
+        validation_policy=ValidationPolicy(level="input_only"),
+    )
+
+    manager = create_manager(schema=schema)
+    assert manager.validation_policy is schema.validation_policy
+
+    manager = create_manager(
+        schema=schema, validation_policy=ValidationPolicy(level="off")
+    )
+    manager.work(lambda input: EXAMPLE_RESULT, should_send=False, should_return=True)
+    assert manager.validation_trace == []
+
+
+def test_manager_validation_policy_from_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("WERKIT_VALIDATION_LEVEL", "input_only")
+
+    manager = create_manager()
+    manager.work(lambda input: EXAMPLE_RESULT, should_send=False, should_return=True)
+    assert manager.validation_trace == ["input_message"]
+
+
+class RecordingBatchDestination(RecordingDestination):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[tuple[t.Any, t.Any]]] = []
+
+    def send_batch(self, messages: t.Sequence[tuple[t.Any, t.Any]]) -> None:
+        self.batches.append(list(messages))
+
+
+def example_input_message(index: int) -> dict[str, t.Any]:
+    return {"label": "hey", "message": str(index), "message_key": index}
+
+
+@freeze_time("2019-12-31")
+def test_manager_work_batch() -> None:
+    def work(input: t.Any) -> t.Any:
+        if input["message"] == "1":
+            raise ValueError("No good!")
+        return {"someString": input["message"], "someNumber": input["message_key"]}
+
+    input_messages = [
+        example_input_message(0),
+        example_input_message(1),
+        {"message_key": 2},
+        example_input_message(3),
+    ]
+
+    destination = RecordingBatchDestination()
+    output_messages: list[WerkitOutputMessage[t.Any, t.Any]] = Manager.work_batch(
+        work,
+        input_messages,
+        schema=schema,
+        destination=destination,
+        runtime_info=EXAMPLE_RUNTIME_INFO,
+        should_send=True,
+        should_return=True,
+    )
+
+    assert [output_message["message_key"] for output_message in output_messages] == [
+        0,
+        1,
+        2,
+        3,
+    ]
+    assert output_messages[0] == {
+        "message_key": 0,
+        "success": True,
+        "result": {"someString": "0", "someNumber": 0},
+        "error": None,
+        "error_origin": None,
+        "start_time": datetime.datetime(2019, 12, 31).astimezone().isoformat(),
+        "duration_seconds": 0,
+        "runtime_info": EXAMPLE_RUNTIME_INFO,
+    }
+    assert output_messages[1]["success"] is False
+    assert output_messages[1]["error"] is not None
+    assert output_messages[1]["error"][-1] == "ValueError: No good!\n"
+    assert output_messages[2]["success"] is False
+    assert output_messages[3]["success"] is True
+
+    assert destination.sent == []
+    assert destination.batches == [
+        [
+            (output_message["message_key"], output_message)
+            for output_message in output_messages
+        ]
+    ]
+
+
+def test_manager_work_batch_validates_inputs_before_work() -> None:
+    from unittest.mock import Mock
+
+    mock = Mock(return_value=EXAMPLE_RESULT)
+
+    with pytest.raises(ValidationError):
+        Manager.work_batch(
+            mock,
+            [example_input_message(0), {"message_key": 1}],
+            schema=schema,
+            handle_exceptions=False,
+            should_send=False,
+            should_return=True,
+        )
+
+    mock.assert_not_called()
+
+
+def test_manager_work_batch_times_each_item() -> None:
+    import time
+
+    sleep_seconds = [0.05, 0.25]
+
+    def work(input: t.Any) -> t.Any:
+        time.sleep(sleep_seconds[input["message_key"]])
+        return EXAMPLE_RESULT
+
+    output_messages: list[WerkitOutputMessage[t.Any, t.Any]] = Manager.work_batch(
+        work,
+        [example_input_message(0), example_input_message(1)],
+        schema=schema,
+        should_send=False,
+        should_return=True,
+    )
+
+    # Rather than an upper bound, which is flaky on a loaded machine, check
+    # that each item is timed separately.
+    durations = [message["duration_seconds"] for message in output_messages]
+    assert durations[0] >= sleep_seconds[0]
+    assert durations[1] >= sleep_seconds[1]
+    assert durations[1] - durations[0] >= 0.1
+    assert output_messages[0]["start_time"] < output_messages[1]["start_time"]
+
+
+def test_manager_work_batch_with_default_send_batch() -> None:
+    destination = RecordingDestination()
+    output_messages = Manager.work_batch(
+        lambda input: EXAMPLE_RESULT,
+        [example_input_message(0), example_input_message(1)],
+        schema=schema,
+        destination=destination,
+        should_send=True,
+        should_return=False,
+    )
+
+    assert output_messages is None
+    assert [message_key for message_key, _ in destination.sent] == [0, 1]
+
+
+def test_manager_work_batch_requires_destination_to_send() -> None:
+    with pytest.raises(
+        ValueError, match=r"With `should_send=True`, expected a destination"
+    ):
+        Manager.work_batch(
+            lambda input: EXAMPLE_RESULT,
+            [example_input_message(0)],
+            schema=schema,
+            should_send=True,
+            should_return=False,
+        )
+
+
+def work_on_example_input_message(input: t.Any) -> t.Any:
+    if input["message"] == "1":
+        raise ValueError("No good!")
+    return {"someString": input["message"], "someNumber": input["message_key"]}
+
+
+def test_manager_work_batch_with_thread_pool() -> None:
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Every item must start before any can finish, which proves they run
+    # concurrently. When they don't, the barrier times out and the items fail.
+    barrier = threading.Barrier(3, timeout=10)
+
+    def work(input: t.Any) -> t.Any:
+        barrier.wait()
+        # Finish in the reverse order.
+        time.sleep(0.1 - 0.05 * input["message_key"])
+        return work_on_example_input_message(input)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        output_messages: list[WerkitOutputMessage[t.Any, t.Any]] = Manager.work_batch(
+            work,
+            [example_input_message(index) for index in range(3)],
+            schema=schema,
+            executor=executor,
+            should_send=False,
+            should_return=True,
+        )
+
+    assert [output_message["message_key"] for output_message in output_messages] == [
+        0,
+        1,
+        2,
+    ]
+    assert [output_message["success"] for output_message in output_messages] == [
+        True,
+        False,
+        True,
+    ]
+    assert output_messages[0]["duration_seconds"] >= 0.1
+
+
+def test_manager_work_batch_with_process_pool() -> None:
+    from concurrent.futures import ProcessPoolExecutor
+
+    destination = RecordingBatchDestination()
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        output_messages: list[WerkitOutputMessage[t.Any, t.Any]] = Manager.work_batch(
+            work_on_example_input_message,
+            [example_input_message(index) for index in range(4)],
+            schema=schema,
+            destination=destination,
+            executor=executor,
+            should_send=True,
+            should_return=True,
+        )
+
+    assert [output_message["success"] for output_message in output_messages] == [
+        True,
+        False,
+        True,
+        True,
+    ]
+    assert output_messages[3]["result"] == {"someString": "3", "someNumber": 3}
+    error = output_messages[1]["error"]
+    assert error is not None
+    assert "ValueError: No good!\n" in error
+    assert len(destination.batches) == 1
+    assert [message_key for message_key, _ in destination.batches[0]] == [0, 1, 2, 3]
+
+
+def test_manager_work_batch_with_executor_passes_error() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    destination = RecordingBatchDestination()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(ValueError, match=r"No good!$"):
+            Manager.work_batch(
+                work_on_example_input_message,
+                [example_input_message(index) for index in range(4)],
+                schema=schema,
+                destination=destination,
+                executor=executor,
+                handle_exceptions=False,
+                should_send=True,
+                should_return=True,
+            )
+
+    assert destination.batches == []
+
+
+class RecordingAsyncDestination(AsyncDestination):
+    def __init__(self) -> None:
+        self.sent: list[tuple[t.Any, t.Any]] = []
+
+    async def asend(self, message_key: t.Any, output_message: t.Any) -> None:
+        import asyncio
+
+        await asyncio.sleep(0)
+        self.sent.append((message_key, output_message))
+
+
+def test_manager_awork() -> None:
+    import asyncio
+
+    started: list[t.Any] = []
+    all_started = asyncio.Event()
+
+    async def work(input: t.Any) -> t.Any:
+        # Wait until every computation has started, which proves they run
+        # concurrently. When they don't, this times out.
+        started.append(input["message_key"])
+        if len(started) == 5:
+            all_started.set()
+        await asyncio.wait_for(all_started.wait(), timeout=10)
+        return {"someString": input["message"], "someNumber": input["message_key"]}
+
+    destination = RecordingAsyncDestination()
+
+    async def main() -> list[WerkitOutputMessage[t.Any, t.Any]]:
+        return await asyncio.gather(
+            *[
+                create_manager(
+                    input_message=example_input_message(index),
+                    destination=destination,
+                ).awork(work, should_send=True, should_return=True)
+                for index in range(5)
+            ]
+        )
+
+    output_messages = asyncio.run(main())
+
+    assert sorted(started) == list(range(5))
+    assert [output_message["result"] for output_message in output_messages] == [
+        {"someString": str(index), "someNumber": index} for index in range(5)
+    ]
+    assert sorted(message_key for message_key, _ in destination.sent) == list(range(5))
+
+
+def test_manager_awork_accepts_synchronous_function_and_destination() -> None:
+    import asyncio
+
+    destination = RecordingDestination()
+    manager = create_manager(destination=destination)
+    output_message = asyncio.run(
+        manager.awork(
+            lambda input: EXAMPLE_RESULT, should_send=True, should_return=True
+        )
+    )
+
+    assert output_message["success"] is True
+    assert destination.sent == [(EXAMPLE_MESSAGE_KEY, output_message)]
+
+
+def test_manager_awork_serializes_error() -> None:
+    import asyncio
+
+    async def work(input: t.Any) -> t.Any:
+        raise ValueError("No good!")
+
+    destination = RecordingAsyncDestination()
+    output_message = asyncio.run(
+        create_manager(destination=destination).awork(
+            work, should_send=True, should_return=True
+        )
+    )
+
+    assert output_message["error"] is not None
+    assert output_message["error"][-1] == "ValueError: No good!\n"
+    assert destination.sent == [(EXAMPLE_MESSAGE_KEY, output_message)]
+
+
+def test_manager_awork_sends_once_when_input_message_fails_validation() -> None:
+    import asyncio
+    from unittest.mock import Mock
+
+    mock = Mock()
+    destination = RecordingAsyncDestination()
+    manager = create_manager(
+        input_message={"message_key": None}, destination=destination
+    )
+    output_message = asyncio.run(
+        manager.awork(mock, should_send=True, should_return=True)
+    )
+
+    mock.assert_not_called()
+    assert output_message["success"] is False
+    assert destination.sent == [(None, output_message)]
+
+
+def test_manager_awork_with_handle_exceptions_false_passes_error() -> None:
+    import asyncio
+
+    async def work(input: t.Any) -> t.Any:
+        raise ValueError("No good!")
+
+    with pytest.raises(ValueError, match=r"No good!$"):
+        asyncio.run(
+            create_manager(handle_exceptions=False).awork(
+                work, should_send=False, should_return=True
+            )
+        )
+
+
+def test_manager_work_rejects_async_destination() -> None:
+    with pytest.raises(
+        ValueError,
+        match=r"To send to an AsyncDestination, use `awork\(\)` or `async with`",
+    ):
+        create_manager(destination=RecordingAsyncDestination()).work(
+            lambda input: EXAMPLE_RESULT, should_send=True, should_return=True
+        )
+
+
+def test_async_destination_asend_batch() -> None:
+    import asyncio
+
+    destination = RecordingAsyncDestination()
+    asyncio.run(destination.asend_batch([(1, "one"), (2, "two")]))
+    assert sorted(destination.sent) == [(1, "one"), (2, "two")]
+
+
+def test_manager_records_timings() -> None:
+    def work(input: t.Any) -> t.Any:
+        time.sleep(0.1)
+        return EXAMPLE_RESULT
+
+    manager = create_manager(destination=RecordingDestination())
+    output_message = manager.work(work, should_send=True, should_return=True)
+
+    assert "timings" not in output_message
+    assert set(manager.timings.keys()) == {
+        "input_validation",
+        "work",
+        "result_validation",
+        "serialization",
+        "output_validation",
+        "send",
+    }
+    assert manager.timings["work"] >= 0.1
+    assert manager.timings["input_validation"] < 0.1
+
+
+def test_manager_includes_timings_in_output_message() -> None:
+    def work(input: t.Any) -> t.Any:
+        time.sleep(0.1)
+        return EXAMPLE_RESULT
+
+    manager = create_manager(include_timings=True)
+    output_message = manager.work(work, should_send=False, should_return=True)
+
+    assert output_message["success"] is True
+    assert set(output_message["timings"].keys()) == {
+        "input_validation",
+        "work",
+        "result_validation",
+    }
+    assert output_message["timings"]["work"] >= 0.1
+    assert schema.output_message is not None
+    schema.output_message.validate(output_message)
+
+
+def test_manager_includes_timings_in_error_output_message() -> None:
+    def work(input: t.Any) -> t.Any:
+        raise ValueError("No good!")
+
+    manager = create_manager(include_timings=True)
+    output_message = manager.work(work, should_send=False, should_return=True)
+
+    assert output_message["success"] is False
+    assert set(output_message["timings"].keys()) == {"input_validation", "work"}
+
+
+def test_manager_duration_uses_monotonic_clock() -> None:
+    with freeze_time("2019-12-31") as frozen_time:
+
+        def work(input: t.Any) -> t.Any:
+            frozen_time.tick(datetime.timedelta(seconds=1.5))
+            return EXAMPLE_RESULT
+
+        output_message = create_manager().work(
+            work, should_send=False, should_return=True
+        )
+
+    assert output_message["duration_seconds"] == 1.5
+
+
+class RecordingHooks(ManagerHooks):
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def on_start(self, manager: Manager) -> None:
+        self.calls.append("start")
+
+    def on_validated(self, manager: Manager, target: str) -> None:
+        self.calls.append(f"validated {target}")
+
+    def on_success(self, manager: Manager) -> None:
+        assert manager.output_message is not None
+        self.calls.append("success")
+
+    def on_error(self, manager: Manager, exception: BaseException) -> None:
+        assert manager.output_message is not None
+        self.calls.append(f"error {type(exception).__name__}")
+
+    def on_sent(self, manager: Manager) -> None:
+        self.calls.append("sent")
+
+
+def test_manager_invokes_hooks_on_success() -> None:
+    def work(input: t.Any) -> t.Any:
+        return EXAMPLE_RESULT
+
+    hooks = RecordingHooks()
+    create_manager(destination=RecordingDestination(), hooks=[hooks]).work(
+        work, should_send=True, should_return=False
+    )
+
+    assert hooks.calls == [
+        "start",
+        "validated input_message",
+        "validated output",
+        "validated output_message_envelope",
+        "success",
+        "sent",
+    ]
+
+
+def test_manager_invokes_hooks_on_error() -> None:
+    def work(input: t.Any) -> t.Any:
+        raise ValueError("No good!")
+
+    hooks = RecordingHooks()
+    create_manager(hooks=[hooks]).work(work, should_send=False, should_return=False)
+
+    assert hooks.calls == [
+        "start",
+        "validated input_message",
+        "validated output_message",
+        "error ValueError",
+    ]
+
+
+def test_manager_work_batch_invokes_hooks_on_sent() -> None:
+    hooks = RecordingHooks()
+    managers: list[Manager] = []
+
+    class ManagerRecordingHooks(ManagerHooks):
+        def on_sent(self, manager: Manager) -> None:
+            managers.append(manager)
+
+    Manager.work_batch(
+        lambda input: EXAMPLE_RESULT,
+        [example_input_message(0), example_input_message(1)],
+        schema=schema,
+        destination=RecordingBatchDestination(),
+        hooks=[hooks, ManagerRecordingHooks()],
+        should_send=True,
+        should_return=False,
+    )
+
+    assert hooks.calls.count("success") == 2
+    assert hooks.calls[-2:] == ["sent", "sent"]
+    assert [manager.message_key for manager in managers] == [0, 1]
+    assert all("send" in manager.timings for manager in managers)
+
+
+def test_manager_work_batch_with_hooks_and_process_pool() -> None:
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(
+            ValueError, match=r"^Hooks can only be used with a ThreadPoolExecutor$"
+        ):
+            Manager.work_batch(
+                work_on_example_input_message,
+                [example_input_message(0)],
+                schema=schema,
+                executor=executor,
+                hooks=[InMemoryMetricsCollector()],
+                should_send=False,
+                should_return=True,
+            )
+
+
+def test_manager_work_batch_with_hooks_and_thread_pool() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    collector = InMemoryMetricsCollector()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        Manager.work_batch(
+            work_on_example_input_message,
+            [example_input_message(index) for index in range(3)],
+            schema=schema,
+            destination=RecordingBatchDestination(),
+            executor=executor,
+            hooks=[collector],
+            should_send=True,
+            should_return=False,
+        )
+
+    summary = collector.summary()
+    assert sum(group["count"] for group in summary.values()) == 3
+    assert all("send" in group["phases"] for group in summary.values())
+
+
+def raise_nested_error(depth: int) -> None:
+    if depth == 0:
+        raise ValueError("No good!")
+    raise_nested_error(depth - 1)
+
+
+def test_manager_traceback_limit() -> None:
+    def work(input: t.Any) -> t.Any:
+        raise_nested_error(5)
+
+    output_message = create_manager(traceback_limit=-2).work(
+        work, should_send=False, should_return=True
+    )
+
+    assert output_message["error"] is not None
+    assert output_message["error"][0] == "Traceback (most recent call last):\n"
+    assert len(output_message["error"]) == 4
+    assert "raise_nested_error" in output_message["error"][1]
+    assert output_message["error"][-1] == "ValueError: No good!\n"
+
+
+def test_manager_serializes_error_as_frames() -> None:
+    def work(input: t.Any) -> t.Any:
+        raise_nested_error(2)
+
+    output_message = create_manager(error_format="frames").work(
+        work, should_send=False, should_return=True
+    )
+
+    error = output_message["error"]
+    assert error is not None
+    assert [line.rsplit(" in ", 1)[1] for line in error[:-1]] == [
+        "work\n",
+        "work\n",
+        "raise_nested_error\n",
+        "raise_nested_error\n",
+        "raise_nested_error\n",
+    ]
+    first_line = raise_nested_error.__code__.co_firstlineno
+    assert error[-2] == f"{__file__}:{first_line + 2} in raise_nested_error\n"
+    assert error[-1] == "ValueError: No good!\n"
+    assert schema.output_message is not None
+    schema.output_message.validate(output_message)
+
+
+def test_manager_print_handled_errors_false(capfd: pytest.CaptureFixture[str]) -> None:
+    def work(input: t.Any) -> t.Any:
+        raise ValueError("No good!")
+
+    create_manager(print_handled_errors=False).work(
+        work, should_send=False, should_return=False
+    )
+
+    out, _ = capfd.readouterr()
+    assert out == ""
+
+
+def test_manager_dedupes_printed_errors(capfd: pytest.CaptureFixture[str]) -> None:
+    from ._error_printing import clear_printed_errors
+
+    def work(input: t.Any) -> t.Any:
+        raise ValueError("No good!")
+
+    clear_printed_errors()
+    with freeze_time("2019-12-31") as frozen_time:
+        for _ in range(3):
+            create_manager(error_dedupe_window_seconds=60).work(
+                work, should_send=False, should_return=False
+            )
+        out, _ = capfd.readouterr()
+        assert out.count("ValueError: No good!") == 1
+        assert "suppressed" not in out
+
+        frozen_time.tick(datetime.timedelta(seconds=61))
+        create_manager(error_dedupe_window_seconds=60).work(
+            work, should_send=False, should_return=False
+        )
+        out, _ = capfd.readouterr()
+        assert out.count("ValueError: No good!") == 1
+        assert "(2 identical errors were suppressed" in out
+    clear_printed_errors()
+
+
+def test_manager_encode_output_message() -> None:
+    import json
+
+    def work(input: t.Any) -> t.Any:
+        return EXAMPLE_RESULT
+
+    manager = create_manager(encoder="standard")
+    with pytest.raises(ValueError, match="The output message is not ready"):
+        manager.encode_output_message()
+
+    output_message = manager.work(work, should_send=False, should_return=True)
+
+    assert json.loads(manager.encode_output_message()) == output_message
+
+
+def test_manager_encode_output_message_defaults_to_the_destination_encoder() -> None:
+    from werkit.compute import StandardEncoder
+
+    class RecordingEncoder(StandardEncoder):
+        def __init__(self) -> None:
+            self.values: list[t.Any] = []
+
+        def encode(self, value: t.Any) -> bytes:
+            self.values.append(value)
+            return super().encode(value)
+
+    def work(input: t.Any) -> t.Any:
+        return EXAMPLE_RESULT
+
+    destination = RecordingDestination()
+    destination.encoder = RecordingEncoder()
+    manager = create_manager(destination=destination)
+    output_message = manager.work(work, should_send=False, should_return=True)
+    manager.encode_output_message()
+
+    assert destination.encoder.values == [output_message]
+
+    manager = create_manager(destination=destination, encoder="standard")
+    manager.work(work, should_send=False, should_return=True)
+    manager.encode_output_message()
+
+    assert len(destination.encoder.values) == 1
@@ -0,0 +1,213 @@
+import copy
+import os
+import shutil
+import typing as t
+from pathlib import Path
+import pytest
+from werkit.compute import Schema
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(__file__), "generated", "manager_testing.schema.json"
+)
+
+EXAMPLE_INPUT_MESSAGE = {"label": "hey", "message": "there", "message_key": 1}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    Schema.clear_cache()
+
+
+def test_schema_validates() -> None:
+    schema = Schema.load_from_path(SCHEMA_PATH)
+    assert schema.input_message is not None
+
+    schema.input_message.validate(EXAMPLE_INPUT_MESSAGE)
+    assert not schema.input_message.is_valid({"message_key": 1})
+
+
+def test_schema_reuses_validators_for_the_same_contents() -> None:
+    first = Schema.load_from_path(SCHEMA_PATH)
+    second = Schema.load_from_path(SCHEMA_PATH)
+    assert second.digest == first.digest
+    assert second.registry is first.registry
+    assert second.input_message is first.input_message
+    assert second.output is first.output
+    assert second.output_message is first.output_message
+
+    equal_contents = Schema(schema=copy.deepcopy(first.schema))
+    assert equal_contents.digest == first.digest
+    assert equal_contents.output is first.output
+
+
+def test_schema_loaded_from_path_has_its_own_contents() -> None:
+    first = Schema.load_from_path(SCHEMA_PATH)
+    original = copy.deepcopy(first.schema)
+    first.schema["definitions"]["Input"]["required"].append("other")
+    del first.schema["definitions"]["Output"]
+
+    second = Schema.load_from_path(SCHEMA_PATH)
+    assert second.schema == original
+    assert second.schema is not first.schema
+    assert second.digest == first.digest
+    assert second.input_message is first.input_message
+    assert first.input_message is not None
+    first.input_message.validate(EXAMPLE_INPUT_MESSAGE)
+
+
+def test_schema_caches_validators_by_ref() -> None:
+    schema = Schema.load_from_path(SCHEMA_PATH)
+    other = Schema.load_from_path(
+        SCHEMA_PATH, input_message_ref="#/definitions/Anything"
+    )
+    assert other.input_message is not schema.input_message
+    assert other.output is schema.output
+    assert schema.validator_for("#/definitions/Anything") is other.input_message
+
+
+def test_schema_does_not_share_validators_across_contents() -> None:
+    schema = Schema.load_from_path(SCHEMA_PATH)
+
+    contents = copy.deepcopy(schema.schema)
+    contents["definitions"]["Output"]["required"] = ["someString"]
+    other = Schema(schema=contents)
+
+    assert other.digest != schema.digest
+    assert other.output is not schema.output
+    assert other.output is not None
+    assert other.output.is_valid({"someString": "abc"})
+    assert schema.output is not None
+    assert not schema.output.is_valid({"someString": "abc"})
+
+
+def test_schema_reloads_modified_file(tmp_path: Path) -> None:
+    path = tmp_path / "schema.json"
+    shutil.copyfile(SCHEMA_PATH, path)
+    schema = Schema.load_from_path(str(path))
+
+    path.write_text(path.read_text().replace('"someNumber"]', '"someNumber", "x"]'))
+    os.utime(path, ns=(0, 0))
+    reloaded = Schema.load_from_path(str(path))
+
+    assert reloaded.digest != schema.digest
+    assert reloaded.output is not None
+    assert not reloaded.output.is_valid({"someString": "abc", "someNumber": 1})
+
+
+def test_schema_warm() -> None:
+    schema = Schema.load_from_path(SCHEMA_PATH)
+    assert schema.warm() is schema
+    assert Schema.load_from_path(SCHEMA_PATH).input_message is schema.input_message
+    assert schema.input_message is not None
+    schema.input_message.validate(EXAMPLE_INPUT_MESSAGE)
+
+
+VALID_RESULT = {"someString": "this is a string!", "someNumber": 3.14}
+VALID_SUCCESS_OUTPUT_MESSAGE = {
+    "message_key": {"someParameters": ["just", "a", "message", "key"]},
+    "success": True,
+    "result": VALID_RESULT,
+    "error": None,
+    "error_origin": None,
+    "start_time": "2019-12-31T00:00:00+00:00",
+    "duration_seconds": 0.25,
+    "runtime_info": {"foo": "bar"},
+}
+VALID_ERROR_OUTPUT_MESSAGE = {
+    **VALID_SUCCESS_OUTPUT_MESSAGE,
+    "success": False,
+    "result": None,
+    "error": ["Traceback (most recent call last):\n", "ValueError: No good!\n"],
+    "error_origin": "compute",
+}
+
+
+def _without(message: dict, key: str) -> dict:
+    return {k: v for k, v in message.items() if k != key}
+
+
+# Output messages whose results (if any) are valid, paired with a description.
+# The envelope validator must agree with the full validator on all of them.
+ENVELOPE_EXAMPLES = [
+    ("valid success", VALID_SUCCESS_OUTPUT_MESSAGE),
+    ("valid error", VALID_ERROR_OUTPUT_MESSAGE),
+    ("no runtime info", _without(VALID_SUCCESS_OUTPUT_MESSAGE, "runtime_info")),
+    ("no message key", _without(VALID_SUCCESS_OUTPUT_MESSAGE, "message_key")),
+    ("no start time", _without(VALID_SUCCESS_OUTPUT_MESSAGE, "start_time")),
+    ("no duration", _without(VALID_SUCCESS_OUTPUT_MESSAGE, "duration_seconds")),
+    ("no error", _without(VALID_SUCCESS_OUTPUT_MESSAGE, "error")),
+    ("no result", _without(VALID_SUCCESS_OUTPUT_MESSAGE, "result")),
+    ("bad start time", {**VALID_SUCCESS_OUTPUT_MESSAGE, "start_time": 123}),
+    ("bad duration", {**VALID_SUCCESS_OUTPUT_MESSAGE, "duration_seconds": "1"}),
+    ("bad success", {**VALID_SUCCESS_OUTPUT_MESSAGE, "success": "yes"}),
+    ("success with error", {**VALID_SUCCESS_OUTPUT_MESSAGE, "error": ["x"]}),
+    ("success with origin", {**VALID_SUCCESS_OUTPUT_MESSAGE, "error_origin": "system"}),
+    ("extra property", {**VALID_SUCCESS_OUTPUT_MESSAGE, "bogus": 1}),
+    ("error with result", {**VALID_ERROR_OUTPUT_MESSAGE, "result": VALID_RESULT}),
+    ("error without error", {**VALID_ERROR_OUTPUT_MESSAGE, "error": None}),
+    ("bad error origin", {**VALID_ERROR_OUTPUT_MESSAGE, "error_origin": "bogus"}),
+    ("bad error items", {**VALID_ERROR_OUTPUT_MESSAGE, "error": [1, 2]}),
+    ("not an object", []),
+]
+
+
+@pytest.mark.parametrize(
+    "output_message",
+    [example for _, example in ENVELOPE_EXAMPLES],
+    ids=[description for description, _ in ENVELOPE_EXAMPLES],
+)
+def test_schema_envelope_validation_is_equivalent_to_full_validation(
+    output_message: t.Any,
+) -> None:
+    schema = Schema.load_from_path(SCHEMA_PATH)
+    assert schema.output_message is not None
+    assert schema.output_message_envelope is not None
+
+    assert schema.output_message_envelope.is_valid(
+        output_message
+    ) == schema.output_message.is_valid(output_message)
+
+
+def test_schema_envelope_validation_skips_the_result() -> None:
+    schema = Schema.load_from_path(SCHEMA_PATH)
+    assert schema.output_message is not None
+    assert schema.output_message_envelope is not None
+
+    output_message = {**VALID_SUCCESS_OUTPUT_MESSAGE, "result": {"bogus": True}}
+    assert not schema.output_message.is_valid(output_message)
+    assert schema.output_message_envelope.is_valid(output_message)
+
+
+def test_schema_envelope_does_not_modify_the_schema() -> None:
+    schema = Schema.load_from_path(SCHEMA_PATH)
+    contents = copy.deepcopy(schema.schema)
+
+    Schema(schema=schema.schema, output_ref="#/definitions/Output")
+
+    assert schema.schema == contents
+    assert schema.schema["definitions"]["Output"] != {}
+
+
+def test_schema_envelope_requires_a_resolvable_output_ref() -> None:
+    schema = Schema.load_from_path(SCHEMA_PATH)
+    assert (
+        Schema(schema=schema.schema, output_ref="#/definitions/Bogus")
+    ).output_message_envelope is None
+    assert (
+        Schema(schema=schema.schema, output_ref="other.json#/definitions/Output")
+    ).output_message_envelope is None
+
+
+def test_schema_pickles() -> None:
+    import pickle
+
+    from werkit.compute import ValidationPolicy
+
+    schema = Schema.load_from_path(
+        SCHEMA_PATH, validation_policy=ValidationPolicy(level="input_only")
+    )
+    unpickled = pickle.loads(pickle.dumps(schema))
+
+    assert unpickled.digest == schema.digest
+    assert unpickled.input_message is schema.input_message
+    assert unpickled.validation_policy.level == "input_only"
@@ -0,0 +1,43 @@
+import pytest
+from werkit.compute import ValidationPolicy
+
+
+def test_validation_policy_targets() -> None:
+    assert ValidationPolicy().targets() == {"input_message", "output", "output_message"}
+    assert ValidationPolicy(level="input_only").targets() == {"input_message"}
+    assert ValidationPolicy(level="off").targets() == set()
+
+
+def test_validation_policy_sampled() -> None:
+    assert ValidationPolicy(level="sampled", sample_rate=1).targets() == {
+        "input_message",
+        "output",
+        "output_message",
+    }
+    assert ValidationPolicy(level="sampled", sample_rate=0).targets() == {
+        "input_message"
+    }
+
+    policy = ValidationPolicy.production(sample_rate=0.5)
+    sampled = [len(policy.targets()) == 3 for _ in range(1000)]
+    assert 350 < sum(sampled) < 650
+
+
+def test_validation_policy_rejects_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="Unknown validation level: bogus"):
+        ValidationPolicy(level="bogus")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="Expected sample_rate to be between 0 and 1"):
+        ValidationPolicy(level="sampled", sample_rate=1.5)
+
+
+def test_validation_policy_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("WERKIT_VALIDATION_LEVEL", raising=False)
+    monkeypatch.delenv("WERKIT_VALIDATION_SAMPLE_RATE", raising=False)
+    policy = ValidationPolicy.from_environment()
+    assert policy.level == "full"
+
+    monkeypatch.setenv("WERKIT_VALIDATION_LEVEL", "sampled")
+    monkeypatch.setenv("WERKIT_VALIDATION_SAMPLE_RATE", "0.25")
+    policy = ValidationPolicy.from_environment()
+    assert policy.level == "sampled"
+    assert policy.sample_rate == 0.25
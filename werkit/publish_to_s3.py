@@ -1,8 +1,13 @@
 import os
+import sys
 import typing as t
 
+from .aws_clients import get_client
 from .common.cli_common import InferredFunctionEnvironment
 
+if t.TYPE_CHECKING:  # pragma: no cover
+    from mypy_boto3_s3.client import S3Client
+
 
 def local_path_for_built_lambda(function_name: str) -> str:
     return os.path.join("lambdas", f"{function_name}.zip")
@@ -44,34 +49,100 @@ def s3_key_for_manifest(
     )
 
 
+# The user-defined metadata key for the SHA-256 digest of a published file.
+SHA256_METADATA_KEY = "sha256"
+
+
+def _file_digests(filename: str) -> tuple[str, str]:
+    """
+    Return the hex SHA-256 and MD5 digests of the file, reading it once, in
+    chunks.
+    """
+    import hashlib
+
+    sha256 = hashlib.sha256()
+    md5 = hashlib.md5(usedforsecurity=False)
+    with open(filename, "rb") as f:
+        while chunk := f.read(2**20):
+            sha256.update(chunk)
+            md5.update(chunk)
+    return sha256.hexdigest(), md5.hexdigest()
+
+
+def _is_identical(head: t.Mapping[str, t.Any], sha256: str, md5: str) -> bool:
+    """
+    Compare a published object to a local file using the digest stored in its
+    metadata. Objects published without one are compared by ETag, which is
+    the MD5 digest of objects uploaded in a single part. A multipart ETag
+    can't be compared, so those objects are assumed to differ.
+    """
+    published_sha256 = head.get("Metadata", {}).get(SHA256_METADATA_KEY)
+    if published_sha256 is not None:
+        return bool(published_sha256 == sha256)
+    return bool(head.get("ETag", "").strip('"') == md5)
+
+
 def publish_file_to_s3(
-    key: str, filename: str, bucket_name: str, verbose: bool
+    key: str,
+    filename: str,
+    bucket_name: str,
+    verbose: bool,
+    s3_client: t.Optional["S3Client"] = None,
+    content_addressed: bool = False,
 ) -> None:
-    import boto3
+    """
+    Upload the file, refusing to replace an existing object.
 
-    client = boto3.client("s3")
+    With `content_addressed=True`, the file is uploaded along with its
+    SHA-256 digest. When the object already exists with the same contents,
+    the upload is skipped, so publishing the same file again is a no-op; it's
+    refused only when the contents differ.
+    """
 
-    def exists() -> bool:
-        try:
-            client.head_object(Bucket=bucket_name, Key=key)
-        except client.exceptions.ClientError as e:
-            if e.response["Error"]["Code"] == 404:
-                return True
-        return False
+    def pif(x: str) -> None:
+        if verbose:
+            print(x, file=sys.stderr)
 
-    if exists():
-        raise ValueError(f"s3://{bucket_name}/{key} already exists on S3")
+    client = get_client("s3") if s3_client is None else s3_client
+    file_on_s3 = f"s3://{bucket_name}/{key}"
 
+    def head() -> t.Optional[t.Mapping[str, t.Any]]:
+        try:
+            return client.head_object(Bucket=bucket_name, Key=key)
+        except client.exceptions.ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    existing = head()
+
+    if not content_addressed:
+        if existing is not None:
+            raise ValueError(f"{file_on_s3} already exists on S3")
+        pif(f"Uploading {filename} to {file_on_s3}")
+        client.upload_file(Filename=filename, Bucket=bucket_name, Key=key)
+        return
+
+    sha256, md5 = _file_digests(filename)
+    if existing is not None:
+        if _is_identical(existing, sha256=sha256, md5=md5):
+            pif(f"{file_on_s3} is already published with identical contents")
+            return
+        raise ValueError(f"{file_on_s3} already exists on S3 with different contents")
+
+    pif(f"Uploading {filename} to {file_on_s3}")
     client.upload_file(
         Filename=filename,
         Bucket=bucket_name,
         Key=key,
+        ExtraArgs={"Metadata": {SHA256_METADATA_KEY: sha256}},
     )
 
 
 class PublishCommonKwargs(t.TypedDict):
     bucket_name: str
     verbose: bool
+    content_addressed: bool
 
 
 def perform_publish(
@@ -79,7 +150,15 @@ def perform_publish(
     verbose: bool,
     bucket_name: str,
     with_manifest: bool,
+    content_addressed: bool = False,
+    s3_client: t.Optional["S3Client"] = None,
 ) -> None:
+    """
+    Publish the built function, and its manifest if there is one. The two
+    files are uploaded concurrently.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
     function_name = environment.function_name
     version = environment.version
     sha1 = environment.sha1
@@ -89,27 +168,44 @@ def perform_publish(
     common_kwargs: PublishCommonKwargs = dict(
         bucket_name=bucket_name,
         verbose=verbose,
+        content_addressed=content_addressed,
     )
 
-    publish_file_to_s3(
-        key=s3_key_for_built_lambda(
-            function_name=function_name,
-            version=version,
-            sha1=sha1,
-            with_manifest=with_manifest,
-        ),
-        filename=local_path_for_built_lambda(function_name=function_name),
-        **common_kwargs,
-    )
-
-    if with_manifest:
-        publish_file_to_s3(
-            key=s3_key_for_manifest(
-                function_name=function_name,
-                version=version,
-                sha1=sha1,
-                with_manifest=with_manifest,
-            ),
-            filename=local_path_for_manifest(function_name=function_name),
-            **common_kwargs,
-        )
+    if s3_client is None:
+        # Resolve the shared client before starting threads.
+        s3_client = get_client("s3")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(
+                publish_file_to_s3,
+                key=s3_key_for_built_lambda(
+                    function_name=function_name,
+                    version=version,
+                    sha1=sha1,
+                    with_manifest=with_manifest,
+                ),
+                filename=local_path_for_built_lambda(function_name=function_name),
+                s3_client=s3_client,
+                **common_kwargs,
+            )
+        ]
+
+        if with_manifest:
+            futures.append(
+                executor.submit(
+                    publish_file_to_s3,
+                    key=s3_key_for_manifest(
+                        function_name=function_name,
+                        version=version,
+                        sha1=sha1,
+                        with_manifest=with_manifest,
+                    ),
+                    filename=local_path_for_manifest(function_name=function_name),
+                    s3_client=s3_client,
+                    **common_kwargs,
+                )
+            )
+
+        for future in futures:
+            future.result()
@@ -1,19 +1,160 @@
+import io
 import os
 import sys
 import typing as t
 import uuid
 from contextlib import AbstractContextManager, contextmanager
+from .aws_clients import get_client
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from boto3.s3.transfer import TransferConfig
+    from mypy_boto3_s3.client import S3Client
+
+
+ProgressCallback = t.Callable[[int, int], None]
+
+Data = t.Union[str, bytes, bytearray, memoryview, t.IO[bytes], t.Iterable[bytes]]
+
+
+def large_file_transfer_config(
+    chunk_size_mb: int = 16, max_concurrency: int = 16
+) -> "TransferConfig":
+    """
+    A transfer configuration for large files, such as Lambda code bundles,
+    which uploads larger parts with more concurrency than boto3's default of
+    8 MB parts and 10 threads.
+    """
+    from boto3.s3.transfer import TransferConfig
+
+    chunk_size = chunk_size_mb * 2**20
+    return TransferConfig(
+        multipart_threshold=chunk_size,
+        multipart_chunksize=chunk_size,
+        max_concurrency=max_concurrency,
+    )
+
+
+def _transfer_progress(
+    progress: ProgressCallback, total_bytes: int
+) -> t.Callable[[int], None]:
+    """
+    Adapt a progress callback to boto3's, which is invoked from several
+    threads with the number of bytes transferred since the last invocation.
+    """
+    import threading
+
+    lock = threading.Lock()
+    transferred_bytes = 0
+
+    def callback(bytes_amount: int) -> None:
+        nonlocal transferred_bytes
+        with lock:
+            transferred_bytes += bytes_amount
+            progress(transferred_bytes, total_bytes)
+
+    return callback
+
+
+def _sha256_checksum(
+    chunks: t.Iterable[bytes], part_size: t.Optional[int] = None
+) -> str:
+    """
+    Compute the base64 SHA-256 checksum which S3 reports for an object. For a
+    multipart upload, that's the checksum of the parts' checksums, followed
+    by the number of parts.
+    """
+    import base64
+    import hashlib
+
+    if part_size is None:
+        digest = hashlib.sha256()
+        for chunk in chunks:
+            digest.update(chunk)
+        return base64.b64encode(digest.digest()).decode("ascii")
+
+    part_digests = []
+    part = hashlib.sha256()
+    part_length = 0
+    for chunk in chunks:
+        view = memoryview(chunk)
+        while len(view):
+            taken = view[: part_size - part_length]
+            part.update(taken)
+            part_length += len(taken)
+            view = view[len(taken) :]
+            if part_length == part_size:
+                part_digests.append(part.digest())
+                part = hashlib.sha256()
+                part_length = 0
+    if part_length or not part_digests:
+        part_digests.append(part.digest())
+
+    composite = hashlib.sha256(b"".join(part_digests)).digest()
+    return f"{base64.b64encode(composite).decode('ascii')}-{len(part_digests)}"
+
+
+def _file_chunks(path: str, chunk_size: int = 2**20) -> t.Iterator[bytes]:
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+def _part_size_for(
+    size: int, transfer_config: t.Optional["TransferConfig"]
+) -> t.Optional[int]:
+    """
+    The part size boto3 uses to upload an object of the given size, or `None`
+    when it's uploaded in a single request.
+    """
+    from boto3.s3.transfer import TransferConfig
+    from s3transfer.utils import ChunksizeAdjuster
+
+    config = transfer_config or TransferConfig()
+    if size < config.multipart_threshold:
+        return None
+    return ChunksizeAdjuster().adjust_chunksize(config.multipart_chunksize, size)
+
+
+def _verify_checksum(
+    s3_client: "S3Client", bucket: str, key: str, expected_checksum: str
+) -> None:
+    response = s3_client.head_object(Bucket=bucket, Key=key, ChecksumMode="ENABLED")
+    actual_checksum = response.get("ChecksumSHA256")
+    if actual_checksum != expected_checksum:
+        raise ValueError(
+            f"Checksum mismatch for s3://{bucket}/{key}: "
+            + f"expected {expected_checksum}, got {actual_checksum}"
+        )
 
 
 @contextmanager
 def temp_file_on_s3(
-    local_path: str, bucket: str, key: t.Optional[str] = None, verbose: bool = False
+    local_path: str,
+    bucket: str,
+    key: t.Optional[str] = None,
+    verbose: bool = False,
+    s3_client: t.Optional["S3Client"] = None,
+    transfer_config: t.Optional["TransferConfig"] = None,
+    progress: t.Optional[ProgressCallback] = None,
+    verify_checksum: bool = False,
 ) -> t.Iterator[str]:
     """
     Copy the given path to S3. Delete the object from S3 when the block
     exits.
+
+    By default the shared client from `werkit.aws_clients` is used.
+
+    Args:
+        transfer_config (boto3.s3.transfer.TransferConfig): The multipart
+            threshold, part size, and concurrency. For large files, consider
+            `large_file_transfer_config()`.
+        progress (callable): Invoked during the upload with the number of
+            bytes uploaded so far and the total number of bytes, possibly from
+            several threads.
+        verify_checksum (bool): When `True`, upload with a SHA-256 checksum,
+            which S3 checks as each part arrives, then confirm the checksum of
+            the stored object matches the local file.
     """
-    import boto3
 
     def pif(x: str) -> None:
         if verbose:
@@ -23,13 +164,35 @@ def temp_file_on_s3(
         filename, extension = os.path.splitext(os.path.basename(local_path))
         key = f"{filename}_{uuid.uuid4().hex}{extension}"
 
-    s3_client = boto3.client("s3")
+    if s3_client is None:
+        s3_client = get_client("s3")
+
+    upload_kwargs: dict[str, t.Any] = {}
+    if transfer_config is not None:
+        upload_kwargs["Config"] = transfer_config
+    if progress is not None:
+        upload_kwargs["Callback"] = _transfer_progress(
+            progress, os.path.getsize(local_path)
+        )
+    if verify_checksum:
+        upload_kwargs["ExtraArgs"] = {"ChecksumAlgorithm": "SHA256"}
 
     file_on_s3 = f"s3://{bucket}/{key}"
     pif(f"Uploading {local_path} to {file_on_s3}")
-    s3_client.upload_file(Filename=local_path, Bucket=bucket, Key=key)
+    s3_client.upload_file(Filename=local_path, Bucket=bucket, Key=key, **upload_kwargs)
 
     try:
+        if verify_checksum:
+            pif(f"Verifying checksum of {file_on_s3}")
+            _verify_checksum(
+                s3_client,
+                bucket,
+                key,
+                _sha256_checksum(
+                    _file_chunks(local_path),
+                    _part_size_for(os.path.getsize(local_path), transfer_config),
+                ),
+            )
         yield key
     finally:
         pif(f"Removing {file_on_s3}")
@@ -44,6 +207,7 @@ def temp_file_on_s3_from_string(  # noqa: E704
     key: t.Optional[str] = None,
     extension: t.Optional[str] = None,
     verbose: bool = False,
+    s3_client: t.Optional["S3Client"] = None,
 ) -> AbstractContextManager[tuple[str, str]]: ...
 
 
@@ -55,6 +219,7 @@ def temp_file_on_s3_from_string(  # noqa: E704
     key: t.Optional[str] = None,
     extension: t.Optional[str] = None,
     verbose: bool = False,
+    s3_client: t.Optional["S3Client"] = None,
 ) -> AbstractContextManager[str]: ...
 
 
@@ -67,6 +232,7 @@ def temp_file_on_s3_from_string(  # noqa: E704
     key: t.Optional[str] = None,
     extension: t.Optional[str] = None,
     verbose: bool = False,
+    s3_client: t.Optional["S3Client"] = None,
 ) -> AbstractContextManager[str]: ...
 
 
@@ -80,12 +246,14 @@ def temp_file_on_s3_from_string(  # type: ignore[misc]
     key: t.Optional[str] = None,
     extension: t.Optional[str] = None,
     verbose: bool = False,
+    s3_client: t.Optional["S3Client"] = None,
 ) -> t.Union[AbstractContextManager[str], AbstractContextManager[tuple[str, str]]]:
     """
     Write the given contents to S3. Delete the object from S3 when the block
     exits.
+
+    By default the shared client from `werkit.aws_clients` is used.
     """
-    import boto3
 
     def pif(x: str) -> None:
         if verbose:
@@ -94,7 +262,8 @@ def temp_file_on_s3_from_string(  # type: ignore[misc]
     if key is None:
         key = f"{uuid.uuid4().hex}{extension}"
 
-    s3_client = boto3.client("s3")
+    if s3_client is None:
+        s3_client = get_client("s3")
 
     file_on_s3 = f"s3://{bucket}/{key}"
     pif(f"Writing to {file_on_s3}")
@@ -108,3 +277,95 @@ def temp_file_on_s3_from_string(  # type: ignore[misc]
     finally:
         pif(f"Removing {file_on_s3}")
         s3_client.delete_object(Bucket=bucket, Key=key)
+
+
+class _ChunkReader(io.RawIOBase):
+    """
+    A readable stream over an iterable of buffers, which copies each buffer
+    only as it's read.
+    """
+
+    def __init__(self, chunks: t.Iterable[t.Union[bytes, bytearray, memoryview]]):
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: t.Any) -> int:
+        while not len(self._pending):
+            try:
+                self._pending = memoryview(next(self._chunks)).cast("B")
+            except StopIteration:
+                return 0
+        target = memoryview(buffer).cast("B")
+        count = min(len(target), len(self._pending))
+        target[:count] = self._pending[:count]
+        self._pending = self._pending[count:]
+        return count
+
+
+def _readable(data: Data) -> t.IO[bytes]:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        raw = _ChunkReader([data])
+    elif hasattr(data, "read"):
+        return t.cast(t.IO[bytes], data)
+    else:
+        raw = _ChunkReader(t.cast(t.Iterable[bytes], data))
+    # Unlike the raw stream, a buffered reader fills each read, which the
+    # multipart upload relies on to produce full-sized parts.
+    return t.cast(t.IO[bytes], io.BufferedReader(raw))
+
+
+@contextmanager
+def temp_file_on_s3_from_data(
+    data: Data,
+    bucket: str,
+    key: t.Optional[str] = None,
+    extension: t.Optional[str] = None,
+    verbose: bool = False,
+    s3_client: t.Optional["S3Client"] = None,
+    transfer_config: t.Optional["TransferConfig"] = None,
+) -> t.Iterator[str]:
+    """
+    Stream the given data to S3, using a multipart upload when it's large.
+    Delete the object from S3 when the block exits.
+
+    Unlike `temp_file_on_s3_from_string()`, the data is not copied in full
+    before uploading, so large inputs can be staged without doubling peak
+    memory. (A `str` is still encoded up front.)
+
+    By default the shared client from `werkit.aws_clients` is used.
+
+    Args:
+        data: A `str`, a bytes-like object, a binary file object, or an
+            iterable of bytes-like chunks, such as a generator.
+        transfer_config (boto3.s3.transfer.TransferConfig): The multipart
+            threshold, part size, and concurrency.
+    """
+
+    def pif(x: str) -> None:
+        if verbose:
+            print(x, file=sys.stderr)
+
+    if key is None:
+        key = f"{uuid.uuid4().hex}{extension or ''}"
+
+    if s3_client is None:
+        s3_client = get_client("s3")
+
+    upload_kwargs: dict[str, t.Any] = {}
+    if transfer_config is not None:
+        upload_kwargs["Config"] = transfer_config
+
+    file_on_s3 = f"s3://{bucket}/{key}"
+    pif(f"Writing to {file_on_s3}")
+    s3_client.upload_fileobj(_readable(data), bucket, key, **upload_kwargs)
+
+    try:
+        yield key
+    finally:
+        pif(f"Removing {file_on_s3}")
+        s3_client.delete_object(Bucket=bucket, Key=key)
@@ -37,13 +37,22 @@ def cli() -> None:
     default=False,
     is_flag=True,
 )
-def infer_and_publish(verbose: bool, bucket_name: str, with_manifest: bool) -> None:
+@click.option(
+    "--content-addressed",
+    help="Skip files which are already published with identical contents",
+    default=False,
+    is_flag=True,
+)
+def infer_and_publish(
+    verbose: bool, bucket_name: str, with_manifest: bool, content_addressed: bool
+) -> None:
     environment = infer_function_environment_from_ci_environment()
     perform_publish(
         environment=environment,
         verbose=verbose,
         bucket_name=bucket_name,
         with_manifest=with_manifest,
+        content_addressed=content_addressed,
     )
 
 
@@ -57,8 +66,18 @@ def infer_and_publish(verbose: bool, bucket_name: str, with_manifest: bool) -> N
     default=False,
     is_flag=True,
 )
+@click.option(
+    "--content-addressed",
+    help="Skip files which are already published with identical contents",
+    default=False,
+    is_flag=True,
+)
 def publish_using_sha1(
-    verbose: bool, function_name: str, bucket_name: str, with_manifest: bool
+    verbose: bool,
+    function_name: str,
+    bucket_name: str,
+    with_manifest: bool,
+    content_addressed: bool,
 ) -> None:
     environment = infer_commit_from_ci_environment(function_name)
     perform_publish(
@@ -66,6 +85,7 @@ def publish_using_sha1(
         verbose=verbose,
         bucket_name=bucket_name,
         with_manifest=with_manifest,
+        content_addressed=content_addressed,
     )
 
 
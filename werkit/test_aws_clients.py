@@ -0,0 +1,71 @@
+import threading
+import typing as t
+from botocore.config import Config
+import pytest
+from werkit.aws_clients import clear_client_cache, get_client, override_client
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> t.Iterator[None]:
+    clear_client_cache()
+    yield
+    clear_client_cache()
+
+
+def test_get_client_caches_by_service_and_region() -> None:
+    client = get_client("s3", region_name="us-east-1")
+
+    assert get_client("s3", region_name="us-east-1") is client
+    assert get_client("s3", region_name="us-west-2") is not client
+    assert get_client("lambda", region_name="us-east-1") is not client
+    assert client.meta.region_name == "us-east-1"
+
+
+def test_get_client_caches_by_config() -> None:
+    client = get_client("lambda", region_name="us-east-1")
+    pooled = get_client(
+        "lambda", region_name="us-east-1", config=Config(max_pool_connections=20)
+    )
+
+    assert pooled is not client
+    assert getattr(pooled.meta.config, "max_pool_connections") == 20
+    assert (
+        get_client(
+            "lambda", region_name="us-east-1", config=Config(max_pool_connections=20)
+        )
+        is pooled
+    )
+
+
+def test_clear_client_cache() -> None:
+    client = get_client("s3", region_name="us-east-1")
+    clear_client_cache()
+    assert get_client("s3", region_name="us-east-1") is not client
+
+
+def test_override_client() -> None:
+    stub = object()
+    with override_client("s3", stub):
+        assert get_client("s3") is stub
+        assert get_client("s3", region_name="eu-west-1") is stub
+        inner = object()
+        with override_client("s3", inner):
+            assert get_client("s3") is inner
+        assert get_client("s3") is stub
+    assert get_client("s3", region_name="us-east-1") is not stub
+
+
+def test_get_client_is_thread_safe() -> None:
+    clients: list[t.Any] = []
+
+    def get() -> None:
+        clients.append(get_client("s3", region_name="us-east-1"))
+
+    threads = [threading.Thread(target=get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(clients) == 8
+    assert all(client is clients[0] for client in clients)
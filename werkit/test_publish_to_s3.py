@@ -0,0 +1,154 @@
+import hashlib
+import threading
+import typing as t
+from pathlib import Path
+from botocore.exceptions import ClientError
+import pytest
+from werkit.common.cli_common import InferredFunctionEnvironment
+from werkit.publish_to_s3 import perform_publish, publish_file_to_s3
+
+
+class FakeS3Client:
+    class exceptions:
+        ClientError = ClientError
+
+    def __init__(self) -> None:
+        self.objects: dict[str, dict[str, t.Any]] = {}
+        self.upload_threads: set[int] = set()
+
+    def head_object(self, Bucket: str, Key: str) -> dict[str, t.Any]:
+        try:
+            return self.objects[Key]
+        except KeyError:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+
+    def upload_file(
+        self,
+        Filename: str,
+        Bucket: str,
+        Key: str,
+        ExtraArgs: t.Optional[dict[str, t.Any]] = None,
+    ) -> None:
+        self.upload_threads.add(threading.get_ident())
+        with open(Filename, "rb") as f:
+            contents = f.read()
+        self.objects[Key] = {
+            "ETag": f'"{hashlib.md5(contents).hexdigest()}"',
+            "Metadata": (ExtraArgs or {}).get("Metadata", {}),
+        }
+
+
+@pytest.fixture
+def example_file(tmp_path: Path) -> str:
+    path = tmp_path / "example.zip"
+    path.write_bytes(b"example contents")
+    return str(path)
+
+
+def publish(
+    client: FakeS3Client,
+    filename: str,
+    content_addressed: bool = False,
+    verbose: bool = False,
+) -> None:
+    publish_file_to_s3(
+        key="example.zip",
+        filename=filename,
+        bucket_name="my-bucket",
+        verbose=verbose,
+        s3_client=t.cast(t.Any, client),
+        content_addressed=content_addressed,
+    )
+
+
+def test_publish_file_to_s3_refuses_to_replace(example_file: str) -> None:
+    client = FakeS3Client()
+    publish(client, example_file)
+
+    with pytest.raises(ValueError, match=r"^s3://my-bucket/example.zip already exists"):
+        publish(client, example_file)
+
+
+def test_publish_file_to_s3_prints_progress_to_stderr(
+    example_file: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    client = FakeS3Client()
+    publish(client, example_file, content_addressed=True, verbose=True)
+    publish(client, example_file, content_addressed=True, verbose=True)
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err.splitlines() == [
+        f"Uploading {example_file} to s3://my-bucket/example.zip",
+        "s3://my-bucket/example.zip is already published with identical contents",
+    ]
+
+
+def test_publish_file_to_s3_raises_other_errors(example_file: str) -> None:
+    class ForbiddenS3Client(FakeS3Client):
+        def head_object(self, Bucket: str, Key: str) -> dict[str, t.Any]:
+            raise ClientError({"Error": {"Code": "403"}}, "HeadObject")
+
+    with pytest.raises(ClientError):
+        publish(ForbiddenS3Client(), example_file)
+
+
+def test_publish_file_to_s3_content_addressed(example_file: str) -> None:
+    client = FakeS3Client()
+    publish(client, example_file, content_addressed=True)
+
+    assert client.objects["example.zip"]["Metadata"] == {
+        "sha256": hashlib.sha256(b"example contents").hexdigest()
+    }
+
+    # Publishing identical contents again is a no-op.
+    client.objects["example.zip"]["ETag"] = '"unused"'
+    publish(client, example_file, content_addressed=True)
+
+    Path(example_file).write_bytes(b"different contents")
+    with pytest.raises(ValueError, match="with different contents"):
+        publish(client, example_file, content_addressed=True)
+
+
+def test_publish_file_to_s3_content_addressed_falls_back_to_etag(
+    example_file: str,
+) -> None:
+    client = FakeS3Client()
+    # Published without content addressing, so there's no digest in the
+    # metadata.
+    publish(client, example_file)
+
+    publish(client, example_file, content_addressed=True)
+
+    # A multipart ETag can't be compared.
+    client.objects["example.zip"]["ETag"] = '"abc123-2"'
+    with pytest.raises(ValueError, match="with different contents"):
+        publish(client, example_file, content_addressed=True)
+
+
+def test_perform_publish_with_manifest(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "lambdas").mkdir()
+    (tmp_path / "lambdas" / "my-function.zip").write_bytes(b"zip")
+    (tmp_path / "lambdas" / "my-function.manifest.json").write_bytes(b"{}")
+
+    client = FakeS3Client()
+    for _ in range(2):
+        perform_publish(
+            environment=InferredFunctionEnvironment(
+                function_name="my-function", version="1.0.0", sha1=None
+            ),
+            verbose=False,
+            bucket_name="my-bucket",
+            with_manifest=True,
+            content_addressed=True,
+            s3_client=t.cast(t.Any, client),
+        )
+
+    assert set(client.objects) == {
+        "my-function/tags/1.0.0.zip",
+        "my-function/tags/1.0.0.manifest.json",
+    }
+    assert threading.get_ident() not in client.upload_threads
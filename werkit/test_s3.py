@@ -1,10 +1,16 @@
+import io
 import os
+import typing as t
 import uuid
 from pathlib import Path
 import boto3
 from botocore.exceptions import ClientError
 import pytest
-from werkit.s3 import temp_file_on_s3, temp_file_on_s3_from_string
+from werkit.s3 import (
+    temp_file_on_s3,
+    temp_file_on_s3_from_data,
+    temp_file_on_s3_from_string,
+)
 
 
 @pytest.fixture
@@ -78,3 +84,249 @@ def test_temp_file_on_s3_from_string_with_implicit_key(test_bucket: str) -> None
         contents=EXAMPLE_CONTENTS, bucket=test_bucket, extension=".txt", verbose=True
     ) as key:
         assert key.endswith(".txt")
+
+
+class FakeS3Client:
+    def __init__(self, corrupt: bool = False) -> None:
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.upload_kwargs: list[dict[str, t.Any]] = []
+        self.part_sizes: list[int] = []
+        self.corrupt = corrupt
+
+    def upload_file(
+        self,
+        Filename: str,
+        Bucket: str,
+        Key: str,
+        Callback: t.Optional[t.Callable[[int], None]] = None,
+        **kwargs: t.Any,
+    ) -> None:
+        with open(Filename, "rb") as f:
+            contents = f.read()
+        self.upload_kwargs.append(kwargs)
+        if Callback:
+            # Report progress in two pieces, like a multipart upload would.
+            Callback(len(contents) // 2)
+            Callback(len(contents) - len(contents) // 2)
+        self.objects[(Bucket, Key)] = contents + (b"!" if self.corrupt else b"")
+
+    def upload_fileobj(
+        self, Fileobj: t.IO[bytes], Bucket: str, Key: str, **kwargs: t.Any
+    ) -> None:
+        self.upload_kwargs.append(kwargs)
+        # Read in parts, like a multipart upload would.
+        parts = []
+        while part := Fileobj.read(1000):
+            parts.append(part)
+        self.part_sizes = [len(part) for part in parts]
+        self.objects[(Bucket, Key)] = b"".join(parts)
+
+    def head_object(self, Bucket: str, Key: str, ChecksumMode: str) -> dict[str, t.Any]:
+        from werkit.s3 import _sha256_checksum
+
+        return {"ChecksumSHA256": _sha256_checksum([self.objects[(Bucket, Key)]])}
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes) -> dict[str, t.Any]:
+        self.objects[(Bucket, Key)] = Body
+        return {"ETag": '"etag"'}
+
+    def delete_object(self, Bucket: str, Key: str) -> None:
+        del self.objects[(Bucket, Key)]
+
+
+def test_temp_file_on_s3_with_client(example_file: str) -> None:
+    client = FakeS3Client()
+
+    with temp_file_on_s3(
+        local_path=example_file,
+        bucket="my-bucket",
+        key="example.txt",
+        s3_client=t.cast(t.Any, client),
+    ):
+        assert client.objects == {
+            ("my-bucket", "example.txt"): EXAMPLE_CONTENTS.encode("utf-8")
+        }
+
+    assert client.objects == {}
+
+
+def test_temp_file_on_s3_from_string_uses_shared_client() -> None:
+    from werkit.aws_clients import override_client
+
+    client = FakeS3Client()
+
+    with override_client("s3", client):
+        with temp_file_on_s3_from_string(
+            contents=EXAMPLE_CONTENTS, bucket="my-bucket", ret_etag=True
+        ) as (key, etag):
+            assert client.objects == {
+                ("my-bucket", key): EXAMPLE_CONTENTS.encode("utf-8")
+            }
+            assert etag == '"etag"'
+
+    assert client.objects == {}
+
+
+def test_temp_file_on_s3_with_transfer_config_and_progress(example_file: str) -> None:
+    from werkit.s3 import large_file_transfer_config
+
+    client = FakeS3Client()
+    transfer_config = large_file_transfer_config(chunk_size_mb=32, max_concurrency=4)
+    progress: list[tuple[int, int]] = []
+
+    with temp_file_on_s3(
+        local_path=example_file,
+        bucket="my-bucket",
+        s3_client=t.cast(t.Any, client),
+        transfer_config=transfer_config,
+        progress=lambda uploaded, total: progress.append((uploaded, total)),
+    ):
+        pass
+
+    total = len(EXAMPLE_CONTENTS)
+    assert progress == [(total // 2, total), (total, total)]
+    assert client.upload_kwargs == [{"Config": transfer_config}]
+    assert transfer_config.multipart_chunksize == 32 * 2**20
+    assert transfer_config.max_request_concurrency == 4
+
+
+def test_temp_file_on_s3_verifies_checksum(example_file: str) -> None:
+    client = FakeS3Client()
+
+    with temp_file_on_s3(
+        local_path=example_file,
+        bucket="my-bucket",
+        s3_client=t.cast(t.Any, client),
+        verify_checksum=True,
+    ):
+        assert len(client.objects) == 1
+
+    assert client.upload_kwargs == [{"ExtraArgs": {"ChecksumAlgorithm": "SHA256"}}]
+
+
+def test_temp_file_on_s3_checksum_mismatch(example_file: str) -> None:
+    client = FakeS3Client(corrupt=True)
+
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        with temp_file_on_s3(
+            local_path=example_file,
+            bucket="my-bucket",
+            s3_client=t.cast(t.Any, client),
+            verify_checksum=True,
+        ):
+            pass
+
+    assert client.objects == {}
+
+
+def test_sha256_checksum_of_parts() -> None:
+    import base64
+    import hashlib
+
+    from werkit.s3 import _sha256_checksum
+
+    data = bytes(range(256)) * 10
+    chunks = [data[i : i + 700] for i in range(0, len(data), 700)]
+
+    assert _sha256_checksum(chunks) == base64.b64encode(
+        hashlib.sha256(data).digest()
+    ).decode("ascii")
+
+    parts = [data[i : i + 1000] for i in range(0, len(data), 1000)]
+    composite = hashlib.sha256(
+        b"".join(hashlib.sha256(part).digest() for part in parts)
+    ).digest()
+    assert (
+        _sha256_checksum(chunks, part_size=1000)
+        == f"{base64.b64encode(composite).decode('ascii')}-3"
+    )
+
+
+def test_part_size_for() -> None:
+    from werkit.s3 import _part_size_for, large_file_transfer_config
+
+    assert _part_size_for(2**20, None) is None
+    assert _part_size_for(200 * 2**20, None) == 8 * 2**20
+    assert _part_size_for(200 * 2**20, large_file_transfer_config()) == 16 * 2**20
+
+
+@pytest.mark.slow
+def test_temp_file_on_s3_verifies_multipart_checksum(
+    tmp_path: Path, test_bucket: str
+) -> None:
+    from werkit.s3 import large_file_transfer_config
+
+    path = tmp_path / "large.bin"
+    path.write_bytes(os.urandom(12 * 2**20))
+
+    with temp_file_on_s3(
+        local_path=str(path),
+        bucket=test_bucket,
+        transfer_config=large_file_transfer_config(chunk_size_mb=5),
+        verify_checksum=True,
+    ) as key:
+        assert key.startswith("large_")
+
+
+@pytest.mark.parametrize(
+    "make_data",
+    [
+        lambda data: data,
+        lambda data: bytearray(data),
+        lambda data: memoryview(data),
+        lambda data: io.BytesIO(data),
+        lambda data: (data[i : i + 300] for i in range(0, len(data), 300)),
+        lambda data: data.decode("latin-1"),
+    ],
+    ids=["bytes", "bytearray", "memoryview", "file", "iterator", "str"],
+)
+def test_temp_file_on_s3_from_data(make_data: t.Callable[[bytes], t.Any]) -> None:
+    client = FakeS3Client()
+    data = bytes(range(128)) * 20
+
+    with temp_file_on_s3_from_data(
+        make_data(data),
+        bucket="my-bucket",
+        extension=".bin",
+        s3_client=t.cast(t.Any, client),
+    ) as key:
+        assert key.endswith(".bin")
+        assert client.objects == {("my-bucket", key): data}
+        # Each read is filled, so the parts are full-sized.
+        assert client.part_sizes == [1000, 1000, 560]
+
+    assert client.objects == {}
+
+
+def test_temp_file_on_s3_from_data_with_transfer_config() -> None:
+    from werkit.s3 import large_file_transfer_config
+
+    client = FakeS3Client()
+    transfer_config = large_file_transfer_config()
+
+    with temp_file_on_s3_from_data(
+        [b"foo", b"", b"bar"],
+        bucket="my-bucket",
+        key="example.bin",
+        s3_client=t.cast(t.Any, client),
+        transfer_config=transfer_config,
+    ):
+        assert client.objects == {("my-bucket", "example.bin"): b"foobar"}
+
+    assert client.upload_kwargs == [{"Config": transfer_config}]
+
+
+@pytest.mark.slow
+def test_temp_file_on_s3_from_data_multipart(test_bucket: str) -> None:
+    from werkit.s3 import large_file_transfer_config
+
+    chunks = [os.urandom(2**20) for _ in range(12)]
+
+    with temp_file_on_s3_from_data(
+        iter(chunks),
+        bucket=test_bucket,
+        transfer_config=large_file_transfer_config(chunk_size_mb=5),
+    ) as key:
+        s3_client = boto3.client("s3")
+        response = s3_client.get_object(Bucket=test_bucket, Key=key)
+        assert response["Body"].read() == b"".join(chunks)